@@ -228,7 +228,7 @@ resource "aws_lb_listener_rule" "orders_service" {
 
   condition {
     path_pattern {
-      values = ["/api/v1/orders*"]
+      values = ["/api/v1/orders*", "/api/v1/clients*"]
     }
   }
 
@@ -0,0 +1,31 @@
+"""create stock reservations table
+
+Revision ID: 4e1b7c2d9a35
+Revises: c13a0dcab581
+Create Date: 2026-10-19 19:58:43.125907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e1b7c2d9a35'
+down_revision: Union[str, None] = 'c13a0dcab581'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('stock_reservations',
+    sa.Column('order_id', sa.String(), nullable=False),
+    sa.Column('items', sa.JSON(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('order_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('stock_reservations')
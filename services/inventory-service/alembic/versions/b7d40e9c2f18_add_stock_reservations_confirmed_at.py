@@ -0,0 +1,28 @@
+"""add stock reservations confirmed_at
+
+Revision ID: b7d40e9c2f18
+Revises: 4e1b7c2d9a35
+Create Date: 2026-10-19 20:52:06.418337
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d40e9c2f18'
+down_revision: Union[str, None] = '4e1b7c2d9a35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'stock_reservations', sa.Column('confirmed_at', sa.DateTime(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('stock_reservations', 'confirmed_at')
@@ -6,7 +6,9 @@ from prometheus_fastapi_instrumentator import Instrumentator
 from src.infrastructure.api.controllers.inventory_controller import router as inventory_router
 from src.infrastructure.api.controllers.health_controller import router as health_router
 from src.infrastructure.config.settings import settings
+from src.infrastructure.api.conditional import ETAG_HEADER
 from src.infrastructure.api.exception_handlers import EXCEPTION_HANDLERS
+from src.infrastructure.api.dependencies import get_order_events_consumer
 
 # Configure logging
 logging.basicConfig(
@@ -46,7 +48,8 @@ This service implements hexagonal architecture (ports and adapters) with:
 
 1. **Stock Check**: Query available stock for products
 2. **Stock Reservation**: Reserve items for pending orders
-3. **Stock Confirmation**: Confirm reservations when orders are completed
+3. **Stock Confirmation**: Confirm reservations when orders are completed, from the
+   `OrderCreated` events the orders service publishes to SQS
 4. **Stock Release**: Release reservations when orders are cancelled
 
 ### Inventory Operations
@@ -95,6 +98,7 @@ app.add_middleware(
     allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[ETAG_HEADER],
 )
 
 # Register exception handlers
@@ -112,16 +116,25 @@ app.include_router(health_router)
 app.include_router(inventory_router)
 
 
+def order_events_consumer_enabled() -> bool:
+    queue_url = settings.SQS_ORDER_EVENTS_QUEUE_URL
+    return bool(queue_url) and not queue_url.startswith("mock://")
+
+
 @app.on_event("startup")
 async def startup():
     logger.info(f"Starting {settings.APP_NAME} on port {settings.PORT}")
     logger.info(f"Environment: {settings.ENVIRONMENT}")
     logger.info("Prometheus metrics enabled at /api/v1/inventory/metrics")
+    if order_events_consumer_enabled():
+        get_order_events_consumer().start()
 
 
 @app.on_event("shutdown")
 async def shutdown():
     logger.info(f"Shutting down {settings.APP_NAME}")
+    if order_events_consumer_enabled():
+        await get_order_events_consumer().stop()
 
 
 if __name__ == "__main__":
@@ -1,4 +1,11 @@
 from .check_stock import CheckStockUseCase
+from .confirm_reservations import ConfirmReservationsUseCase
+from .release_stock import ReleaseStockUseCase
 from .reserve_stock import ReserveStockUseCase
 
-__all__ = ["CheckStockUseCase", "ReserveStockUseCase"]
\ No newline at end of file
+__all__ = [
+    "CheckStockUseCase",
+    "ConfirmReservationsUseCase",
+    "ReleaseStockUseCase",
+    "ReserveStockUseCase",
+]
@@ -1,7 +1,11 @@
 import logging
-from typing import Dict, List
+from datetime import datetime
+from typing import Dict, List, Tuple
+from src.domain.models.inventory import InventoryItem
 from src.domain.repositories.inventory_repository import InventoryRepository
-from src.domain.exceptions import ValidationException, DatabaseException
+from src.domain.exceptions import (
+    ProductNotFoundException, ValidationException, DatabaseException
+)
 
 logger = logging.getLogger(__name__)
 
@@ -16,16 +20,17 @@ class CheckStockUseCase:
         Check available stock for multiple products
         Returns dict with product_id -> available_quantity
         """
-        # Validate input
-        if not product_ids:
-            raise ValidationException("Product IDs list cannot be empty")
-
-        if len(product_ids) > 100:  # Reasonable limit
-            raise ValidationException("Too many product IDs requested. Maximum 100 allowed")
+        stock, _ = await self.snapshot(product_ids)
+        return stock
 
-        for product_id in product_ids:
-            if not product_id or not product_id.strip():
-                raise ValidationException("Product ID cannot be empty or whitespace")
+    async def snapshot(
+        self, product_ids: List[str]
+    ) -> Tuple[Dict[str, int], Dict[str, datetime]]:
+        """
+        Available stock of each product, as execute() returns it, and the
+        last update time of each product found, from a single read
+        """
+        self._validate_product_ids(product_ids)
 
         logger.info(f"Checking stock for {len(product_ids)} products")
 
@@ -41,8 +46,49 @@ class CheckStockUseCase:
                     logger.warning(f"Product {product_id} not found in inventory")
 
             logger.info(f"Successfully checked stock for {len(product_ids)} products")
-            return result
+            return result, {
+                product_id: item.updated_at for product_id, item in items.items()
+            }
 
         except Exception as e:
             logger.error(f"Error checking stock: {str(e)}")
-            raise DatabaseException(f"Failed to check stock: {str(e)}")
\ No newline at end of file
+            raise DatabaseException(f"Failed to check stock: {str(e)}")
+
+    async def versions(self, product_ids: List[str]) -> Dict[str, datetime]:
+        """
+        Last update time of each product found, to tell whether stock levels
+        changed without reading them
+        """
+        self._validate_product_ids(product_ids)
+
+        try:
+            return await self.inventory_repository.find_versions(product_ids)
+        except Exception as e:
+            logger.error(f"Error reading stock versions: {str(e)}")
+            raise DatabaseException(f"Failed to check stock: {str(e)}")
+
+    async def item(self, product_id: str) -> InventoryItem:
+        """Stock of a single product"""
+        try:
+            item = await self.inventory_repository.find_by_product_id(product_id)
+        except Exception as e:
+            logger.error(f"Error reading stock of {product_id}: {str(e)}")
+            raise DatabaseException(f"Failed to check stock: {str(e)}")
+
+        if item is None:
+            raise ProductNotFoundException(
+                f"Product '{product_id}' not found in inventory"
+            )
+        return item
+
+    @staticmethod
+    def _validate_product_ids(product_ids: List[str]) -> None:
+        if not product_ids:
+            raise ValidationException("Product IDs list cannot be empty")
+
+        if len(product_ids) > 100:  # Reasonable limit
+            raise ValidationException("Too many product IDs requested. Maximum 100 allowed")
+
+        for product_id in product_ids:
+            if not product_id or not product_id.strip():
+                raise ValidationException("Product ID cannot be empty or whitespace")
@@ -0,0 +1,76 @@
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List
+from src.domain.repositories.inventory_repository import InventoryRepository
+from src.domain.exceptions import DatabaseException
+
+logger = logging.getLogger(__name__)
+
+
+class ConfirmReservationsUseCase:
+
+    def __init__(self, inventory_repository: InventoryRepository):
+        self.inventory_repository = inventory_repository
+
+    async def execute(self, order_ids: List[str]) -> List[str]:
+        """
+        Confirm the reservations of created orders in one transaction: the
+        reserved units leave the stock. Quantities are summed per product
+        first, as when releasing.
+        Returns: The orders whose reservation was confirmed; orders without
+                 a recorded reservation, or already confirmed, are skipped,
+                 so the same order can be confirmed more than once
+        """
+        if not order_ids:
+            return []
+
+        try:
+            # Locked, so a concurrent confirmation of the same orders waits
+            # and then finds them confirmed
+            reservations = await self.inventory_repository.lock_reservations(order_ids)
+            pending = [
+                reservation
+                for reservation in reservations.values()
+                if not reservation.is_confirmed
+            ]
+            if not pending:
+                return []
+
+            quantities: Dict[str, int] = defaultdict(int)
+            for reservation in pending:
+                for product_id, quantity in reservation.items.items():
+                    quantities[product_id] += quantity
+
+            inventory_items = await self.inventory_repository.lock_by_product_ids(
+                list(quantities)
+            )
+            for product_id, quantity in quantities.items():
+                inventory_item = inventory_items.get(product_id)
+                if inventory_item is None:
+                    logger.warning(
+                        f"Product {product_id} no longer in inventory, "
+                        "nothing to confirm"
+                    )
+                    continue
+                if not inventory_item.confirm_reservation(quantity):
+                    # Reserved stock was adjusted since; confirm what is left
+                    logger.warning(
+                        f"Confirming {inventory_item.reserved_quantity} instead of "
+                        f"{quantity} reserved units of product {product_id}"
+                    )
+                    inventory_item.confirm_reservation(inventory_item.reserved_quantity)
+
+            confirmed = [reservation.order_id for reservation in pending]
+            await self.inventory_repository.confirm_reservations(
+                list(inventory_items.values()), confirmed, datetime.utcnow()
+            )
+            logger.info(
+                f"Confirmed stock of {len(confirmed)} orders across "
+                f"{len(quantities)} products"
+            )
+            return confirmed
+
+        except Exception as e:
+            logger.error(f"Failed to confirm stock reservations: {str(e)}")
+            raise DatabaseException(f"Failed to confirm stock reservations: {str(e)}")
@@ -0,0 +1,75 @@
+import logging
+from collections import defaultdict
+from typing import Dict, List
+from src.application.use_cases.reserve_stock import validate_order_ids
+from src.domain.repositories.inventory_repository import InventoryRepository
+from src.domain.exceptions import DatabaseException
+
+logger = logging.getLogger(__name__)
+
+
+class ReleaseStockUseCase:
+
+    def __init__(self, inventory_repository: InventoryRepository):
+        self.inventory_repository = inventory_repository
+
+    async def execute(self, order_ids: List[str]) -> List[str]:
+        """
+        Release the stock held by orders, e.g. rejected or cancelled ones,
+        in one transaction. Quantities are summed per product first, so
+        the cost does not grow with the number of order lines. Units of
+        confirmed reservations had left the stock and are put back.
+        Returns: The orders whose stock was released; orders without a
+                 recorded reservation, or already released, are skipped
+        """
+        validate_order_ids(order_ids)
+
+        logger.info(f"Releasing stock for {len(order_ids)} orders")
+
+        try:
+            reservations = await self.inventory_repository.lock_reservations(order_ids)
+            if not reservations:
+                return []
+
+            reserved: Dict[str, int] = defaultdict(int)
+            confirmed: Dict[str, int] = defaultdict(int)
+            for reservation in reservations.values():
+                quantities = confirmed if reservation.is_confirmed else reserved
+                for product_id, quantity in reservation.items.items():
+                    quantities[product_id] += quantity
+
+            product_ids = set(reserved) | set(confirmed)
+            inventory_items = await self.inventory_repository.lock_by_product_ids(
+                list(product_ids)
+            )
+            for product_id in product_ids:
+                inventory_item = inventory_items.get(product_id)
+                if inventory_item is None:
+                    logger.warning(
+                        f"Product {product_id} no longer in inventory, "
+                        "nothing to release"
+                    )
+                    continue
+                if confirmed.get(product_id):
+                    inventory_item.restock(confirmed[product_id])
+                quantity = reserved.get(product_id, 0)
+                if not inventory_item.release_reservation(quantity):
+                    # Reserved stock was adjusted since; release what is left
+                    logger.warning(
+                        f"Releasing {inventory_item.reserved_quantity} instead of "
+                        f"{quantity} reserved units of product {product_id}"
+                    )
+                    inventory_item.release_reservation(inventory_item.reserved_quantity)
+
+            await self.inventory_repository.delete_reservations(
+                list(inventory_items.values()), list(reservations)
+            )
+            logger.info(
+                f"Released stock of {len(reservations)} orders across "
+                f"{len(product_ids)} products"
+            )
+            return list(reservations)
+
+        except Exception as e:
+            logger.error(f"Failed to release stock: {str(e)}")
+            raise DatabaseException(f"Failed to release stock: {str(e)}")
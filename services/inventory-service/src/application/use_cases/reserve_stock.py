@@ -1,10 +1,13 @@
 import logging
-from typing import Dict
+from collections import defaultdict
+from typing import Dict, List, Optional
+from src.domain.models.inventory import StockReservation
 from src.domain.repositories.inventory_repository import InventoryRepository
 from src.domain.exceptions import (
     ProductNotFoundException,
     InsufficientStockException,
     StockReservationException,
+    ReservationExistsException,
     InvalidQuantityException,
     ValidationException,
     DatabaseException
@@ -12,16 +15,37 @@ from src.domain.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Limit of the order IDs in a single reservation lookup or release
+MAX_ORDER_IDS = 100
+
+
+def validate_order_ids(order_ids: List[str]) -> None:
+    if not order_ids:
+        raise ValidationException("Order IDs list cannot be empty")
+
+    if len(order_ids) > MAX_ORDER_IDS:
+        raise ValidationException(
+            f"Too many order IDs. Maximum {MAX_ORDER_IDS} allowed"
+        )
+
+    if any(not order_id or not order_id.strip() for order_id in order_ids):
+        raise ValidationException("Order ID cannot be empty or whitespace")
+
 
 class ReserveStockUseCase:
 
     def __init__(self, inventory_repository: InventoryRepository):
         self.inventory_repository = inventory_repository
 
-    async def execute(self, items: Dict[str, int]) -> bool:
+    async def execute(
+        self, items: Dict[str, int], orders: Optional[Dict[str, Dict[str, int]]] = None
+    ) -> bool:
         """
         Reserve stock for multiple items
-        Args: Dict with product_id -> quantity to reserve
+        Args: Dict with product_id -> quantity to reserve, and optionally the
+              same items broken down by order_id. The reservation of each
+              order is then recorded, and orders that already hold stock
+              are not reserved twice, so a retried request is harmless.
         Returns: True if all reservations successful
         Raises: Various exceptions for different error conditions
         """
@@ -43,11 +67,31 @@ class ReserveStockUseCase:
             if quantity > 10000:  # Reasonable max quantity
                 raise InvalidQuantityException(f"Quantity {quantity} too large for product {product_id}. Maximum 10000 allowed")
 
+        if orders is not None:
+            self._validate_breakdown(items, orders)
+
         logger.info(f"Attempting to reserve stock for {len(items)} products")
 
+        requested = items
         try:
+            held = {}
+            if orders:
+                held = await self.inventory_repository.find_reservations(list(orders))
+            if held:
+                logger.info(f"Stock already reserved for orders: {', '.join(held)}")
+                remaining: Dict[str, int] = defaultdict(int)
+                for order_id, quantities in orders.items():
+                    if order_id not in held:
+                        for product_id, quantity in quantities.items():
+                            remaining[product_id] += quantity
+                items = dict(remaining)
+                if not items:
+                    return True
+
             product_ids = list(items.keys())
-            inventory_items = await self.inventory_repository.find_by_product_ids(product_ids)
+            inventory_items = await self.inventory_repository.lock_by_product_ids(
+                product_ids
+            )
 
             # Check if all items exist and can be reserved
             missing_products = []
@@ -95,17 +139,62 @@ class ReserveStockUseCase:
 
             # Save all reservations
             try:
-                await self.inventory_repository.save_all(items_to_save)
+                if orders:
+                    await self.inventory_repository.save_reservations(items_to_save, [
+                        StockReservation(order_id=order_id, items=quantities)
+                        for order_id, quantities in orders.items()
+                        if order_id not in held
+                    ])
+                else:
+                    await self.inventory_repository.save_all(items_to_save)
                 logger.info(f"Successfully reserved stock for {len(items)} products")
                 return True
 
+            except ReservationExistsException:
+                raise
             except Exception as e:
                 logger.error(f"Failed to save stock reservations: {str(e)}")
                 raise StockReservationException(f"Failed to save reservations: {str(e)}")
 
+        except ReservationExistsException as e:
+            # A concurrent request for one of the orders committed after the
+            # check above; that order holds its stock now, so reserve again
+            # for the orders that still hold none
+            logger.info(f"Reservation raced with another request: {str(e)}")
+            return await self.execute(requested, orders)
         except (ProductNotFoundException, InsufficientStockException, StockReservationException):
             # Re-raise domain exceptions
             raise
         except Exception as e:
             logger.error(f"Unexpected error during stock reservation: {str(e)}")
-            raise DatabaseException(f"Failed to reserve stock: {str(e)}")
\ No newline at end of file
+            raise DatabaseException(f"Failed to reserve stock: {str(e)}")
+
+    async def reservations(self, order_ids: List[str]) -> Dict[str, StockReservation]:
+        """Stock held by each of the orders; orders holding none are left out"""
+        validate_order_ids(order_ids)
+
+        try:
+            return await self.inventory_repository.find_reservations(order_ids)
+        except Exception as e:
+            logger.error(f"Failed to read stock reservations: {str(e)}")
+            raise DatabaseException(f"Failed to read stock reservations: {str(e)}")
+
+    def _validate_breakdown(
+        self, items: Dict[str, int], orders: Dict[str, Dict[str, int]]
+    ) -> None:
+        totals: Dict[str, int] = defaultdict(int)
+        for order_id, quantities in orders.items():
+            if not order_id or not order_id.strip():
+                raise ValidationException("Order ID cannot be empty or whitespace")
+            for product_id, quantity in quantities.items():
+                if not isinstance(quantity, int) or quantity <= 0:
+                    raise InvalidQuantityException(
+                        f"Invalid quantity {quantity} for product {product_id} in "
+                        f"order {order_id}"
+                    )
+                totals[product_id] += quantity
+
+        if totals != items:
+            raise ValidationException(
+                "Order breakdown does not add up to the items to reserve"
+            )
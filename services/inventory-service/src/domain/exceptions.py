@@ -21,6 +21,11 @@ class StockReservationException(InventoryDomainException):
     pass
 
 
+class ReservationExistsException(InventoryDomainException):
+    """Raised when an order already holds a stock reservation"""
+    pass
+
+
 class InvalidQuantityException(InventoryDomainException):
     """Raised when an invalid quantity is provided"""
     pass
@@ -1,3 +1,3 @@
-from .inventory import InventoryItem
+from .inventory import InventoryItem, StockReservation
 
-__all__ = ["InventoryItem"]
\ No newline at end of file
+__all__ = ["InventoryItem", "StockReservation"]
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 
 
 @dataclass
@@ -31,4 +31,31 @@ class InventoryItem:
         self.reserved_quantity -= quantity
         self.available_quantity += quantity
         self.updated_at = datetime.utcnow()
-        return True
\ No newline at end of file
+        return True
+
+    def confirm_reservation(self, quantity: int) -> bool:
+        """Reserved units leave the stock for good, e.g. once the order is created"""
+        if self.reserved_quantity < quantity:
+            return False
+        self.reserved_quantity -= quantity
+        self.updated_at = datetime.utcnow()
+        return True
+
+    def restock(self, quantity: int) -> None:
+        """Units come back into stock, e.g. from a cancelled confirmed order"""
+        self.available_quantity += quantity
+        self.updated_at = datetime.utcnow()
+
+
+@dataclass
+class StockReservation:
+    """Stock held for one order, per product"""
+    order_id: str
+    items: Dict[str, int]
+    created_at: Optional[datetime] = None
+    # Set once the order is created and the units have left the stock
+    confirmed_at: Optional[datetime] = None
+
+    @property
+    def is_confirmed(self) -> bool:
+        return self.confirmed_at is not None
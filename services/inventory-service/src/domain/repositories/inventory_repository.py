@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional, List, Dict
-from src.domain.models.inventory import InventoryItem
+from src.domain.models.inventory import InventoryItem, StockReservation
 
 
 class InventoryRepository(ABC):
@@ -13,10 +14,67 @@ class InventoryRepository(ABC):
     async def find_by_product_ids(self, product_ids: List[str]) -> Dict[str, InventoryItem]:
         pass
 
+    @abstractmethod
+    async def lock_by_product_ids(
+        self, product_ids: List[str]
+    ) -> Dict[str, InventoryItem]:
+        """
+        Like find_by_product_ids, but locks the items found until the next
+        save commits, so their stock cannot change in between
+        """
+        pass
+
+    @abstractmethod
+    async def find_versions(self, product_ids: List[str]) -> Dict[str, datetime]:
+        """updated_at of each product found, without loading the items"""
+        pass
+
     @abstractmethod
     async def save(self, item: InventoryItem) -> InventoryItem:
         pass
 
     @abstractmethod
     async def save_all(self, items: List[InventoryItem]) -> List[InventoryItem]:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def find_reservations(
+        self, order_ids: List[str]
+    ) -> Dict[str, StockReservation]:
+        """Recorded reservations of the orders that hold stock"""
+        pass
+
+    @abstractmethod
+    async def lock_reservations(
+        self, order_ids: List[str]
+    ) -> Dict[str, StockReservation]:
+        """Like find_reservations, but locks them until the next save commits"""
+        pass
+
+    @abstractmethod
+    async def save_reservations(
+        self, items: List[InventoryItem], reservations: List[StockReservation]
+    ) -> None:
+        """
+        Save reserved items and record the reservations in one transaction.
+        Raises ReservationExistsException, saving nothing, if one of the
+        orders already holds a reservation
+        """
+        pass
+
+    @abstractmethod
+    async def confirm_reservations(
+        self, items: List[InventoryItem], order_ids: List[str], confirmed_at: datetime
+    ) -> None:
+        """
+        Save confirmed items and mark the orders' reservations confirmed in one
+        transaction
+        """
+        pass
+
+    @abstractmethod
+    async def delete_reservations(
+        self, items: List[InventoryItem], order_ids: List[str]
+    ) -> None:
+        """Save released items and drop the orders' reservations in one transaction"""
+        pass
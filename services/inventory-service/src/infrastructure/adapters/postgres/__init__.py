@@ -1,5 +1,11 @@
 from .inventory_repository_impl import PostgresInventoryRepository
 from .session import get_db_session
-from .models import Base, InventoryModel
+from .models import Base, InventoryModel, StockReservationModel
 
-__all__ = ["PostgresInventoryRepository", "get_db_session", "Base", "InventoryModel"]
\ No newline at end of file
+__all__ = [
+    "PostgresInventoryRepository",
+    "get_db_session",
+    "Base",
+    "InventoryModel",
+    "StockReservationModel",
+]
\ No newline at end of file
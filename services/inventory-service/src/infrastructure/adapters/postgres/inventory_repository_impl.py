@@ -1,10 +1,14 @@
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Sequence
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from src.domain.models.inventory import InventoryItem
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+from src.domain.exceptions import ReservationExistsException
+from src.domain.models.inventory import InventoryItem, StockReservation
 from src.domain.repositories.inventory_repository import InventoryRepository
-from src.infrastructure.adapters.postgres.models import InventoryModel
+from src.infrastructure.adapters.postgres.models import (
+    InventoryModel, StockReservationModel
+)
 
 
 class PostgresInventoryRepository(InventoryRepository):
@@ -31,18 +35,30 @@ class PostgresInventoryRepository(InventoryRepository):
             for item in db_items
         }
 
-    async def save(self, item: InventoryItem) -> InventoryItem:
-        db_item = await self.session.get(InventoryModel, item.product_id)
-
-        if not db_item:
-            db_item = InventoryModel()
-            db_item.product_id = item.product_id
+    async def lock_by_product_ids(
+        self, product_ids: List[str]
+    ) -> Dict[str, InventoryItem]:
+        # Locked in product order, so concurrent callers cannot deadlock each other
+        result = await self.session.execute(
+            select(InventoryModel)
+            .where(InventoryModel.product_id.in_(product_ids))
+            .order_by(InventoryModel.product_id)
+            .with_for_update()
+        )
+        return {
+            item.product_id: self._to_domain(item)
+            for item in result.scalars().all()
+        }
 
-        db_item.available_quantity = item.available_quantity
-        db_item.reserved_quantity = item.reserved_quantity
-        db_item.updated_at = item.updated_at or datetime.utcnow()
+    async def find_versions(self, product_ids: List[str]) -> Dict[str, datetime]:
+        result = await self.session.execute(
+            select(InventoryModel.product_id, InventoryModel.updated_at)
+            .where(InventoryModel.product_id.in_(product_ids))
+        )
+        return dict(result.all())
 
-        self.session.add(db_item)
+    async def save(self, item: InventoryItem) -> InventoryItem:
+        db_item = await self._stage(item)
         await self.session.commit()
         await self.session.refresh(db_item)
 
@@ -55,6 +71,99 @@ class PostgresInventoryRepository(InventoryRepository):
             saved_items.append(saved_item)
         return saved_items
 
+    async def find_reservations(
+        self, order_ids: List[str]
+    ) -> Dict[str, StockReservation]:
+        result = await self.session.execute(
+            select(StockReservationModel).where(StockReservationModel.order_id.in_(order_ids))
+        )
+        return self._to_reservations(result.scalars().all())
+
+    async def lock_reservations(
+        self, order_ids: List[str]
+    ) -> Dict[str, StockReservation]:
+        # Reservations before items, in order id order, for every caller
+        result = await self.session.execute(
+            select(StockReservationModel)
+            .where(StockReservationModel.order_id.in_(order_ids))
+            .order_by(StockReservationModel.order_id)
+            .with_for_update()
+        )
+        return self._to_reservations(result.scalars().all())
+
+    async def save_reservations(
+        self, items: List[InventoryItem], reservations: List[StockReservation]
+    ) -> None:
+        for item in items:
+            await self._stage(item)
+        self.session.add_all([
+            StockReservationModel(
+                order_id=reservation.order_id,
+                items=reservation.items,
+                created_at=reservation.created_at or datetime.utcnow()
+            )
+            for reservation in reservations
+        ])
+        try:
+            await self.session.commit()
+        except IntegrityError as e:
+            # A concurrent reservation of the same order committed first: the
+            # primary key fails and the stock changes are rolled back with it
+            await self.session.rollback()
+            raise ReservationExistsException(
+                f"Stock already reserved for one of the orders: {str(e.orig)}"
+            ) from e
+
+    async def confirm_reservations(
+        self, items: List[InventoryItem], order_ids: List[str], confirmed_at: datetime
+    ) -> None:
+        for item in items:
+            await self._stage(item)
+        await self.session.execute(
+            update(StockReservationModel)
+            .where(StockReservationModel.order_id.in_(order_ids))
+            .values(confirmed_at=confirmed_at)
+        )
+        await self.session.commit()
+
+    async def delete_reservations(
+        self, items: List[InventoryItem], order_ids: List[str]
+    ) -> None:
+        for item in items:
+            await self._stage(item)
+        await self.session.execute(
+            delete(StockReservationModel).where(StockReservationModel.order_id.in_(order_ids))
+        )
+        await self.session.commit()
+
+    async def _stage(self, item: InventoryItem) -> InventoryModel:
+        """Apply the item to its row in the session, without committing"""
+        db_item = await self.session.get(InventoryModel, item.product_id)
+
+        if not db_item:
+            db_item = InventoryModel()
+            db_item.product_id = item.product_id
+
+        db_item.available_quantity = item.available_quantity
+        db_item.reserved_quantity = item.reserved_quantity
+        db_item.updated_at = item.updated_at or datetime.utcnow()
+
+        self.session.add(db_item)
+        return db_item
+
+    def _to_reservations(
+        self, db_reservations: Sequence[StockReservationModel]
+    ) -> Dict[str, StockReservation]:
+        return {
+            reservation.order_id: StockReservation(
+                order_id=reservation.order_id,
+                items=reservation.items,
+                created_at=reservation.created_at,
+                confirmed_at=reservation.confirmed_at
+            )
+            for reservation in db_reservations
+        }
+
     def _to_domain(self, db_item: InventoryModel) -> InventoryItem:
         return InventoryItem(
             product_id=db_item.product_id,
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime
+from sqlalchemy import Column, String, Integer, DateTime, JSON
 from sqlalchemy.orm import declarative_base
 from datetime import datetime
 
@@ -11,4 +11,13 @@ class InventoryModel(Base):
     product_id = Column(String, primary_key=True, index=True)
     available_quantity = Column(Integer, nullable=False, default=0)
     reserved_quantity = Column(Integer, nullable=False, default=0)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
\ No newline at end of file
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class StockReservationModel(Base):
+    __tablename__ = "stock_reservations"
+
+    order_id = Column(String, primary_key=True)
+    items = Column(JSON, nullable=False)  # product_id -> quantity
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    confirmed_at = Column(DateTime, nullable=True)
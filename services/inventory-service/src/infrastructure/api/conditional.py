@@ -0,0 +1,38 @@
+"""Entity tags and conditional GET (If-None-Match)"""
+
+import hashlib
+from datetime import datetime
+from typing import Dict, Optional
+
+from fastapi import Response, status
+
+ETAG_HEADER = "ETag"
+
+
+def stock_etag(versions: Dict[str, datetime]) -> str:
+    """
+    Strong entity tag of stock levels, from the updated_at of each product.
+    Every stock change sets updated_at, so the tag changes with the levels.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for product_id, updated_at in sorted(versions.items()):
+        digest.update(f"{product_id}\0{updated_at.isoformat()}\n".encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match uses the weak comparison: W/ prefixes are ignored"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED, headers={ETAG_HEADER: etag}
+    )
@@ -1,8 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
 
-from src.infrastructure.api.dto.inventory_dto import CheckStockRequest, CheckStockResponse, ReserveStockRequest, ReserveStockResponse
-from src.infrastructure.api.dependencies import get_check_stock_use_case, get_reserve_stock_use_case
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+
+from src.infrastructure.api.conditional import (
+    ETAG_HEADER, etag_matches, not_modified, stock_etag
+)
+from src.infrastructure.api.dto.inventory_dto import (
+    CheckStockRequest,
+    CheckStockResponse,
+    ReleaseStockRequest,
+    ReleaseStockResponse,
+    ReservationsResponse,
+    ReserveStockRequest,
+    ReserveStockResponse,
+    StockItemResponse,
+)
+from src.infrastructure.api.dependencies import (
+    get_check_stock_use_case,
+    get_release_stock_use_case,
+    get_reserve_stock_use_case,
+)
 from src.application.use_cases.check_stock import CheckStockUseCase
+from src.application.use_cases.release_stock import ReleaseStockUseCase
 from src.application.use_cases.reserve_stock import ReserveStockUseCase
 
 router = APIRouter(prefix="/api/v1/inventory", tags=["inventory"])
@@ -99,6 +118,8 @@ async def check_stock(
     - Reservation is atomic - either all items are reserved or none are
     - Reserved stock is held for a limited time (configurable TTL)
     - Failed reservations do not partially reserve any items
+    - With the `orders` breakdown, each order's reservation is recorded and
+      orders that already hold stock are skipped, so retries are safe
 
     **Use Cases:**
     - Order processing workflow
@@ -185,7 +206,149 @@ async def reserve_stock(
     """Reserve stock for order items"""
 
     # Execute use case - exceptions will be handled by global exception handlers
-    reserved = await use_case.execute(request.items)
+    reserved = await use_case.execute(request.items, request.orders)
     return ReserveStockResponse(reserved=reserved)
 
 
+@router.post(
+    "/release",
+    response_model=ReleaseStockResponse,
+    summary="Release the stock held by orders",
+    description="""
+    Returns the stock reserved by the given orders to the available stock,
+    e.g. for rejected or cancelled orders.
+
+    **Business Rules:**
+    - Only reservations recorded through the `orders` breakdown of `POST /reserve`
+      are released
+    - Quantities are summed per product and released in one transaction
+    - Releasing is idempotent: orders already released, or that never held stock,
+      are skipped
+    - At most 100 orders per request
+    """,
+    responses={
+        200: {
+            "description": "Stock released",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "released": ["order-1"]
+                    }
+                }
+            }
+        },
+        422: {"description": "Empty, blank or too many order IDs"},
+    }
+)
+async def release_stock(
+    request: ReleaseStockRequest,
+    use_case: ReleaseStockUseCase = Depends(get_release_stock_use_case)
+):
+    """Release the stock held by orders"""
+
+    released = await use_case.execute(request.order_ids)
+    return ReleaseStockResponse(released=released)
+
+
+@router.get(
+    "/reservations",
+    response_model=ReservationsResponse,
+    summary="Get the stock held by orders",
+    description="""
+    Returns the recorded reservation of each order, so callers can tell
+    whether an interrupted reservation went through.
+
+    **Query Parameters:**
+    - `order_ids`: Orders to look up; repeat the parameter for several (max 100)
+    """,
+    responses={
+        422: {"description": "Empty, blank or too many order IDs"},
+    }
+)
+async def get_reservations(
+    order_ids: List[str] = Query(..., description="Order IDs to look up"),
+    use_case: ReserveStockUseCase = Depends(get_reserve_stock_use_case)
+):
+    """Get the stock held by orders"""
+
+    reservations = await use_case.reservations(order_ids)
+    return ReservationsResponse(reservations={
+        order_id: reservation.items for order_id, reservation in reservations.items()
+    })
+
+
+@router.get(
+    "/stock",
+    response_model=CheckStockResponse,
+    summary="Get stock availability",
+    description="""
+    Same result as `POST /check`, as a cacheable GET for clients that poll.
+
+    **Query Parameters:**
+    - `product_ids`: Products to check; repeat the parameter for several (max 100)
+
+    **Conditional requests:**
+    The `ETag` header changes whenever the stock of any of the products
+    changes. Send it back in `If-None-Match` to get `304 Not Modified`
+    without a body; only the products' update times are read.
+    """,
+    responses={
+        304: {"description": "Stock unchanged since the ETag in If-None-Match"},
+        422: {"description": "Empty, blank or too many product IDs"},
+    }
+)
+async def get_stock(
+    response: Response,
+    product_ids: List[str] = Query(..., description="Product IDs to check stock for"),
+    if_none_match: Optional[str] = Header(None),
+    use_case: CheckStockUseCase = Depends(get_check_stock_use_case)
+):
+    """Check stock availability for products, with conditional GET"""
+
+    if if_none_match:
+        etag = stock_etag(await use_case.versions(product_ids))
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+    stock, versions = await use_case.snapshot(product_ids)
+    response.headers[ETAG_HEADER] = stock_etag(versions)
+    return CheckStockResponse(stock=stock)
+
+
+@router.get(
+    "/{product_id}",
+    response_model=StockItemResponse,
+    summary="Get stock of a product",
+    description="""
+    Returns the available and reserved stock of a single product.
+
+    **Conditional requests:**
+    The `ETag` header derives from the product's last update. Send it back
+    in `If-None-Match` to get `304 Not Modified` without a body.
+    """,
+    responses={
+        304: {"description": "Stock unchanged since the ETag in If-None-Match"},
+        404: {"description": "Product not found in inventory"},
+    }
+)
+async def get_stock_item(
+    product_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    use_case: CheckStockUseCase = Depends(get_check_stock_use_case)
+):
+    """Get the stock of a single product, with conditional GET"""
+
+    if if_none_match:
+        versions = await use_case.versions([product_id])
+        if versions and etag_matches(if_none_match, stock_etag(versions)):
+            return not_modified(stock_etag(versions))
+
+    item = await use_case.item(product_id)
+    response.headers[ETAG_HEADER] = stock_etag({item.product_id: item.updated_at})
+    return StockItemResponse(
+        product_id=item.product_id,
+        available_quantity=item.available_quantity,
+        reserved_quantity=item.reserved_quantity,
+        updated_at=item.updated_at
+    )
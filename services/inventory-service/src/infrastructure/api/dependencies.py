@@ -1,11 +1,18 @@
 from functools import lru_cache
+import boto3
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.use_cases.check_stock import CheckStockUseCase
+from src.application.use_cases.confirm_reservations import ConfirmReservationsUseCase
+from src.application.use_cases.release_stock import ReleaseStockUseCase
 from src.application.use_cases.reserve_stock import ReserveStockUseCase
 from src.infrastructure.adapters.postgres.inventory_repository_impl import PostgresInventoryRepository
-from src.infrastructure.adapters.postgres.session import get_db_session
+from src.infrastructure.adapters.postgres.session import (
+    AsyncSessionLocal, get_db_session
+)
+from src.infrastructure.config.settings import settings
+from src.infrastructure.workers.order_events_consumer import OrderEventsConsumer
 
 
 def get_repository(session: AsyncSession) -> PostgresInventoryRepository:
@@ -42,4 +49,45 @@ def get_reserve_stock_use_case(
     session: AsyncSession = Depends(get_db_session)
 ) -> ReserveStockUseCase:
     repository = get_repository(session)
-    return ReserveStockUseCase(inventory_repository=repository)
\ No newline at end of file
+    return ReserveStockUseCase(inventory_repository=repository)
+
+
+def get_release_stock_use_case(
+    session: AsyncSession = Depends(get_db_session)
+) -> ReleaseStockUseCase:
+    repository = get_repository(session)
+    return ReleaseStockUseCase(inventory_repository=repository)
+
+
+def build_confirm_reservations_use_case(
+    session: AsyncSession
+) -> ConfirmReservationsUseCase:
+    """ConfirmReservationsUseCase for a session owned by a background worker"""
+    return ConfirmReservationsUseCase(inventory_repository=get_repository(session))
+
+
+@lru_cache()
+def get_order_events_consumer() -> OrderEventsConsumer:
+    """Singleton factory for the SQS consumer of order events"""
+    if settings.AWS_ENDPOINT_URL:  # LocalStack
+        sqs_client = boto3.client(
+            'sqs',
+            region_name=settings.AWS_REGION,
+            endpoint_url=settings.AWS_ENDPOINT_URL,
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
+        )
+    else:  # Real AWS
+        sqs_client = boto3.client('sqs', region_name=settings.AWS_REGION)
+
+    return OrderEventsConsumer(
+        sqs_client=sqs_client,
+        queue_url=settings.SQS_ORDER_EVENTS_QUEUE_URL,
+        session_factory=AsyncSessionLocal,
+        use_case_factory=build_confirm_reservations_use_case,
+        pollers=settings.ORDER_EVENTS_POLLERS,
+        wait_time_seconds=settings.ORDER_EVENTS_WAIT_TIME_SECONDS,
+        visibility_timeout_seconds=settings.ORDER_EVENTS_VISIBILITY_TIMEOUT_SECONDS,
+        max_receive_count=settings.ORDER_EVENTS_MAX_RECEIVE_COUNT,
+        dead_letter_queue_url=settings.SQS_ORDER_EVENTS_DEAD_LETTER_QUEUE_URL,
+    )
@@ -1,3 +1,21 @@
-from .inventory_dto import CheckStockRequest, CheckStockResponse, ReserveStockRequest, ReserveStockResponse
+from .inventory_dto import (
+    CheckStockRequest,
+    CheckStockResponse,
+    ReleaseStockRequest,
+    ReleaseStockResponse,
+    ReservationsResponse,
+    ReserveStockRequest,
+    ReserveStockResponse,
+    StockItemResponse,
+)
 
-__all__ = ["CheckStockRequest", "CheckStockResponse", "ReserveStockRequest", "ReserveStockResponse"]
\ No newline at end of file
+__all__ = [
+    "CheckStockRequest",
+    "CheckStockResponse",
+    "ReleaseStockRequest",
+    "ReleaseStockResponse",
+    "ReservationsResponse",
+    "ReserveStockRequest",
+    "ReserveStockResponse",
+    "StockItemResponse",
+]
\ No newline at end of file
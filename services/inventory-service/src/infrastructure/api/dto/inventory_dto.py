@@ -1,5 +1,6 @@
+from datetime import datetime
 from pydantic import BaseModel, Field
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 
 class CheckStockRequest(BaseModel):
@@ -30,16 +31,46 @@ class CheckStockResponse(BaseModel):
         }
 
 
+class StockItemResponse(BaseModel):
+    """Response model for the stock of a single product"""
+    product_id: str = Field(..., description="Product identifier")
+    available_quantity: int = Field(
+        ..., description="Stock available for new reservations"
+    )
+    reserved_quantity: int = Field(..., description="Stock held by reservations")
+    updated_at: datetime = Field(..., description="Last change to the stock levels")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "product_id": "prod-123",
+                "available_quantity": 50,
+                "reserved_quantity": 5,
+                "updated_at": "2025-09-21T06:23:11.910148"
+            }
+        }
+
+
 class ReserveStockRequest(BaseModel):
     """Request model for reserving stock"""
     items: Dict[str, int] = Field(..., description="Map of product IDs to quantities to reserve")
+    orders: Optional[Dict[str, Dict[str, int]]] = Field(
+        None,
+        description="The same items broken down by order ID. Each order's "
+                    "reservation is recorded, and orders that already hold stock "
+                    "are not reserved again"
+    )
 
     class Config:
         json_schema_extra = {
             "example": {
                 "items": {
-                    "prod-123": 2,
+                    "prod-123": 3,
                     "prod-456": 1
+                },
+                "orders": {
+                    "order-1": {"prod-123": 2},
+                    "order-2": {"prod-123": 1, "prod-456": 1}
                 }
             }
         }
@@ -54,4 +85,48 @@ class ReserveStockResponse(BaseModel):
             "example": {
                 "reserved": True
             }
-        }
\ No newline at end of file
+        }
+
+
+class ReservationsResponse(BaseModel):
+    """Response model for a stock reservation lookup"""
+    reservations: Dict[str, Dict[str, int]] = Field(
+        ...,
+        description="Map of order IDs to the quantities they hold per product; "
+                    "orders holding none are left out"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "reservations": {
+                    "order-1": {"prod-123": 2}
+                }
+            }
+        }
+
+
+class ReleaseStockRequest(BaseModel):
+    """Request model for releasing the stock held by orders"""
+    order_ids: List[str] = Field(
+        ..., description="Orders whose reserved stock to release", min_items=1
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "order_ids": ["order-1", "order-2"]
+            }
+        }
+
+
+class ReleaseStockResponse(BaseModel):
+    """Response model for a stock release"""
+    released: List[str] = Field(..., description="Orders whose stock was released")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "released": ["order-1"]
+            }
+        }
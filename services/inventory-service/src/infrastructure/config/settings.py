@@ -25,6 +25,20 @@ class Settings(BaseSettings):
     LOW_STOCK_THRESHOLD: int = 10
     RESERVATION_TIMEOUT_MINUTES: int = 15
 
+    # AWS
+    AWS_REGION: str = "us-east-1"
+    AWS_ACCESS_KEY_ID: str = ""
+    AWS_SECRET_ACCESS_KEY: str = ""
+    AWS_ENDPOINT_URL: str = ""  # For LocalStack or another local SQS
+
+    # Order Events Consumer (events published by the orders service)
+    SQS_ORDER_EVENTS_QUEUE_URL: str = ""  # empty or mock:// disables the consumer
+    SQS_ORDER_EVENTS_DEAD_LETTER_QUEUE_URL: str = ""  # without one, poison is dropped
+    ORDER_EVENTS_POLLERS: int = 4
+    ORDER_EVENTS_WAIT_TIME_SECONDS: int = 20  # long polling, at most 20
+    ORDER_EVENTS_VISIBILITY_TIMEOUT_SECONDS: int = 30  # extended during processing
+    ORDER_EVENTS_MAX_RECEIVE_COUNT: int = 5  # deliveries before a message is poison
+
     class Config:
         env_file = ".env"
         extra = "ignore"  # Ignore extra fields
@@ -0,0 +1,3 @@
+from .order_events_consumer import OrderEventsConsumer
+
+__all__ = ["OrderEventsConsumer"]
@@ -0,0 +1,344 @@
+import asyncio
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from prometheus_client import Counter, Histogram
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.use_cases.confirm_reservations import ConfirmReservationsUseCase
+
+logger = logging.getLogger(__name__)
+
+# ReceiveMessage, DeleteMessageBatch and ChangeMessageVisibilityBatch limit
+MAX_BATCH_MESSAGES = 10
+
+# Pause after a failed ReceiveMessage, so an unreachable queue is not hammered
+RECEIVE_RETRY_SECONDS = 5.0
+
+ORDER_EVENTS = Counter(
+    "inventory_order_events_total",
+    "Order events handled by the SQS consumer, by outcome (processed, ignored, "
+    "failed, poison)",
+    ["outcome"],
+)
+RECEIVE_FAILURES = Counter(
+    "inventory_order_events_receive_failures_total",
+    "ReceiveMessage calls that failed",
+)
+BATCH_SIZE = Histogram(
+    "inventory_order_events_batch_size",
+    "Messages per received batch",
+    buckets=range(1, MAX_BATCH_MESSAGES + 1),
+)
+
+Message = Dict[str, Any]
+
+
+class PoisonMessageException(Exception):
+    """Raised for a message that can never be processed, e.g. malformed"""
+    pass
+
+
+def parse_order_event(body: str) -> Tuple[str, Dict[str, Any]]:
+    """
+    Event type and payload of a message sent by the orders service's SQSEventPublisher
+    """
+    try:
+        message = json.loads(body)
+    except ValueError as e:
+        raise PoisonMessageException(f"Invalid JSON: {str(e)}")
+    if not isinstance(message, dict):
+        raise PoisonMessageException("Message is not a JSON object")
+
+    event_type = message.get("event_type")
+    payload = message.get("payload")
+    if not isinstance(event_type, str) or not isinstance(payload, dict):
+        raise PoisonMessageException("Message has no event_type or payload")
+    return event_type, payload
+
+
+class OrderEventsConsumer:
+    """
+    Consumes the events the orders service publishes to SQS. OrderCreated
+    confirms the stock reservation of the order; other events are
+    acknowledged and ignored.
+
+    Several pollers long-poll the queue concurrently, up to 10 messages
+    per ReceiveMessage. Each received batch is applied in one database
+    transaction and acknowledged with one DeleteMessageBatch. The visibility
+    of the batch is extended while it is processed, so slow batches are
+    not delivered to another consumer meanwhile.
+
+    Delivery is at least once: confirming an order twice changes nothing.
+    When a batch fails, its messages are retried one by one to isolate the
+    failing ones, which are left on the queue to be delivered again.
+    Malformed messages, and messages delivered max_receive_count times,
+    are poison: they are moved to the dead letter queue if one is set,
+    and dropped otherwise.
+
+    The boto3 client is blocking, so calls run on a thread pool. Any
+    object with the same SQS methods can stand in for it, e.g. a client
+    pointed at LocalStack or ElasticMQ through AWS_ENDPOINT_URL.
+    """
+
+    def __init__(
+        self,
+        sqs_client: Any,
+        queue_url: str,
+        session_factory: async_sessionmaker[AsyncSession],
+        use_case_factory: Callable[[AsyncSession], ConfirmReservationsUseCase],
+        pollers: int,
+        wait_time_seconds: int,
+        visibility_timeout_seconds: int,
+        max_receive_count: int,
+        dead_letter_queue_url: str = "",
+    ):
+        self.sqs_client = sqs_client
+        self.queue_url = queue_url
+        self.session_factory = session_factory
+        self.use_case_factory = use_case_factory
+        self.pollers = max(1, pollers)
+        self.wait_time_seconds = max(0, min(wait_time_seconds, 20))
+        self.visibility_timeout_seconds = max(2, visibility_timeout_seconds)
+        self.max_receive_count = max(1, max_receive_count)
+        self.dead_letter_queue_url = dead_letter_queue_url
+        self._tasks: List[asyncio.Task] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        # A thread per poller for the long poll, and one for its heartbeat
+        self._executor = ThreadPoolExecutor(
+            max_workers=2 * self.pollers, thread_name_prefix="sqs-consumer"
+        )
+        loop = asyncio.get_running_loop()
+        self._tasks = [loop.create_task(self._poll()) for _ in range(self.pollers)]
+        logger.info(
+            f"Consuming order events from {self.queue_url} with {self.pollers} pollers"
+        )
+
+    async def stop(self) -> None:
+        if not self._tasks:
+            return
+        # Interrupted batches roll back; their messages reappear after the visibility
+        # timeout
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        # A long poll in progress cannot be interrupted, do not wait for it
+        self._executor.shutdown(wait=False)
+        self._executor = None
+
+    async def _poll(self) -> None:
+        while True:
+            try:
+                response = await self._call(
+                    "receive_message",
+                    QueueUrl=self.queue_url,
+                    MaxNumberOfMessages=MAX_BATCH_MESSAGES,
+                    WaitTimeSeconds=self.wait_time_seconds,
+                    VisibilityTimeout=self.visibility_timeout_seconds,
+                    AttributeNames=["ApproximateReceiveCount"],
+                    MessageAttributeNames=["All"],
+                )
+            except Exception as e:
+                RECEIVE_FAILURES.inc()
+                logger.error(f"Failed to receive order events: {str(e)}")
+                await asyncio.sleep(RECEIVE_RETRY_SECONDS)
+                continue
+
+            messages = response.get("Messages", [])
+            if not messages:
+                continue
+            try:
+                await self.handle(messages)
+            except Exception as e:
+                # Unacknowledged messages are delivered again
+                logger.error(f"Failed to handle {len(messages)} order events: {str(e)}")
+
+    async def handle(self, messages: List[Message]) -> None:
+        """Process one received batch and acknowledge what is done with it"""
+        BATCH_SIZE.observe(len(messages))
+
+        heartbeat = asyncio.get_running_loop().create_task(
+            self._extend_visibility(messages)
+        )
+        try:
+            done, poison = await self._process(messages)
+        finally:
+            heartbeat.cancel()
+
+        if poison:
+            done += await self._dead_letter(poison)
+        if done:
+            await self._delete(done)
+
+    async def _process(
+        self, messages: List[Message]
+    ) -> Tuple[List[Message], List[Message]]:
+        """Returns: The messages done with, and the poison ones"""
+        done: List[Message] = []
+        poison: List[Message] = []
+        created: List[Tuple[Message, str]] = []
+
+        for message in messages:
+            try:
+                event_type, payload = parse_order_event(message["Body"])
+                if event_type != "OrderCreated":
+                    ORDER_EVENTS.labels(outcome="ignored").inc()
+                    done.append(message)
+                    continue
+                order_id = payload.get("order_id")
+                if not isinstance(order_id, str) or not order_id:
+                    raise PoisonMessageException("OrderCreated event has no order_id")
+            except PoisonMessageException as e:
+                logger.error(f"Poison order event {message['MessageId']}: {str(e)}")
+                poison.append(message)
+                continue
+            created.append((message, order_id))
+
+        if not created:
+            return done, poison
+
+        try:
+            await self._confirm([order_id for _, order_id in created])
+            failed = []
+        except Exception as e:
+            logger.error(f"Failed to apply {len(created)} order events: {str(e)}")
+            failed = created
+            if len(created) > 1:
+                # One transaction per message, to find the ones failing the batch
+                failed = []
+                for message, order_id in created:
+                    try:
+                        await self._confirm([order_id])
+                    except Exception:
+                        failed.append((message, order_id))
+
+        failed_ids = {message["MessageId"] for message, _ in failed}
+        for message, order_id in created:
+            if message["MessageId"] not in failed_ids:
+                ORDER_EVENTS.labels(outcome="processed").inc()
+                done.append(message)
+            elif self._receive_count(message) >= self.max_receive_count:
+                logger.error(
+                    f"Order event {message['MessageId']} for order {order_id} failed "
+                    f"{self._receive_count(message)} times, giving up on it"
+                )
+                poison.append(message)
+            else:
+                ORDER_EVENTS.labels(outcome="failed").inc()
+
+        return done, poison
+
+    async def _confirm(self, order_ids: List[str]) -> None:
+        async with self.session_factory() as session:
+            try:
+                await self.use_case_factory(session).execute(
+                    list(dict.fromkeys(order_ids))
+                )
+            except Exception:
+                await session.rollback()
+                raise
+
+    async def _extend_visibility(self, messages: List[Message]) -> None:
+        entries = [
+            {
+                "Id": str(index),
+                "ReceiptHandle": message["ReceiptHandle"],
+                "VisibilityTimeout": self.visibility_timeout_seconds,
+            }
+            for index, message in enumerate(messages)
+        ]
+        while True:
+            await asyncio.sleep(self.visibility_timeout_seconds / 2)
+            try:
+                response = await self._call(
+                    "change_message_visibility_batch",
+                    QueueUrl=self.queue_url,
+                    Entries=entries,
+                )
+                for failure in response.get("Failed", []):
+                    logger.warning(
+                        "Failed to extend visibility of order event: "
+                        f"{failure.get('Code')} {failure.get('Message')}"
+                    )
+            except Exception as e:
+                logger.warning(
+                    f"Failed to extend visibility of {len(entries)} order "
+                    f"events: {str(e)}"
+                )
+
+    async def _dead_letter(self, messages: List[Message]) -> List[Message]:
+        """Returns: The poison messages that can be deleted from the queue"""
+        if not self.dead_letter_queue_url:
+            for message in messages:
+                logger.error(
+                    f"Dropping poison order event {message['MessageId']}: "
+                    f"{message['Body']}"
+                )
+            ORDER_EVENTS.labels(outcome="poison").inc(len(messages))
+            return messages
+
+        entries = []
+        for index, message in enumerate(messages):
+            entry = {"Id": str(index), "MessageBody": message["Body"]}
+            if message.get("MessageAttributes"):
+                entry["MessageAttributes"] = message["MessageAttributes"]
+            entries.append(entry)
+        try:
+            response = await self._call(
+                "send_message_batch",
+                QueueUrl=self.dead_letter_queue_url,
+                Entries=entries,
+            )
+        except Exception as e:
+            # Kept on the queue, to be dead lettered on a later delivery
+            logger.error(
+                f"Failed to move {len(messages)} poison order events: {str(e)}"
+            )
+            return []
+
+        moved = [messages[int(entry["Id"])] for entry in response.get("Successful", [])]
+        ORDER_EVENTS.labels(outcome="poison").inc(len(moved))
+        for failure in response.get("Failed", []):
+            logger.error(
+                f"Failed to move poison order event: {failure.get('Code')} "
+                f"{failure.get('Message')}"
+            )
+        return moved
+
+    async def _delete(self, messages: List[Message]) -> None:
+        for start in range(0, len(messages), MAX_BATCH_MESSAGES):
+            batch = messages[start:start + MAX_BATCH_MESSAGES]
+            entries = [
+                {"Id": str(index), "ReceiptHandle": message["ReceiptHandle"]}
+                for index, message in enumerate(batch)
+            ]
+            try:
+                response = await self._call(
+                    "delete_message_batch", QueueUrl=self.queue_url, Entries=entries
+                )
+            except Exception as e:
+                # Delivered again later; processing them twice is harmless
+                logger.error(f"Failed to delete {len(entries)} order events: {str(e)}")
+                continue
+            for failure in response.get("Failed", []):
+                logger.warning(
+                    f"Failed to delete order event: {failure.get('Code')} "
+                    f"{failure.get('Message')}"
+                )
+
+    async def _call(self, method: str, **kwargs: Any) -> Dict[str, Any]:
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, partial(getattr(self.sqs_client, method), **kwargs)
+        )
+
+    @staticmethod
+    def _receive_count(message: Message) -> int:
+        return int(message.get("Attributes", {}).get("ApproximateReceiveCount", 1))
@@ -0,0 +1,195 @@
+import json
+
+from src.application.use_cases.confirm_reservations import ConfirmReservationsUseCase
+from src.domain.models.inventory import InventoryItem, StockReservation
+from src.infrastructure.adapters.postgres import PostgresInventoryRepository
+from src.infrastructure.workers.order_events_consumer import OrderEventsConsumer
+
+DEAD_LETTER_QUEUE_URL = "https://sqs.test/order-events-dlq"
+
+
+class StubSQSClient:
+    """Records calls by method; DLQ sends fail while `dead_letter_down` is set"""
+
+    def __init__(self):
+        self.calls: dict[str, list[dict]] = {}
+        self.dead_letter_down = False
+
+    def _accept(self, method: str, **kwargs) -> dict:
+        self.calls.setdefault(method, []).append(kwargs)
+        return {"Successful": [{"Id": entry["Id"]} for entry in kwargs["Entries"]]}
+
+    def delete_message_batch(self, **kwargs):
+        return self._accept("delete_message_batch", **kwargs)
+
+    def send_message_batch(self, **kwargs):
+        response = self._accept("send_message_batch", **kwargs)
+        if self.dead_letter_down:
+            raise ConnectionError("Connection refused")
+        return response
+
+    def change_message_visibility_batch(self, **kwargs):
+        return self._accept("change_message_visibility_batch", **kwargs)
+
+    def deleted(self) -> list[str]:
+        return [
+            entry["ReceiptHandle"]
+            for call in self.calls.get("delete_message_batch", [])
+            for entry in call["Entries"]
+        ]
+
+    def dead_lettered(self) -> list[str]:
+        return [
+            entry["MessageBody"]
+            for call in self.calls.get("send_message_batch", [])
+            for entry in call["Entries"]
+        ]
+
+
+class FailingConfirmations(ConfirmReservationsUseCase):
+    """Fails any transaction that includes one of the `failing` orders"""
+
+    def __init__(self, inventory_repository, failing: set[str]):
+        super().__init__(inventory_repository)
+        self.failing = failing
+
+    async def execute(self, order_ids):
+        if self.failing & set(order_ids):
+            raise RuntimeError("constraint violation")
+        return await super().execute(order_ids)
+
+
+async def reserve(
+    session_factory, available: int, reservations: dict[str, int]
+) -> None:
+    """Stock of product p-1, with `reservations` (order id -> units) held"""
+    reserved = sum(reservations.values())
+    async with session_factory() as session:
+        await PostgresInventoryRepository(session).save_reservations(
+            [InventoryItem("p-1", available - reserved, reserved)],
+            [
+                StockReservation(order_id=order_id, items={"p-1": quantity})
+                for order_id, quantity in reservations.items()
+            ],
+        )
+
+
+async def stock(session_factory) -> InventoryItem:
+    async with session_factory() as session:
+        return await PostgresInventoryRepository(session).find_by_product_id("p-1")
+
+
+def message(
+    order_id: str, receive_count: int = 1, event_type: str = "OrderCreated"
+) -> dict:
+    body = json.dumps({"event_type": event_type, "payload": {"order_id": order_id}})
+    return {
+        "MessageId": f"message-{order_id}-{receive_count}",
+        "ReceiptHandle": f"receipt-{order_id}",
+        "Body": body,
+        "Attributes": {"ApproximateReceiveCount": str(receive_count)},
+    }
+
+
+def consumer(session_factory, client, failing=frozenset(), dead_letter_queue_url=""):
+    return OrderEventsConsumer(
+        sqs_client=client,
+        queue_url="https://sqs.test/order-events",
+        session_factory=session_factory,
+        use_case_factory=lambda session: FailingConfirmations(
+            PostgresInventoryRepository(session), set(failing)
+        ),
+        pollers=1,
+        wait_time_seconds=0,
+        visibility_timeout_seconds=30,
+        max_receive_count=3,
+        dead_letter_queue_url=dead_letter_queue_url,
+    )
+
+
+async def test_batch_confirms_reservations(session_factory):
+    await reserve(session_factory, 100, {"order-1": 3, "order-2": 4})
+    client = StubSQSClient()
+
+    await consumer(session_factory, client).handle([
+        message("order-1"),
+        message("order-2"),
+        message("order-3", event_type="OrderCancelled"),
+    ])
+
+    item = await stock(session_factory)
+    assert (item.available_quantity, item.reserved_quantity) == (93, 0)
+    assert sorted(client.deleted()) == [
+        "receipt-order-1", "receipt-order-2", "receipt-order-3"
+    ]
+
+
+async def test_confirming_twice_changes_nothing(session_factory):
+    await reserve(session_factory, 100, {"order-1": 3, "order-2": 4})
+    client = StubSQSClient()
+    events = consumer(session_factory, client)
+
+    # Delivered twice in one batch, then once more
+    await events.handle([message("order-1"), message("order-1", receive_count=2)])
+    await events.handle([message("order-1", receive_count=3)])
+
+    item = await stock(session_factory)
+    assert (item.available_quantity, item.reserved_quantity) == (93, 4)
+    assert len(client.deleted()) == 3
+
+
+async def test_failing_message_does_not_fail_the_batch(session_factory):
+    await reserve(session_factory, 100, {"order-1": 3, "order-2": 4, "order-3": 5})
+    client = StubSQSClient()
+
+    await consumer(session_factory, client, failing={"order-2"}).handle(
+        [message("order-1"), message("order-2"), message("order-3")]
+    )
+
+    item = await stock(session_factory)
+    assert (item.available_quantity, item.reserved_quantity) == (88, 4)
+    # Left on the queue to be delivered again
+    assert client.deleted() == ["receipt-order-1", "receipt-order-3"]
+    assert client.dead_lettered() == []
+
+
+async def test_poison_messages_go_to_the_dead_letter_queue(session_factory):
+    await reserve(session_factory, 100, {"order-1": 3})
+    malformed = {**message("order-2"), "Body": "not json"}
+    exhausted = message("order-3", receive_count=3)
+    client = StubSQSClient()
+
+    await consumer(
+        session_factory,
+        client,
+        failing={"order-3"},
+        dead_letter_queue_url=DEAD_LETTER_QUEUE_URL,
+    ).handle([message("order-1"), malformed, exhausted])
+
+    assert client.calls["send_message_batch"][0]["QueueUrl"] == DEAD_LETTER_QUEUE_URL
+    assert client.dead_lettered() == [malformed["Body"], exhausted["Body"]]
+    assert sorted(client.deleted()) == [
+        "receipt-order-1", "receipt-order-2", "receipt-order-3"
+    ]
+
+
+async def test_poison_messages_stay_queued_when_dead_lettering_fails(session_factory):
+    client = StubSQSClient()
+    client.dead_letter_down = True
+
+    await consumer(
+        session_factory, client, dead_letter_queue_url=DEAD_LETTER_QUEUE_URL
+    ).handle([{**message("order-1"), "Body": "not json"}])
+
+    assert client.deleted() == []
+
+
+async def test_poison_messages_are_dropped_without_dead_letter_queue(session_factory):
+    client = StubSQSClient()
+
+    await consumer(session_factory, client).handle(
+        [{**message("order-1"), "Body": "not json"}]
+    )
+
+    assert "send_message_batch" not in client.calls
+    assert client.deleted() == ["receipt-order-1"]
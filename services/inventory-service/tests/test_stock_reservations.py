@@ -0,0 +1,82 @@
+import asyncio
+
+from src.application.use_cases.confirm_reservations import ConfirmReservationsUseCase
+from src.application.use_cases.release_stock import ReleaseStockUseCase
+from src.application.use_cases.reserve_stock import ReserveStockUseCase
+from src.domain.models.inventory import InventoryItem
+from src.infrastructure.adapters.postgres import PostgresInventoryRepository
+
+
+class RacingRepository(PostgresInventoryRepository):
+    """Looks up reservations only once `before` is set, returns them once `after` is"""
+
+    def __init__(self, session, before: asyncio.Event, after: asyncio.Event):
+        super().__init__(session)
+        self.before = before
+        self.after = after
+        self.checked = asyncio.Event()
+
+    async def find_reservations(self, order_ids):
+        await self.before.wait()
+        reservations = await super().find_reservations(order_ids)
+        self.checked.set()
+        await self.after.wait()
+        return reservations
+
+
+async def stock_levels(session_factory) -> tuple[int, int]:
+    async with session_factory() as session:
+        item = await PostgresInventoryRepository(session).find_by_product_id("p-1")
+    return item.available_quantity, item.reserved_quantity
+
+
+async def run(session_factory, use_case, *args):
+    async with session_factory() as session:
+        return await use_case(PostgresInventoryRepository(session)).execute(*args)
+
+
+async def test_reserve_confirm_and_release(session_factory):
+    async with session_factory() as session:
+        await PostgresInventoryRepository(session).save(InventoryItem("p-1", 100))
+    orders = {"order-1": {"p-1": 3}, "order-2": {"p-1": 4}}
+
+    assert await run(session_factory, ReserveStockUseCase, {"p-1": 7}, orders)
+    # A retried reservation holds nothing more
+    assert await run(session_factory, ReserveStockUseCase, {"p-1": 7}, orders)
+    assert await stock_levels(session_factory) == (93, 7)
+
+    assert await run(session_factory, ConfirmReservationsUseCase, ["order-1"]) == [
+        "order-1"
+    ]
+    assert await run(session_factory, ConfirmReservationsUseCase, ["order-1"]) == []
+    assert await stock_levels(session_factory) == (93, 4)
+
+    released = await run(session_factory, ReleaseStockUseCase, ["order-1", "order-2"])
+    assert sorted(released) == ["order-1", "order-2"]
+    assert await run(session_factory, ReleaseStockUseCase, ["order-1"]) == []
+    assert await stock_levels(session_factory) == (100, 0)
+
+
+async def test_concurrent_reserves_of_one_order_hold_stock_once(session_factory):
+    async with session_factory() as session:
+        await PostgresInventoryRepository(session).save(InventoryItem("p-1", 100))
+    orders = {"order-1": {"p-1": 3}}
+    go, first_committed = asyncio.Event(), asyncio.Event()
+    go.set()
+
+    async with session_factory() as first_session, session_factory() as second_session:
+        # Both find the order holding nothing; the second saves after the first
+        second = RacingRepository(second_session, before=go, after=first_committed)
+        first = RacingRepository(first_session, before=second.checked, after=go)
+
+        async def reserve_first():
+            reserved = await ReserveStockUseCase(first).execute({"p-1": 3}, orders)
+            first_committed.set()
+            return reserved
+
+        reserved = await asyncio.gather(
+            reserve_first(), ReserveStockUseCase(second).execute({"p-1": 3}, orders)
+        )
+
+    assert reserved == [True, True]
+    assert await stock_levels(session_factory) == (97, 3)
@@ -0,0 +1,34 @@
+"""create order number sequence
+
+Revision ID: 3740fc9c83c8
+Revises: 726e12350d2a
+Create Date: 2026-10-19 17:22:48.106935
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3740fc9c83c8'
+down_revision: Union[str, None] = '726e12350d2a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match the increment of ORDER_NUMBER_SEQUENCE in models.py
+ORDER_NUMBER_BLOCK_SIZE = 100
+
+
+def upgrade() -> None:
+    # Each nextval() reserves a block of ORDER_NUMBER_BLOCK_SIZE numbers.
+    # Numbers are formatted as ORD-00000001, which cannot clash with the
+    # eight hex character numbers of existing orders.
+    op.execute(
+        "CREATE SEQUENCE order_number_seq START WITH 1 INCREMENT BY "
+        f"{ORDER_NUMBER_BLOCK_SIZE}"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP SEQUENCE order_number_seq")
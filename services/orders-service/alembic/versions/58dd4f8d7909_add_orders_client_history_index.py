@@ -0,0 +1,35 @@
+"""add orders client history index
+
+Revision ID: 58dd4f8d7909
+Revises: a3ae0780a093
+Create Date: 2026-10-19 13:27:55.618034
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '58dd4f8d7909'
+down_revision: Union[str, None] = 'a3ae0780a093'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_orders_client_id_created_at',
+        'orders',
+        ['client_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_include=['order_number', 'status', 'total'],
+    )
+    # The composite index serves every lookup the single-column one did
+    op.drop_index('ix_orders_client_id', table_name='orders')
+
+
+def downgrade() -> None:
+    op.create_index('ix_orders_client_id', 'orders', ['client_id'], unique=False)
+    op.drop_index('ix_orders_client_id_created_at', table_name='orders')
@@ -0,0 +1,141 @@
+"""partition orders by month
+
+Revision ID: 6fd0433d159d
+Revises: 3740fc9c83c8
+Create Date: 2026-10-19 18:05:12.840377
+
+The existing table is not copied. It becomes the partition orders_legacy,
+covering everything before the start of next month (the cutover). Monthly
+partitions start at the cutover. The slow steps build indexes and validate
+the range check without blocking writes. The swap itself only needs brief
+locks.
+
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6fd0433d159d'
+down_revision: Union[str, None] = '3740fc9c83c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Monthly partitions created past the cutover; PartitionManager keeps extending them
+MONTHS_AHEAD = 3
+
+
+def _add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def upgrade() -> None:
+    now = op.get_bind().execute(sa.text("SELECT timezone('UTC', now())")).scalar()
+    cutover = _add_months(
+        now.replace(day=1, hour=0, minute=0, second=0, microsecond=0), 1
+    )
+
+    # Slow steps first, without blocking writes. They add the (id, created_at)
+    # key that a partition needs and a non-unique order_number index to match
+    # the parent. The validated check lets ATTACH skip its full-table scan.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS orders_legacy_pkey ON "
+            "orders (id, created_at)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS orders_legacy_order_number_idx "
+            "ON orders (order_number)"
+        )
+        op.execute(
+            f"ALTER TABLE orders ADD CONSTRAINT orders_legacy_range "
+            f"CHECK (created_at < '{cutover.isoformat()}') NOT VALID"
+        )
+        op.execute("ALTER TABLE orders VALIDATE CONSTRAINT orders_legacy_range")
+
+    # A foreign key to a partitioned table would have to include created_at
+    op.drop_constraint('order_items_order_id_fkey', 'order_items', type_='foreignkey')
+
+    op.execute("ALTER TABLE orders DROP CONSTRAINT orders_pkey")
+    op.execute(
+        "ALTER TABLE orders ADD CONSTRAINT orders_legacy_pkey PRIMARY KEY USING INDEX "
+        "orders_legacy_pkey"
+    )
+    op.drop_index('ix_orders_order_number', table_name='orders')
+    op.rename_table('orders', 'orders_legacy')
+    op.execute(
+        "ALTER INDEX ix_orders_created_at_id RENAME TO orders_legacy_created_at_id_idx"
+    )
+    op.execute(
+        "ALTER INDEX ix_orders_client_id_created_at RENAME TO "
+        "orders_legacy_client_id_created_at_idx"
+    )
+
+    op.execute("""
+        CREATE TABLE orders (
+            id VARCHAR NOT NULL,
+            order_number VARCHAR NOT NULL,
+            client_id VARCHAR NOT NULL,
+            items JSON NOT NULL,
+            total FLOAT NOT NULL,
+            status orderstatusenum NOT NULL,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            delivery_id VARCHAR,
+            CONSTRAINT orders_pkey PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+    # Matching indexes already on orders_legacy are attached, not rebuilt
+    op.create_index(
+        'ix_orders_created_at_id', 'orders', ['created_at', 'id'], unique=False
+    )
+    op.create_index(
+        'ix_orders_client_id_created_at',
+        'orders',
+        ['client_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_include=['order_number', 'status', 'total'],
+    )
+    op.create_index('ix_orders_order_number', 'orders', ['order_number'], unique=False)
+
+    op.execute(
+        f"ALTER TABLE orders ATTACH PARTITION orders_legacy "
+        f"FOR VALUES FROM (MINVALUE) TO ('{cutover.isoformat()}')"
+    )
+    op.execute("ALTER TABLE orders_legacy DROP CONSTRAINT orders_legacy_range")
+
+    for offset in range(MONTHS_AHEAD + 1):
+        lower = _add_months(cutover, offset)
+        upper = _add_months(lower, 1)
+        op.execute(
+            f"CREATE TABLE orders_p{lower:%Y%m} PARTITION OF orders "
+            f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+        )
+
+
+def downgrade() -> None:
+    # Copies attached partitions back into a plain table; partitions already
+    # detached by maintenance are left as they are
+    op.execute("CREATE TABLE orders_unpartitioned (LIKE orders INCLUDING DEFAULTS)")
+    op.execute("INSERT INTO orders_unpartitioned SELECT * FROM orders")
+    op.execute("DROP TABLE orders")
+    op.rename_table('orders_unpartitioned', 'orders')
+    op.create_primary_key('orders_pkey', 'orders', ['id'])
+    op.create_index('ix_orders_order_number', 'orders', ['order_number'], unique=True)
+    op.create_index(
+        'ix_orders_created_at_id', 'orders', ['created_at', 'id'], unique=False
+    )
+    op.create_index(
+        'ix_orders_client_id_created_at',
+        'orders',
+        ['client_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_include=['order_number', 'status', 'total'],
+    )
+    op.create_foreign_key(
+        'order_items_order_id_fkey', 'order_items', 'orders', ['order_id'], ['id'],
+        ondelete='CASCADE',
+    )
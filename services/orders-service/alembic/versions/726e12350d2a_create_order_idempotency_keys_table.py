@@ -0,0 +1,44 @@
+"""create order idempotency keys table
+
+Revision ID: 726e12350d2a
+Revises: fae43d927c66
+Create Date: 2026-10-19 16:41:09.573312
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '726e12350d2a'
+down_revision: Union[str, None] = 'fae43d927c66'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('order_idempotency_keys',
+    sa.Column('client_id', sa.String(), nullable=False),
+    sa.Column('key', sa.String(), nullable=False),
+    sa.Column('request_hash', sa.String(), nullable=False),
+    sa.Column('order_id', sa.String(), nullable=False),
+    sa.Column('response_status', sa.Integer(), nullable=True),
+    sa.Column('response_body', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('client_id', 'key')
+    )
+    op.create_index(
+        'ix_order_idempotency_keys_created_at',
+        'order_idempotency_keys',
+        ['created_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'ix_order_idempotency_keys_created_at', table_name='order_idempotency_keys'
+    )
+    op.drop_table('order_idempotency_keys')
@@ -0,0 +1,57 @@
+"""add orders in-flight status index
+
+Revision ID: 9dd2263d50cf
+Revises: fda46f5e3084
+Create Date: 2026-10-19 19:41:27.306518
+
+A partial index on the pending and validated orders only. Finished orders
+are never in it, so it stays small however large the table grows.
+
+CREATE INDEX CONCURRENTLY is not supported on a partitioned table. The
+index is created on the parent alone, built concurrently on every
+partition, and each build is then attached. The parent index becomes valid
+once every partition has one. Partitions created later get it
+automatically.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9dd2263d50cf'
+down_revision: Union[str, None] = 'fda46f5e3084'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX = 'ix_orders_in_flight_status_created_at'
+COLUMNS = '(status, created_at, id)'
+PREDICATE = "status IN ('pending', 'validated')"
+
+
+def upgrade() -> None:
+    op.execute(
+        f"CREATE INDEX IF NOT EXISTS {INDEX} ON ONLY orders {COLUMNS} WHERE {PREDICATE}"
+    )
+
+    partitions = op.get_bind().execute(sa.text(
+        "SELECT child.relname FROM pg_inherits "
+        "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+        "WHERE pg_inherits.inhparent = 'orders'::regclass ORDER BY child.relname"
+    )).scalars().all()
+
+    with op.get_context().autocommit_block():
+        for partition in partitions:
+            index = f"{partition}_status_created_at_id_idx"
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index} "
+                f"ON {partition} {COLUMNS} WHERE {PREDICATE}"
+            )
+            op.execute(f"ALTER INDEX {INDEX} ATTACH PARTITION {index}")
+
+
+def downgrade() -> None:
+    # Drops the partition indexes along with it
+    op.drop_index(INDEX, table_name='orders')
@@ -0,0 +1,79 @@
+"""create order_items table
+
+Revision ID: 9f1ab271ba44
+Revises: 0cc536f89299
+Create Date: 2026-10-19 09:12:41.503218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9f1ab271ba44'
+down_revision: Union[str, None] = '0cc536f89299'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Orders copied per statement while backfilling order_items
+BACKFILL_BATCH_SIZE = 5000
+
+
+def upgrade() -> None:
+    op.create_table('order_items',
+    sa.Column('order_id', sa.String(), nullable=False),
+    sa.Column('line_number', sa.Integer(), nullable=False),
+    sa.Column('product_id', sa.String(), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.Column('price', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['order_id'], ['orders.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('order_id', 'line_number')
+    )
+
+    # Backfill from orders.items in id-ordered batches so no single statement
+    # has to unnest the whole table at once
+    connection = op.get_bind()
+    last_id = ''
+    while True:
+        batch_end = connection.execute(
+            sa.text(
+                "SELECT max(id) FROM ("
+                " SELECT id FROM orders WHERE id > :last_id ORDER BY id "
+                "LIMIT :batch_size"
+                ") AS batch"
+            ),
+            {"last_id": last_id, "batch_size": BACKFILL_BATCH_SIZE},
+        ).scalar()
+        if batch_end is None:
+            break
+
+        connection.execute(
+            sa.text(
+                "INSERT INTO order_items (order_id, line_number, product_id, "
+                "quantity, price) "
+                "SELECT o.id, line.position, line.item->>'product_id', "
+                "(line.item->>'quantity')::int, (line.item->>'price')::float "
+                "FROM orders o "
+                "CROSS JOIN LATERAL json_array_elements(o.items) "
+                "WITH ORDINALITY AS line(item, position) "
+                "WHERE o.id > :last_id AND o.id <= :batch_end"
+            ),
+            {"last_id": last_id, "batch_end": batch_end},
+        )
+        last_id = batch_end
+
+    # Built after the backfill so the rows are indexed in one pass
+    op.create_index(
+        'ix_order_items_product_id_order_id',
+        'order_items',
+        ['product_id', 'order_id'],
+        unique=False,
+        postgresql_include=['quantity'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_order_items_product_id_order_id', table_name='order_items')
+    op.drop_table('order_items')
@@ -0,0 +1,28 @@
+"""add cancelled order status
+
+Revision ID: a363acc7b16a
+Revises: 9dd2263d50cf
+Create Date: 2026-10-19 20:34:12.581904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a363acc7b16a'
+down_revision: Union[str, None] = '9dd2263d50cf'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A new enum value cannot be used in the transaction that adds it
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE orderstatusenum ADD VALUE IF NOT EXISTS 'cancelled'")
+
+
+def downgrade() -> None:
+    # PostgreSQL cannot drop a value from an enum type; an unused value is harmless
+    pass
@@ -0,0 +1,39 @@
+"""add orders created_at id index
+
+Revision ID: a3ae0780a093
+Revises: 9f1ab271ba44
+Create Date: 2026-10-19 11:04:17.220913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3ae0780a093'
+down_revision: Union[str, None] = '9f1ab271ba44'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built concurrently, so orders takes writes while it builds; that
+    # cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_orders_created_at_id',
+            'orders',
+            ['created_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_orders_created_at_id',
+            table_name='orders',
+            postgresql_concurrently=True,
+        )
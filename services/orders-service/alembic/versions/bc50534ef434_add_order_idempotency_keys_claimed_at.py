@@ -0,0 +1,30 @@
+"""add order idempotency keys claimed_at
+
+Revision ID: bc50534ef434
+Revises: a363acc7b16a
+Create Date: 2026-10-19 22:05:41.308517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'bc50534ef434'
+down_revision: Union[str, None] = 'a363acc7b16a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'order_idempotency_keys', sa.Column('claimed_at', sa.DateTime(), nullable=True)
+    )
+    op.execute("UPDATE order_idempotency_keys SET claimed_at = created_at")
+    op.alter_column('order_idempotency_keys', 'claimed_at', nullable=False)
+
+
+def downgrade() -> None:
+    op.drop_column('order_idempotency_keys', 'claimed_at')
@@ -0,0 +1,78 @@
+"""create order sales rollup tables
+
+Revision ID: deef851978fe
+Revises: 6fd0433d159d
+Create Date: 2026-10-19 18:52:37.204918
+
+The tables start empty. Once the new code is deployed, fill them with
+`python -m src.infrastructure.adapters.postgres.sales_rollups`.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'deef851978fe'
+down_revision: Union[str, None] = '6fd0433d159d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _totals() -> list[sa.Column]:
+    return [
+        sa.Column('orders', sa.Integer(), nullable=False),
+        sa.Column('units', sa.BigInteger(), nullable=False),
+        sa.Column('revenue', sa.Float(), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table('order_sales_daily',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    *_totals(),
+    sa.PrimaryKeyConstraint('day', 'status')
+    )
+    op.create_table('order_sales_daily_product',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('product_id', sa.String(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    *_totals(),
+    sa.PrimaryKeyConstraint('day', 'product_id', 'status')
+    )
+    op.create_index(
+        'ix_order_sales_daily_product_product_id_day',
+        'order_sales_daily_product',
+        ['product_id', 'day'],
+        unique=False,
+    )
+    op.create_table('order_sales_daily_client',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('client_id', sa.String(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    *_totals(),
+    sa.PrimaryKeyConstraint('day', 'client_id', 'status')
+    )
+    op.create_index(
+        'ix_order_sales_daily_client_client_id_day',
+        'order_sales_daily_client',
+        ['client_id', 'day'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'ix_order_sales_daily_client_client_id_day',
+        table_name='order_sales_daily_client',
+    )
+    op.drop_table('order_sales_daily_client')
+    op.drop_index(
+        'ix_order_sales_daily_product_product_id_day',
+        table_name='order_sales_daily_product',
+    )
+    op.drop_table('order_sales_daily_product')
+    op.drop_table('order_sales_daily')
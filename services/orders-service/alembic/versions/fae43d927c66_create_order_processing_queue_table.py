@@ -0,0 +1,42 @@
+"""create order processing queue table
+
+Revision ID: fae43d927c66
+Revises: 58dd4f8d7909
+Create Date: 2026-10-19 15:04:37.228196
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fae43d927c66'
+down_revision: Union[str, None] = '58dd4f8d7909'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('order_processing_queue',
+    sa.Column('order_id', sa.String(), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('available_at', sa.DateTime(), nullable=False),
+    sa.Column('last_error', sa.String(), nullable=True),
+    sa.Column('enqueued_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('order_id')
+    )
+    op.create_index(
+        'ix_order_processing_queue_available_at',
+        'order_processing_queue',
+        ['available_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'ix_order_processing_queue_available_at', table_name='order_processing_queue'
+    )
+    op.drop_table('order_processing_queue')
@@ -0,0 +1,31 @@
+"""add orders version
+
+Revision ID: fda46f5e3084
+Revises: deef851978fe
+Create Date: 2026-10-19 19:24:08.517392
+
+A constant default: the column is added to every partition without
+rewriting them.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fda46f5e3084'
+down_revision: Union[str, None] = 'deef851978fe'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'orders', sa.Column('version', sa.Integer(), server_default='1', nullable=False)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('orders', 'version')
@@ -0,0 +1,105 @@
+"""
+Insert throughput of order ID generators against PostgreSQL.
+
+Each generator fills its own scratch table, shaped like `orders` (string
+primary key, unique order number), and the script reports rows per second
+plus the final size of the primary key index. Random keys touch a
+different leaf page on every insert, so they fall behind once the index
+no longer fits in shared_buffers. Use a row count well above that size to
+see the difference.
+
+Usage (from services/orders-service):
+    uv run python -m benchmarks.order_id_inserts --rows 2000000
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.domain.models.order_ids import ORDER_ID_GENERATORS
+from src.infrastructure.adapters.postgres.order_numbers import format_order_number
+from src.infrastructure.config.settings import settings
+
+
+async def bench_inserts(engine, name: str, rows: int, batch_size: int) -> None:
+    generator = ORDER_ID_GENERATORS[name]()
+    table = f"bench_order_ids_{name}"
+
+    async with engine.begin() as connection:
+        await connection.execute(text(f"DROP TABLE IF EXISTS {table}"))
+        await connection.execute(text(
+            f"CREATE UNLOGGED TABLE {table} ("
+            " id varchar PRIMARY KEY,"
+            " order_number varchar NOT NULL UNIQUE,"
+            " created_at timestamp NOT NULL DEFAULT now())"
+        ))
+
+    insert = text(f"INSERT INTO {table} (id, order_number) VALUES (:id, :order_number)")
+    started = time.perf_counter()
+    for start in range(0, rows, batch_size):
+        batch = [
+            {"id": generator.new_id(), "order_number": format_order_number(n)}
+            for n in range(start, min(start + batch_size, rows))
+        ]
+        async with engine.begin() as connection:
+            await connection.execute(insert, batch)
+    elapsed = time.perf_counter() - started
+
+    async with engine.connect() as connection:
+        index_bytes = await connection.scalar(
+            text(f"SELECT pg_relation_size('{table}_pkey')")
+        )
+        await connection.execute(text(f"DROP TABLE {table}"))
+        await connection.commit()
+
+    print(
+        f"{name:>6}: {rows / elapsed:>10,.0f} rows/s"
+        f"  ({elapsed:.1f}s, pkey index {index_bytes / 1024 / 1024:,.1f} MiB)"
+    )
+
+
+def bench_generation(rounds: int) -> None:
+    for name, generator_class in ORDER_ID_GENERATORS.items():
+        generator = generator_class()
+        started = time.perf_counter()
+        for _ in range(rounds):
+            generator.new_id()
+        elapsed = time.perf_counter() - started
+        print(f"{name:>6}: {rounds / elapsed:>10,.0f} ids/s generated in process")
+
+    # The previous order number scheme, for the collision rate
+    seen = set()
+    for attempt in range(1, rounds + 1):
+        number = str(uuid.uuid4())[:8].upper()
+        if number in seen:
+            print(f"legacy order_number: first collision after {attempt:,} numbers")
+            break
+        seen.add(number)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--generators", nargs="+", default=list(ORDER_ID_GENERATORS))
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    args = parser.parse_args()
+
+    bench_generation(min(args.rows, 1_000_000))
+
+    engine = create_async_engine(args.database_url)
+    try:
+        for name in args.generators:
+            await bench_inserts(engine, name, args.rows, args.batch_size)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
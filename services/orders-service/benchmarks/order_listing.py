@@ -0,0 +1,133 @@
+"""
+CPU cost of serving one page of GET /api/v1/orders, no database needed.
+
+Both paths start from the rows the driver returns (items still JSON text)
+and end with the response body:
+
+- models: parse items with json.loads, build Order and OrderItem domain
+  objects, then an OrderResponse per order, which FastAPI validates and
+  encodes through its response_model
+- views:  parse items with pydantic_core, map rows onto OrderView and
+  encode the page with pydantic_core.to_json
+
+Usage (from services/orders-service):
+    uv run python -m benchmarks.order_listing --page-size 1000 --items 3
+"""
+
+import argparse
+import json
+import random
+import time
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from pydantic_core import from_json, to_json
+
+from src.domain.models.order import OrderStatus, OrderView
+from src.infrastructure.adapters.postgres.order_repository_impl import (
+    PostgresOrderRepository,
+)
+from src.infrastructure.api.controllers.order_controller import _to_order_response
+from src.infrastructure.api.dto.order_dto import OrderResponse
+
+OrderRow = namedtuple(
+    "OrderRow",
+    [
+        "id", "order_number", "client_id", "items", "total", "status", "created_at",
+        "delivery_id",
+    ],
+)
+
+RESPONSE_ADAPTER = TypeAdapter(list[OrderResponse])
+
+
+def make_rows(count: int, items: int) -> list[tuple]:
+    rng = random.Random(42)
+    now = datetime(2026, 1, 1)
+    rows = []
+    for n in range(count):
+        lines = [
+            {
+                "product_id": f"prod-{rng.randrange(10_000)}",
+                "quantity": rng.randint(1, 5),
+                "price": round(rng.uniform(1, 100), 2),
+            }
+            for _ in range(items)
+        ]
+        rows.append((
+            f"0190{n:028x}",
+            f"ORD-{n:08d}",
+            f"client-{rng.randrange(1000)}",
+            json.dumps(lines),
+            sum(line["quantity"] * line["price"] for line in lines),
+            "created",
+            now - timedelta(seconds=n),
+            f"delivery-{n:08x}",
+        ))
+    return rows
+
+
+def models_page(rows: list[tuple]) -> bytes:
+    repository = PostgresOrderRepository.__new__(PostgresOrderRepository)
+    orders = [
+        repository._to_domain(OrderRow(*row[:3], json.loads(row[3]), *row[4:]))
+        for row in rows
+    ]
+    responses = [_to_order_response(order) for order in orders]
+    # What FastAPI does with a response_model: validate, dump, encode
+    content = RESPONSE_ADAPTER.dump_python(
+        RESPONSE_ADAPTER.validate_python(responses), mode="json"
+    )
+    return JSONResponse(content).body
+
+
+def views_page(rows: list[tuple]) -> bytes:
+    return to_json([
+        OrderView(
+            id,
+            order_number,
+            client_id,
+            from_json(items),
+            total,
+            OrderStatus(status),
+            created_at,
+            delivery_id,
+        )
+        for (
+            id, order_number, client_id, items, total, status, created_at, delivery_id
+        ) in rows
+    ])
+
+
+def bench(name: str, render, rows: list[tuple], rounds: int) -> float:
+    render(rows)  # warm up
+    started = time.process_time()
+    for _ in range(rounds):
+        body = render(rows)
+    per_page = (time.process_time() - started) / rounds
+    print(f"{name:>6}: {per_page * 1000:7.2f} ms CPU per page  ({len(body):,} bytes)")
+    return per_page
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--items", type=int, default=3, help="Items per order")
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    rows = make_rows(args.page_size, args.items)
+    same = json.loads(models_page(rows)) == json.loads(views_page(rows))
+    assert same, "paths disagree"
+
+    models = bench("models", models_page, rows, args.rounds)
+    views = bench("views", views_page, rows, args.rounds)
+    print(f"{models / views:.1f}x less CPU per page")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,26 @@ import logging
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from prometheus_fastapi_instrumentator import Instrumentator
 from src.infrastructure.api.controllers.order_controller import router as order_router
+from src.infrastructure.api.controllers.client_controller import router as client_router
 from src.infrastructure.api.controllers.health_controller import router as health_router
+from src.domain.models.order_ids import ORDER_ID_GENERATORS, set_order_id_generator
+from src.infrastructure.adapters.postgres.session import (
+    partition_manager, replica_monitor
+)
+from src.infrastructure.api.conditional import ETAG_HEADER
+from src.infrastructure.api.consistency import read_your_writes_middleware
+from src.infrastructure.api.dependencies import (
+    get_event_publisher,
+    get_order_processing_worker,
+    get_order_recovery_worker,
+)
 from src.infrastructure.config.settings import settings
 from src.infrastructure.api.exception_handlers import EXCEPTION_HANDLERS
+from src.infrastructure.api.idempotency import IDEMPOTENT_REPLAYED_HEADER
+from src.infrastructure.api.pagination import NEXT_CURSOR_HEADER
 
 # Configure logging
 logging.basicConfig(
@@ -17,6 +32,8 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+set_order_id_generator(ORDER_ID_GENERATORS[settings.ORDER_ID_GENERATOR]())
+
 # Create FastAPI app
 app = FastAPI(
     title="Orders Service",
@@ -53,12 +70,16 @@ This service implements hexagonal architecture (ports and adapters) with:
 5. **Order Confirmation**: Order is created with delivery date
 6. **Event Publishing**: Order events are published for downstream processing
 
+With `Prefer: respond-async` (when enabled), the order is saved as `pending` and
+the API answers `202 Accepted`; steps 3-6 then run in a background worker.
+
 ### Order Statuses
 
 - `pending`: Order created but not yet validated
 - `validated`: Order passed business rule validation
 - `created`: Order successfully created and stock reserved
 - `rejected`: Order rejected due to validation or stock issues
+- `cancelled`: Created order cancelled and its stock released
 
 ### Business Rules
 
@@ -93,8 +114,23 @@ app.add_middleware(
     allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[
+        NEXT_CURSOR_HEADER, "Location", IDEMPOTENT_REPLAYED_HEADER, ETAG_HEADER
+    ],
 )
 
+# Compress larger responses (order lists, exports) for clients sending Accept-Encoding:
+# gzip
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=settings.GZIP_MINIMUM_SIZE,
+    compresslevel=settings.GZIP_COMPRESS_LEVEL,
+)
+
+# Route reads to the primary for a short window after a client's own write
+if replica_monitor is not None:
+    app.middleware("http")(read_your_writes_middleware)
+
 # Register exception handlers
 for exception_class, handler in EXCEPTION_HANDLERS.items():
     app.add_exception_handler(exception_class, handler)
@@ -108,6 +144,7 @@ instrumentator.instrument(app).expose(app, endpoint="/api/v1/orders/metrics")
 # Include routers - ORDER MATTERS! Health router must come before order router, and metrics must be registered before order router
 app.include_router(health_router)
 app.include_router(order_router)
+app.include_router(client_router)
 
 
 @app.on_event("startup")
@@ -115,11 +152,31 @@ async def startup():
     logger.info(f"Starting {settings.APP_NAME} on port {settings.PORT}")
     logger.info(f"Environment: {settings.ENVIRONMENT}")
     logger.info("Prometheus metrics enabled at /api/v1/orders/metrics")
+    if replica_monitor is not None:
+        replica_monitor.start()
+        logger.info("Read replica enabled, monitoring replication lag")
+    if settings.ORDERS_PARTITION_MAINTENANCE_ENABLED:
+        partition_manager.start()
+    if settings.ASYNC_ORDER_ACCEPTANCE_ENABLED and settings.ORDER_WORKER_ENABLED:
+        get_order_processing_worker().start()
+        logger.info(
+            "Asynchronous order acceptance enabled, order processing worker started"
+        )
+    if settings.ORDER_RECOVERY_ENABLED:
+        get_order_recovery_worker().start()
+        logger.info("Stuck order recovery worker started")
 
 
 @app.on_event("shutdown")
 async def shutdown():
     logger.info(f"Shutting down {settings.APP_NAME}")
+    # Stop the worker first so its last events still go through the publisher
+    await get_order_processing_worker().stop()
+    await get_order_recovery_worker().stop()
+    await get_event_publisher().close()
+    if replica_monitor is not None:
+        await replica_monitor.stop()
+    await partition_manager.stop()
 
 
 if __name__ == "__main__":
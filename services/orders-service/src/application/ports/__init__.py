@@ -1,4 +1,17 @@
 from .event_publisher import EventPublisher
+from .idempotency_store import IdempotencyRecord, IdempotencyStore
 from .inventory_service import InventoryService
+from .order_archive import OrderArchive
+from .order_history_store import OrderHistoryStore
+from .order_queue import OrderQueue, QueuedOrder
 
-__all__ = ["InventoryService", "EventPublisher"]
\ No newline at end of file
+__all__ = [
+    "InventoryService",
+    "EventPublisher",
+    "IdempotencyRecord",
+    "IdempotencyStore",
+    "OrderArchive",
+    "OrderHistoryStore",
+    "OrderQueue",
+    "QueuedOrder",
+]
\ No newline at end of file
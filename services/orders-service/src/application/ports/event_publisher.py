@@ -12,4 +12,22 @@ class EventPublisher(ABC):
             event_type: Type of event (e.g., "OrderCreated")
             payload: Event data
         """
-        pass
\ No newline at end of file
+        pass
+
+    async def publish_batch(
+        self, event_type: str, payloads: list[dict[str, Any]]
+    ) -> None:
+        """
+        Publish several events of the same type
+        Args:
+            event_type: Type of event (e.g., "OrderCreated")
+            payloads: Event data, one per event
+        """
+        for payload in payloads:
+            await self.publish(event_type, payload)
+
+    async def close(self) -> None:
+        """
+        Flush pending events and release resources on shutdown
+        """
+        pass
@@ -0,0 +1,74 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+
+@dataclass
+class IdempotencyRecord:
+    """A stored Idempotency-Key and, once finished, the response it produced"""
+    client_id: str
+    key: str
+    request_hash: str
+    order_id: str
+    created_at: datetime
+    # Last time the request holding the key showed it is still running
+    claimed_at: datetime
+    response_status: int | None = None
+    response_body: Any = None
+
+    @property
+    def completed(self) -> bool:
+        return self.response_status is not None
+
+
+class IdempotencyStore(ABC):
+
+    @abstractmethod
+    async def claim(
+        self, client_id: str, key: str, request_hash: str, order_id: str
+    ) -> IdempotencyRecord | None:
+        """
+        Atomically register a key for a new request. A key whose owner
+        stopped renewing it, or whose TTL is over, is taken over.
+        Returns None if this caller now owns the key, or the existing record.
+        """
+        pass
+
+    @abstractmethod
+    async def renew(self, client_id: str, key: str, order_id: str) -> bool:
+        """
+        Extend the lease of a key owned by the request creating `order_id`
+        Returns: False if the key is no longer owned by that request
+        """
+        pass
+
+    @abstractmethod
+    async def get(self, client_id: str, key: str) -> IdempotencyRecord | None:
+        """
+        Look up a key
+        """
+        pass
+
+    @abstractmethod
+    async def complete(
+        self,
+        client_id: str,
+        key: str,
+        order_id: str,
+        response_status: int,
+        response_body: Any,
+    ) -> None:
+        """
+        Store the final response of the request creating `order_id`, if it
+        still owns the key
+        """
+        pass
+
+    @abstractmethod
+    async def release(self, client_id: str, key: str, order_id: str) -> None:
+        """
+        Forget a key owned by the request creating `order_id`, so a retry
+        runs the request again
+        """
+        pass
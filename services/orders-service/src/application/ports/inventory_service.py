@@ -2,20 +2,53 @@ from abc import ABC, abstractmethod
 
 
 class InventoryService(ABC):
+
+    # Limits of a single reserve_stock call
+    MAX_RESERVE_PRODUCTS = 50
+    MAX_RESERVE_QUANTITY = 10000
     
     @abstractmethod
     async def check_stock(self, product_ids: list[str]) -> dict[str, int]:
         """
         Check stock availability for products
         Returns: Dict with product_id as key and available quantity as value
+        Raises: On any error, so an outage is not taken for missing stock
         """
         pass
     
     @abstractmethod
-    async def reserve_stock(self, items: dict[str, int]) -> bool:
+    async def reserve_stock(
+        self, items: dict[str, int], orders: dict[str, dict[str, int]] | None = None
+    ) -> bool:
         """
         Reserve stock for order items
-        Args: Dict with product_id as key and quantity to reserve as value
-        Returns: True if reservation successful, False otherwise
+        Args: Dict with product_id as key and quantity to reserve as value,
+              and optionally the same items broken down by order id. Inventory
+              then records each order's reservation and never reserves an
+              order twice, so reserving again after a crash is safe.
+        Returns: True if reservation successful, False if inventory refused
+                 it for lack of stock
+        Raises: On any other error. The reservation may still have been
+                applied, so the orders must be reserved again or released.
+        """
+        pass
+
+    @abstractmethod
+    async def find_reservations(
+        self, order_ids: list[str]
+    ) -> dict[str, dict[str, int]]:
+        """
+        Stock recorded as held by each order, per product; orders holding
+        none are left out
+        Raises: On any error, as an unreachable inventory proves nothing
+        """
+        pass
+
+    @abstractmethod
+    async def release_stock(self, order_ids: list[str]) -> list[str]:
+        """
+        Release the stock held by orders, summed per product by inventory
+        Returns: The orders whose stock was released
+        Raises: On any error, so the caller can retry
         """
         pass
\ No newline at end of file
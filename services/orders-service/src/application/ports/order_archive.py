@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from src.domain.models.order import Order
+
+
+class OrderArchive(ABC):
+
+    @abstractmethod
+    async def write_segment(self, orders: list[Order]) -> str:
+        """
+        Store orders in a new immutable segment and return its name. The
+        segment is durable once this returns.
+        """
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, order_id: str) -> Order | None:
+        """
+        Look up an archived order
+        """
+        pass
+
+    @abstractmethod
+    async def archived_before(self) -> datetime | None:
+        """
+        A bound every archived order was created before, None while the
+        archive is empty
+        """
+        pass
+
+    async def find_by_ids(self, order_ids: list[str]) -> dict[str, Order]:
+        """
+        Look up many archived orders; ids not found are left out
+        """
+        orders = {}
+        for order_id in dict.fromkeys(order_ids):
+            order = await self.find_by_id(order_id)
+            if order is not None:
+                orders[order_id] = order
+        return orders
@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from src.domain.models.order import Order
+
+
+class OrderHistoryStore(ABC):
+    """Append-only copy of settled orders for analytics"""
+
+    @abstractmethod
+    async def watermark(self) -> tuple[datetime, str] | None:
+        """
+        (created_at, id) of the last exported order, or None before the
+        first export
+        """
+        pass
+
+    @abstractmethod
+    async def append(self, orders: list[Order]) -> None:
+        """
+        Write a batch of orders of the current run, in (created_at, id)
+        order. Nothing is visible until commit.
+        """
+        pass
+
+    @abstractmethod
+    async def commit(self, watermark: tuple[datetime, str]) -> None:
+        """
+        Finish the files of the current run, then advance the watermark
+        """
+        pass
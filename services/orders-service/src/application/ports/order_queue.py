@@ -0,0 +1,48 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass
+class QueuedOrder:
+    """An order claimed from the processing queue"""
+    order_id: str
+    attempts: int
+
+
+class OrderQueue(ABC):
+
+    @abstractmethod
+    async def enqueue(self, order_id: str) -> None:
+        """
+        Queue an accepted order for background processing
+        """
+        pass
+
+    @abstractmethod
+    async def claim(self, limit: int, lease_seconds: float) -> list[QueuedOrder]:
+        """
+        Claim up to `limit` due orders. A claimed order is hidden from other
+        workers until the lease expires, so a crashed worker's orders come back.
+        """
+        pass
+
+    @abstractmethod
+    async def complete(self, order_id: str) -> None:
+        """
+        Remove a processed order from the queue
+        """
+        pass
+
+    @abstractmethod
+    async def retry(self, order_id: str, delay_seconds: float, error: str) -> None:
+        """
+        Release a claimed order so it is processed again after a delay
+        """
+        pass
+
+    @abstractmethod
+    async def depth(self) -> int:
+        """
+        Number of orders waiting or being processed
+        """
+        pass
@@ -1,4 +1,23 @@
+from .accept_order import AcceptOrderUseCase
+from .archive_orders import ArchiveOrdersUseCase
 from .create_order import CreateOrderUseCase
+from .create_orders_batch import BatchOrderOutcome, CreateOrdersBatchUseCase
+from .export_order_history import ExportOrderHistoryUseCase
+from .export_orders import ExportOrdersUseCase
+from .forecast_demand import ForecastDemandUseCase, ReorderPoint
 from .get_order import GetOrderUseCase
+from .process_order import ProcessOrderUseCase
 
-__all__ = ["CreateOrderUseCase", "GetOrderUseCase"]
\ No newline at end of file
+__all__ = [
+    "AcceptOrderUseCase",
+    "ArchiveOrdersUseCase",
+    "BatchOrderOutcome",
+    "CreateOrderUseCase",
+    "CreateOrdersBatchUseCase",
+    "ExportOrderHistoryUseCase",
+    "ExportOrdersUseCase",
+    "ForecastDemandUseCase",
+    "GetOrderUseCase",
+    "ProcessOrderUseCase",
+    "ReorderPoint",
+]
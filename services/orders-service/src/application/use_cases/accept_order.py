@@ -0,0 +1,48 @@
+import logging
+
+from src.application.ports.order_queue import OrderQueue
+from src.domain.exceptions import BusinessRuleViolationException
+from src.domain.models.order import Order
+from src.domain.repositories.order_repository import OrderRepository
+
+logger = logging.getLogger(__name__)
+
+
+class AcceptOrderUseCase:
+    """
+    Asynchronous order intake: persist the order as PENDING and queue it.
+    Inventory checks, reservation and publishing run later in
+    ProcessOrderUseCase, driven by the order processing worker.
+    """
+
+    def __init__(self, order_repository: OrderRepository, order_queue: OrderQueue):
+        self.order_repository = order_repository
+        self.order_queue = order_queue
+
+    async def execute(self, order: Order) -> Order:
+        """
+        Accept a new order for background processing
+        """
+
+        # 1. Validate business rules - cheap, so rejected up front
+        is_valid, error_message = order.validate_business_rules()
+        if not is_valid:
+            order.reject()
+            await self.order_repository.save(order)
+            logger.warning(f"Order {order.id} rejected: {error_message}")
+            raise BusinessRuleViolationException(error_message)
+
+        # 2. Save pending order
+        order = await self.order_repository.save(order)
+
+        # 3. Queue it for the worker
+        try:
+            await self.order_queue.enqueue(order.id)
+        except Exception as e:
+            logger.error(f"Failed to queue order {order.id}: {str(e)}")
+            order.reject()
+            await self.order_repository.save(order)
+            raise
+
+        logger.info(f"Order {order.id} accepted and queued for processing")
+        return order
@@ -0,0 +1,63 @@
+import logging
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime
+
+from src.application.ports.order_archive import OrderArchive
+from src.domain.models.order import Order, OrderStatus
+from src.domain.repositories.order_repository import OrderRepository
+
+logger = logging.getLogger(__name__)
+
+# Orders that will not change again; anything still in flight stays hot.
+# Created orders can still be cancelled, which only finds them while hot.
+ARCHIVABLE_STATUSES = [OrderStatus.REJECTED, OrderStatus.CANCELLED]
+
+
+class ArchiveOrdersUseCase:
+
+    def __init__(
+        self,
+        repository_scope: Callable[[], AbstractAsyncContextManager[OrderRepository]],
+        order_archive: OrderArchive,
+        segment_size: int
+    ):
+        self.repository_scope = repository_scope
+        self.order_archive = order_archive
+        self.segment_size = segment_size
+
+    async def execute(self, created_before: datetime) -> int:
+        """Move finished orders created before the cutoff into the archive"""
+        logger.info(f"Archiving orders created before {created_before}")
+
+        archived = 0
+        try:
+            # Read on one session while deletes commit on another, so the
+            # cursor keeps going after each segment is flushed
+            async with self.repository_scope() as reader:
+                segment: list[Order] = []
+                async for order in reader.stream_orders(
+                    created_to=created_before, statuses=ARCHIVABLE_STATUSES
+                ):
+                    segment.append(order)
+                    if len(segment) >= self.segment_size:
+                        archived += await self._archive(segment)
+                        segment = []
+                if segment:
+                    archived += await self._archive(segment)
+
+            logger.info(f"Successfully archived {archived} orders")
+            return archived
+        except Exception as e:
+            logger.error(f"Error archiving orders after {archived} rows: {str(e)}")
+            raise
+
+    async def _archive(self, orders: list[Order]) -> int:
+        # Rows are only deleted once their segment is stored. A crash in
+        # between leaves them in both places, which lookups tolerate.
+        name = await self.order_archive.write_segment(orders)
+        async with self.repository_scope() as writer:
+            await writer.delete_all(orders)
+
+        logger.info(f"Archived {len(orders)} orders to segment {name}")
+        return len(orders)
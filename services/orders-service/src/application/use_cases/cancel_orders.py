@@ -0,0 +1,144 @@
+import logging
+from dataclasses import dataclass
+
+from src.application.ports.event_publisher import EventPublisher
+from src.application.ports.inventory_service import InventoryService
+from src.domain.exceptions import (
+    ExternalServiceException,
+    OrderCancellationException,
+    OrderNotFoundException,
+)
+from src.domain.models.order import Order, OrderStatus
+from src.domain.repositories.order_repository import OrderRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CancelOutcome:
+    """One requested id: the cancelled order, or why it was not cancelled"""
+    order_id: str
+    order: Order | None = None
+    error: str | None = None
+
+
+def order_cancelled_payload(order: Order) -> dict:
+    """Build the OrderCancelled event payload"""
+    return {
+        "order_id": order.id,
+        "order_number": order.order_number,
+        "client_id": order.client_id,
+        "items": [
+            {"product_id": item.product_id, "quantity": item.quantity}
+            for item in order.items
+        ],
+        "delivery_id": order.delivery_id,
+    }
+
+
+class CancelOrdersUseCase:
+    """
+    Cancel created orders and give their stock back to inventory.
+
+    However many orders and lines are cancelled together, the stock is
+    released with a single call: inventory sums the reservations of the
+    orders per product and releases them in one transaction.
+
+    Orders reserved before inventory recorded reservations per order have
+    nothing inventory could release, so they are not cancelled.
+    """
+
+    def __init__(
+        self,
+        order_repository: OrderRepository,
+        inventory_service: InventoryService,
+        event_publisher: EventPublisher
+    ):
+        self.order_repository = order_repository
+        self.inventory_service = inventory_service
+        self.event_publisher = event_publisher
+
+    async def execute(self, order_ids: list[str]) -> list[CancelOutcome]:
+        """
+        Cancel orders in one transaction. Orders already cancelled are
+        returned as they are; orders not found, not cancellable or without
+        a recorded reservation get an error and are left unchanged.
+        Returns: One outcome per distinct id, in request order
+        """
+        order_ids = list(dict.fromkeys(order_ids))
+        # Locked so a concurrent status change cannot slip in between
+        orders = await self.order_repository.lock_by_ids(order_ids)
+
+        # 1. Look up what each created order holds, with one call
+        created = [
+            order.id for order in orders.values() if order.status == OrderStatus.CREATED
+        ]
+        held: dict[str, dict[str, int]] = {}
+        if created:
+            try:
+                held = await self.inventory_service.find_reservations(created)
+            except Exception as e:
+                raise ExternalServiceException(
+                    f"Inventory service unavailable: {str(e)}"
+                )
+
+        outcomes = []
+        cancelled = []
+        for order_id in order_ids:
+            order = orders.get(order_id)
+            if order is None:
+                outcomes.append(
+                    CancelOutcome(order_id, error=f"Order {order_id} not found")
+                )
+                continue
+            if order.status == OrderStatus.CANCELLED:
+                outcomes.append(CancelOutcome(order_id, order=order))
+                continue
+            if order.status == OrderStatus.CREATED and order_id not in held:
+                # Its stock would be lost: only per-order reservations can be released
+                outcomes.append(CancelOutcome(
+                    order_id,
+                    order=order,
+                    error=(
+                        f"Order {order_id} has no recorded stock "
+                        "reservation to release"
+                    ),
+                ))
+                continue
+            try:
+                order.cancel()
+            except ValueError as e:
+                outcomes.append(CancelOutcome(order_id, order=order, error=str(e)))
+                continue
+            cancelled.append(order)
+            outcomes.append(CancelOutcome(order_id, order=order))
+
+        if not cancelled:
+            return outcomes
+
+        # 2. Release the stock of every cancelled order with one call
+        try:
+            await self.inventory_service.release_stock(
+                [order.id for order in cancelled]
+            )
+        except Exception as e:
+            raise ExternalServiceException(f"Stock release failed: {str(e)}")
+
+        # 3. Save the new statuses in one bulk update, which ends the locks
+        await self.order_repository.save_all(cancelled)
+
+        await self.event_publisher.publish_batch(
+            "OrderCancelled", [order_cancelled_payload(order) for order in cancelled]
+        )
+
+        logger.info(f"Cancelled {len(cancelled)} orders")
+        return outcomes
+
+    async def cancel(self, order_id: str) -> Order:
+        """Cancel one order; cancelling an already cancelled order is a no-op"""
+        outcome = (await self.execute([order_id]))[0]
+        if outcome.order is None:
+            raise OrderNotFoundException(outcome.error)
+        if outcome.error is not None:
+            raise OrderCancellationException(outcome.error)
+        return outcome.order
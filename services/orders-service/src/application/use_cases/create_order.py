@@ -74,7 +74,9 @@ class CreateOrderUseCase:
             }
 
             try:
-                stock_reserved = await self.inventory_service.reserve_stock(items_to_reserve)
+                stock_reserved = await self.inventory_service.reserve_stock(
+                    items_to_reserve, {order.id: items_to_reserve}
+                )
             except Exception as e:
                 logger.error(f"Failed to reserve stock for order {order.id}: {str(e)}")
                 raise ExternalServiceException(f"Stock reservation service unavailable: {str(e)}")
@@ -87,7 +89,7 @@ class CreateOrderUseCase:
             
             # 6. Confirm order and set delivery date
             order.confirm()
-            order.delivery_id = f"delivery-{order.id[:8]}"
+            order.assign_delivery()
             await self.order_repository.save(order)
             
             # 7. Publish event
@@ -105,21 +107,24 @@ class CreateOrderUseCase:
     
     async def _publish_order_created_event(self, order: Order) -> None:
         """Publish order created event"""
-        event_payload = {
-            "order_id": order.id,
-            "order_number": order.order_number,
-            "client_id": order.client_id,
-            "total": order.total,
-            "items": [
-                {
-                    "product_id": item.product_id,
-                    "quantity": item.quantity,
-                    "price": item.price
-                }
-                for item in order.items
-            ],
-            "delivery_id": order.delivery_id,
-            "created_at": order.created_at.isoformat()
-        }
-        
-        await self.event_publisher.publish("OrderCreated", event_payload)
\ No newline at end of file
+        await self.event_publisher.publish("OrderCreated", order_created_payload(order))
+
+
+def order_created_payload(order: Order) -> dict:
+    """Build the OrderCreated event payload"""
+    return {
+        "order_id": order.id,
+        "order_number": order.order_number,
+        "client_id": order.client_id,
+        "total": order.total,
+        "items": [
+            {
+                "product_id": item.product_id,
+                "quantity": item.quantity,
+                "price": item.price
+            }
+            for item in order.items
+        ],
+        "delivery_id": order.delivery_id,
+        "created_at": order.created_at.isoformat()
+    }
\ No newline at end of file
@@ -0,0 +1,238 @@
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+
+from src.application.ports.event_publisher import EventPublisher
+from src.application.ports.inventory_service import InventoryService
+from src.application.use_cases.create_order import order_created_payload
+from src.domain.models.order import Order, OrderStatus
+from src.domain.repositories.order_repository import OrderRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchOrderOutcome:
+    """Result of one order within a batch"""
+    order: Order
+    error: str | None = None
+
+
+class CreateOrdersBatchUseCase:
+
+    def __init__(
+        self,
+        order_repository: OrderRepository,
+        inventory_service: InventoryService,
+        event_publisher: EventPublisher
+    ):
+        self.order_repository = order_repository
+        self.inventory_service = inventory_service
+        self.event_publisher = event_publisher
+
+    async def execute(self, orders: list[Order]) -> list[BatchOrderOutcome]:
+        """
+        Create many orders at once. Each order succeeds or fails on its own;
+        outcomes are returned in request order.
+        """
+        outcomes = [BatchOrderOutcome(order=order) for order in orders]
+
+        # 1. Validate business rules
+        pending = []
+        for outcome in outcomes:
+            is_valid, error_message = outcome.order.validate_business_rules()
+            if is_valid:
+                pending.append(outcome)
+            else:
+                self._reject(outcome, error_message)
+
+        # 2. Save initial orders in one bulk insert
+        await self.order_repository.save_all(orders)
+        logger.info(
+            f"Batch of {len(orders)} orders saved, {len(pending)} pass business rules"
+        )
+
+        if pending:
+            # 3. Check stock once for every product in the batch
+            product_ids = list(dict.fromkeys(
+                item.product_id for outcome in pending for item in outcome.order.items
+            ))
+            try:
+                stock_availability = await self.inventory_service.check_stock(
+                    product_ids
+                )
+            except Exception as e:
+                logger.error(f"Failed to check stock for order batch: {str(e)}")
+                for outcome in pending:
+                    self._reject(outcome, "Inventory service unavailable")
+            else:
+                # 4. Allocate available stock to orders in request order
+                accepted = self._allocate(pending, stock_availability)
+
+                # 5. Reserve stock with one call per group of orders
+                unreachable: list[BatchOrderOutcome] = []
+                for group in self._reservation_groups(accepted):
+                    if unreachable or not await self._reserve_group(group):
+                        unreachable.extend(
+                            outcome for outcome in group
+                            if outcome.order.status == OrderStatus.VALIDATED
+                        )
+                if unreachable:
+                    await self._abandon(unreachable)
+
+            # 6. Save final statuses in one bulk update
+            await self.order_repository.save_all([outcome.order for outcome in pending])
+
+        # 7. Publish events
+        created = [
+            outcome.order
+            for outcome in outcomes
+            if outcome.order.status == OrderStatus.CREATED
+        ]
+        if created:
+            await self.event_publisher.publish_batch(
+                "OrderCreated", [order_created_payload(order) for order in created]
+            )
+
+        logger.info(
+            f"Order batch processed: {len(created)} created, "
+            f"{len(orders) - len(created)} rejected"
+        )
+        return outcomes
+
+    def _allocate(
+        self, outcomes: list[BatchOrderOutcome], stock_availability: dict[str, int]
+    ) -> list[BatchOrderOutcome]:
+        remaining = dict(stock_availability)
+        accepted = []
+        for outcome in outcomes:
+            required = order_quantities(outcome.order)
+            shortages = [
+                f"{product_id} (available: {remaining.get(product_id, 0)}, "
+                f"required: {quantity})"
+                for product_id, quantity in required.items()
+                if remaining.get(product_id, 0) < quantity
+            ]
+            if shortages:
+                self._reject(
+                    outcome, f"Insufficient stock for products: {', '.join(shortages)}"
+                )
+                continue
+
+            for product_id, quantity in required.items():
+                remaining[product_id] -= quantity
+            outcome.order.validate()
+            accepted.append(outcome)
+        return accepted
+
+    def _reservation_groups(
+        self, outcomes: list[BatchOrderOutcome]
+    ) -> list[list[BatchOrderOutcome]]:
+        """Pack whole orders into groups that fit a single reserve_stock call"""
+        groups: list[list[BatchOrderOutcome]] = []
+        current: list[BatchOrderOutcome] = []
+        totals: dict[str, int] = defaultdict(int)
+
+        for outcome in outcomes:
+            required = order_quantities(outcome.order)
+            fits = (
+                len(totals.keys() | required.keys())
+                <= self.inventory_service.MAX_RESERVE_PRODUCTS
+                and all(
+                    totals[product_id] + quantity
+                    <= self.inventory_service.MAX_RESERVE_QUANTITY
+                    for product_id, quantity in required.items()
+                )
+            )
+            if current and not fits:
+                groups.append(current)
+                current, totals = [], defaultdict(int)
+
+            current.append(outcome)
+            for product_id, quantity in required.items():
+                totals[product_id] += quantity
+
+        if current:
+            groups.append(current)
+        return groups
+
+    async def _reserve_group(self, group: list[BatchOrderOutcome]) -> bool:
+        """
+        Returns: False if inventory could not be reached; orders of the group
+                 not confirmed or rejected by then are left validated
+        """
+        # Broken down by order, so inventory records each order's share
+        orders = {
+            outcome.order.id: order_quantities(outcome.order) for outcome in group
+        }
+        items_to_reserve: dict[str, int] = defaultdict(int)
+        for quantities in orders.values():
+            for product_id, quantity in quantities.items():
+                items_to_reserve[product_id] += quantity
+
+        try:
+            if await self.inventory_service.reserve_stock(
+                dict(items_to_reserve), orders
+            ):
+                for outcome in group:
+                    self._confirm(outcome)
+                return True
+
+            # Reservation is all-or-nothing, so nothing was held: retry the
+            # orders one by one and let each succeed or fail on its own
+            if len(group) > 1:
+                logger.warning(
+                    f"Group reservation for {len(group)} orders failed, "
+                    "reserving individually"
+                )
+            for outcome in group:
+                quantities = orders[outcome.order.id]
+                if await self.inventory_service.reserve_stock(
+                    quantities, {outcome.order.id: quantities}
+                ):
+                    self._confirm(outcome)
+                else:
+                    self._reject(
+                        outcome,
+                        "Failed to reserve stock - items may have been sold to "
+                        "another customer",
+                    )
+        except Exception as e:
+            logger.error(f"Failed to reserve stock: {str(e)}")
+            return False
+        return True
+
+    async def _abandon(self, outcomes: list[BatchOrderOutcome]) -> None:
+        """
+        Reject orders whose reservation failed on an outage, and release what they may
+        hold
+        """
+        for outcome in outcomes:
+            self._reject(outcome, "Inventory service unavailable")
+        # A reservation that timed out may have been applied; releasing is idempotent
+        try:
+            await self.inventory_service.release_stock(
+                [outcome.order.id for outcome in outcomes]
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to release stock of {len(outcomes)} orders rejected during an "
+                f"inventory outage: {str(e)}"
+            )
+
+    def _confirm(self, outcome: BatchOrderOutcome) -> None:
+        outcome.order.confirm()
+        outcome.order.assign_delivery()
+
+    def _reject(self, outcome: BatchOrderOutcome, error_message: str) -> None:
+        outcome.order.reject()
+        outcome.error = error_message
+        logger.warning(f"Order {outcome.order.id} rejected: {error_message}")
+
+
+def order_quantities(order: Order) -> dict[str, int]:
+    """Quantity per product, merging repeated lines for the same product"""
+    quantities: dict[str, int] = defaultdict(int)
+    for item in order.items:
+        quantities[item.product_id] += item.quantity
+    return dict(quantities)
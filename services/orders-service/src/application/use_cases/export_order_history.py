@@ -0,0 +1,66 @@
+import logging
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime, timedelta
+
+from src.application.ports.order_history_store import OrderHistoryStore
+from src.domain.models.order import Order
+from src.domain.repositories.order_repository import OrderRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ExportOrderHistoryUseCase:
+
+    def __init__(
+        self,
+        repository_scope: Callable[[], AbstractAsyncContextManager[OrderRepository]],
+        history_store: OrderHistoryStore,
+        settle_seconds: float,
+        batch_size: int
+    ):
+        self.repository_scope = repository_scope
+        self.history_store = history_store
+        # Orders younger than this may still change status, so they wait
+        # for a later run
+        self.settle_seconds = settle_seconds
+        self.batch_size = batch_size
+
+    async def execute(self, now: datetime | None = None) -> int:
+        """Export settled orders created since the previous run"""
+        watermark = await self.history_store.watermark()
+        created_to = (now or datetime.utcnow()) - timedelta(seconds=self.settle_seconds)
+        logger.info(f"Exporting order history after {watermark} up to {created_to}")
+
+        exported = 0
+        try:
+            batch: list[Order] = []
+            async with self.repository_scope() as order_repository:
+                async for order in order_repository.stream_orders(
+                    created_from=watermark[0] if watermark else None,
+                    created_to=created_to
+                ):
+                    # The stream starts at the watermark's timestamp; skip
+                    # orders of that instant that were already exported
+                    if watermark and (order.created_at, order.id) <= watermark:
+                        continue
+                    batch.append(order)
+                    if len(batch) >= self.batch_size:
+                        await self.history_store.append(batch)
+                        exported += len(batch)
+                        last = batch[-1]
+                        batch = []
+            if batch:
+                await self.history_store.append(batch)
+                exported += len(batch)
+                last = batch[-1]
+
+            if exported:
+                await self.history_store.commit((last.created_at, last.id))
+            logger.info(f"Successfully exported {exported} orders")
+            return exported
+        except Exception as e:
+            logger.error(
+                f"Error exporting order history after {exported} rows: {str(e)}"
+            )
+            raise
@@ -0,0 +1,47 @@
+import logging
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime
+from typing import List, Optional
+
+from src.domain.models.order import Order, OrderStatus
+from src.domain.repositories.order_repository import OrderRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ExportOrdersUseCase:
+
+    def __init__(
+        self,
+        repository_scope: Callable[[], AbstractAsyncContextManager[OrderRepository]]
+    ):
+        # The export is consumed after the request handler returns, so it
+        # opens (and closes) its own repository instead of borrowing the
+        # request-scoped one
+        self.repository_scope = repository_scope
+
+    async def stream(
+        self,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        statuses: Optional[List[OrderStatus]] = None
+    ) -> AsyncIterator[Order]:
+        """Stream orders matching the filters, oldest first"""
+        logger.info(
+            f"Exporting orders created_from={created_from}, created_to={created_to}, "
+            f"statuses={statuses}"
+        )
+
+        exported = 0
+        try:
+            async with self.repository_scope() as order_repository:
+                async for order in order_repository.stream_orders(
+                    created_from=created_from, created_to=created_to, statuses=statuses
+                ):
+                    exported += 1
+                    yield order
+            logger.info(f"Successfully exported {exported} orders")
+        except Exception as e:
+            logger.error(f"Error exporting orders after {exported} rows: {str(e)}")
+            raise
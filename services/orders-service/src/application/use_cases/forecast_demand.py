@@ -0,0 +1,209 @@
+import logging
+import math
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from itertools import chain
+from statistics import NormalDist
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.application.ports.inventory_service import InventoryService
+from src.domain.repositories.order_repository import OrderRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class ReorderPoint:
+    """Demand forecast and reorder point of one product"""
+    product_id: str
+    average_daily_demand: float  # moving average over the window
+    forecast_daily_demand: float  # exponentially smoothed level
+    demand_std: float  # daily demand standard deviation over the window
+    safety_stock: float
+    reorder_point: float
+    available: Optional[int]  # None when the inventory service did not report it
+
+    @property
+    def below_reorder_point(self) -> bool:
+        return self.available is not None and self.available <= self.reorder_point
+
+
+@dataclass
+class DemandHistory:
+    """
+    Daily demand as sparse parallel arrays, one entry per (product, day)
+    with sales. Days without sales are implicit zeros.
+    """
+    product_ids: List[str]
+    codes: np.ndarray  # index into product_ids
+    days: np.ndarray  # days since the start of the history
+    units: np.ndarray
+    length: int  # number of days covered
+
+
+def reorder_points(
+    history: DemandHistory,
+    window_days: int,
+    alpha: float,
+    lead_time_days: float,
+    service_level: float
+) -> Dict[str, np.ndarray]:
+    """
+    Moving average, simple exponential smoothing, safety stock and reorder
+    point for every product at once.
+
+    Every statistic is a weighted sum over the sparse (product, day) entries,
+    computed with np.bincount. The work is proportional to the number of
+    entries, and no products x days matrix is ever built.
+    """
+    products, length = len(history.product_ids), history.length
+    codes, days, units = history.codes, history.days, history.units
+
+    window = min(window_days, length)
+    recent = days >= length - window
+    window_sum = np.bincount(codes[recent], weights=units[recent], minlength=products)
+    window_squares = np.bincount(
+        codes[recent], weights=units[recent] ** 2, minlength=products
+    )
+    average = window_sum / window
+    variance = np.maximum(window_squares - window * average ** 2, 0.0) / max(
+        window - 1, 1
+    )
+    std = np.sqrt(variance)
+
+    # level_t = alpha * x_t + (1 - alpha) * level_t-1, starting from x_0,
+    # unrolled: day t weighs alpha * (1 - alpha)^(length - 1 - t), day 0 the rest
+    weights = alpha * (1.0 - alpha) ** (length - 1 - days)
+    weights[days == 0] = (1.0 - alpha) ** (length - 1)
+    level = np.bincount(codes, weights=units * weights, minlength=products)
+
+    z = NormalDist().inv_cdf(service_level)
+    safety_stock = z * std * math.sqrt(lead_time_days)
+    return {
+        "average": average,
+        "level": level,
+        "std": std,
+        "safety_stock": safety_stock,
+        "reorder_point": level * lead_time_days + safety_stock,
+    }
+
+
+class ForecastDemandUseCase:
+
+    def __init__(
+        self, order_repository: OrderRepository, inventory_service: InventoryService
+    ):
+        self.order_repository = order_repository
+        self.inventory_service = inventory_service
+
+    async def execute(
+        self,
+        history_days: int,
+        window_days: int,
+        alpha: float,
+        lead_time_days: float,
+        service_level: float,
+        product_ids: Optional[List[str]] = None,
+        as_of: Optional[date] = None
+    ) -> List[ReorderPoint]:
+        """
+        Reorder points from the sales of the `history_days` days before
+        `as_of` (default: today, which is still incomplete and left out),
+        most urgent first
+        """
+        date_to = as_of or datetime.utcnow().date()
+        date_from = date_to - timedelta(days=history_days)
+        logger.info(
+            f"Forecasting demand from {date_from} to {date_to} for "
+            f"{len(product_ids) if product_ids else 'all'} products"
+        )
+
+        try:
+            started = time.perf_counter()
+            history = await self._load(date_from, date_to, product_ids)
+            loaded = time.perf_counter()
+            if not history.product_ids:
+                return []
+
+            results = reorder_points(
+                history, window_days, alpha, lead_time_days, service_level
+            )
+            logger.info(
+                f"Forecast {len(history.product_ids)} products from "
+                f"{len(history.units)} daily totals"
+                f" (load {loaded - started:.2f}s, compute "
+                f"{time.perf_counter() - loaded:.2f}s)"
+            )
+
+            stock = await self.inventory_service.check_stock(history.product_ids)
+            points = [
+                ReorderPoint(
+                    product_id=product_id,
+                    average_daily_demand=float(average),
+                    forecast_daily_demand=float(level),
+                    demand_std=float(std),
+                    safety_stock=float(safety_stock),
+                    reorder_point=float(reorder_point),
+                    available=stock.get(product_id)
+                )
+                for product_id, average, level, std, safety_stock, reorder_point in zip(
+                    history.product_ids,
+                    results["average"].tolist(),
+                    results["level"].tolist(),
+                    results["std"].tolist(),
+                    results["safety_stock"].tolist(),
+                    results["reorder_point"].tolist()
+                )
+            ]
+            # Largest shortfall first; products without a stock level last
+            points.sort(
+                key=lambda point: point.reorder_point - point.available
+                if point.available is not None else float("-inf"),
+                reverse=True
+            )
+            return points
+        except Exception as e:
+            logger.error(f"Error forecasting demand: {str(e)}")
+            raise
+
+    async def _load(
+        self, date_from: date, date_to: date, product_ids: Optional[List[str]]
+    ) -> DemandHistory:
+        # Requested products keep their slot even without any sales
+        index: Dict[str, int] = {
+            product_id: i for i, product_id in enumerate(product_ids or [])
+        }
+        codes, days, units = [], [], []
+        async for rows in self.order_repository.stream_product_demand(
+            date_from, date_to, product_ids
+        ):
+            batch_ids, batch_days, batch_units = zip(*rows)
+            lengths = np.fromiter(map(len, batch_days), dtype=np.int64, count=len(rows))
+            batch_codes = np.fromiter(
+                (index.setdefault(product_id, len(index)) for product_id in batch_ids),
+                dtype=np.int64,
+                count=len(rows)
+            )
+            total = int(lengths.sum())
+            codes.append(np.repeat(batch_codes, lengths))
+            days.append(
+                np.fromiter(
+                    chain.from_iterable(batch_days), dtype=np.int64, count=total
+                )
+            )
+            units.append(
+                np.fromiter(
+                    chain.from_iterable(batch_units), dtype=np.float64, count=total
+                )
+            )
+
+        return DemandHistory(
+            product_ids=list(index),
+            codes=np.concatenate(codes) if codes else np.empty(0, dtype=np.int64),
+            days=np.concatenate(days) if days else np.empty(0, dtype=np.int64),
+            units=np.concatenate(units) if units else np.empty(0, dtype=np.float64),
+            length=(date_to - date_from).days
+        )
@@ -1,7 +1,10 @@
 import logging
-from typing import List, Optional
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
 
-from src.domain.models.order import Order
+from src.application.ports.order_archive import OrderArchive
+from src.domain.models.order import Order, OrderStatus, OrderSummary, OrderView
+from src.domain.models.sales import SalesAggregate, SalesGrouping
 from src.domain.repositories.order_repository import OrderRepository
 from src.domain.exceptions import OrderNotFoundException
 
@@ -10,8 +13,13 @@ logger = logging.getLogger(__name__)
 
 class GetOrderUseCase:
     
-    def __init__(self, order_repository: OrderRepository):
+    def __init__(
+        self,
+        order_repository: OrderRepository,
+        order_archive: Optional[OrderArchive] = None
+    ):
         self.order_repository = order_repository
+        self.order_archive = order_archive
     
     async def by_id(self, order_id: str) -> Order:
         """Get order by ID"""
@@ -19,6 +27,9 @@ class GetOrderUseCase:
 
         try:
             order = await self.order_repository.find_by_id(order_id)
+            if not order and self.order_archive is not None:
+                # Old orders are moved out of the database by the archival job
+                order = await self.order_archive.find_by_id(order_id)
             if not order:
                 logger.warning(f"Order with ID {order_id} not found")
                 raise OrderNotFoundException(f"Order {order_id} not found")
@@ -31,14 +42,142 @@ class GetOrderUseCase:
             logger.error(f"Error retrieving order {order_id}: {str(e)}")
             raise
 
-    async def find_all(self, limit: int = 100, offset: int = 0) -> List[Order]:
-        """Get all orders with pagination"""
-        logger.info(f"Fetching orders with limit={limit}, offset={offset}")
+    async def by_ids(self, order_ids: List[str]) -> Dict[str, Order]:
+        """Get many orders at once; ids not found are left out"""
+        logger.info(f"Fetching {len(order_ids)} orders by id")
 
         try:
-            orders = await self.order_repository.find_all(limit=limit, offset=offset)
+            orders = await self.order_repository.find_by_ids(order_ids)
+            missing = [
+                order_id
+                for order_id in dict.fromkeys(order_ids)
+                if order_id not in orders
+            ]
+            if missing and self.order_archive is not None:
+                orders.update(await self.order_archive.find_by_ids(missing))
+            logger.info(f"Found {len(orders)} of {len(order_ids)} orders")
+            return orders
+        except Exception as e:
+            logger.error(f"Error retrieving orders by id: {str(e)}")
+            raise
+
+    async def version(self, order_id: str) -> Optional[int]:
+        """Current version of an order, None if it does not exist"""
+        version = await self.order_repository.find_version(order_id)
+        if version is None and self.order_archive is not None:
+            archived = await self.order_archive.find_by_id(order_id)
+            version = archived.version if archived else None
+        return version
+
+    async def find_all(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[Tuple[datetime, str]] = None,
+        fields: Optional[List[str]] = None,
+        statuses: Optional[List[OrderStatus]] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None
+    ) -> List[OrderView]:
+        """
+        Get orders with pagination and filters, optionally only some of their fields
+        """
+        logger.info(
+            f"Fetching orders with limit={limit}, offset={offset}, after={after}, "
+            f"fields={fields}, "
+            f"statuses={statuses}, created_from={created_from}, created_to={created_to}"
+        )
+
+        try:
+            orders = await self.order_repository.find_all(
+                limit=limit,
+                offset=offset,
+                after=after,
+                fields=fields,
+                statuses=statuses,
+                created_from=created_from,
+                created_to=created_to
+            )
             logger.info(f"Successfully retrieved {len(orders)} orders")
             return orders
         except Exception as e:
             logger.error(f"Error retrieving orders: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    async def by_client(
+        self,
+        client_id: str,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, str]] = None,
+        statuses: Optional[List[OrderStatus]] = None
+    ) -> List[OrderSummary]:
+        """Get a client's order history, newest first"""
+        logger.info(
+            f"Fetching orders for client {client_id} with limit={limit}, after={after}"
+        )
+
+        try:
+            orders = await self.order_repository.find_summaries_by_client(
+                client_id, limit=limit, after=after, statuses=statuses
+            )
+            logger.info(
+                f"Successfully retrieved {len(orders)} orders for client {client_id}"
+            )
+            return orders
+        except Exception as e:
+            logger.error(f"Error retrieving orders for client {client_id}: {str(e)}")
+            raise
+
+    async def by_product(
+        self, product_id: str, limit: int = 100, offset: int = 0
+    ) -> List[Order]:
+        """Get orders containing a product, newest first"""
+        logger.info(
+            f"Fetching orders for product {product_id} with limit={limit}, "
+            f"offset={offset}"
+        )
+
+        try:
+            orders = await self.order_repository.find_by_product_id(
+                product_id, limit=limit, offset=offset
+            )
+            logger.info(
+                f"Successfully retrieved {len(orders)} orders for product {product_id}"
+            )
+            return orders
+        except Exception as e:
+            logger.error(f"Error retrieving orders for product {product_id}: {str(e)}")
+            raise
+
+    async def units_sold(self, product_ids: List[str]) -> Dict[str, int]:
+        """Get units sold in created orders per product"""
+        logger.info(f"Fetching units sold for {len(product_ids)} products")
+
+        try:
+            return await self.order_repository.units_sold_by_product(product_ids)
+        except Exception as e:
+            logger.error(f"Error retrieving units sold: {str(e)}")
+            raise
+
+    async def sales(
+        self,
+        grouping: SalesGrouping,
+        date_from: date,
+        date_to: date,
+        status: OrderStatus = OrderStatus.CREATED,
+        key: Optional[str] = None,
+        limit: int = 1000
+    ) -> List[SalesAggregate]:
+        """Get per-day sales totals from the rollups"""
+        logger.info(
+            f"Fetching {grouping.value} sales from {date_from} to {date_to} for "
+            f"status={status.value}, key={key}"
+        )
+
+        try:
+            return await self.order_repository.sales_aggregates(
+                grouping, date_from, date_to, status=status, key=key, limit=limit
+            )
+        except Exception as e:
+            logger.error(f"Error retrieving sales aggregates: {str(e)}")
+            raise
@@ -0,0 +1,126 @@
+import logging
+
+from src.application.ports.event_publisher import EventPublisher
+from src.application.ports.inventory_service import InventoryService
+from src.application.use_cases.create_order import order_created_payload
+from src.domain.exceptions import ExternalServiceException
+from src.domain.models.order import Order, OrderStatus
+from src.domain.repositories.order_repository import OrderRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessOrderUseCase:
+    """
+    Background half of asynchronous order creation: stock check, reservation,
+    confirmation and publishing for an order accepted by AcceptOrderUseCase.
+
+    Inventory failures raise ExternalServiceException and leave the order
+    PENDING or VALIDATED, so the caller can retry it later instead of
+    rejecting it.
+    """
+
+    def __init__(
+        self,
+        order_repository: OrderRepository,
+        inventory_service: InventoryService,
+        event_publisher: EventPublisher
+    ):
+        self.order_repository = order_repository
+        self.inventory_service = inventory_service
+        self.event_publisher = event_publisher
+
+    async def execute(self, order_id: str) -> Order | None:
+        """
+        Process a queued order. Returns None if the order no longer exists.
+        """
+        order = await self.order_repository.find_by_id(order_id)
+        if order is None:
+            logger.warning(f"Queued order {order_id} not found, skipping")
+            return None
+
+        if order.status == OrderStatus.PENDING:
+            # 1. Check inventory
+            product_ids = [item.product_id for item in order.items]
+            try:
+                stock_availability = await self.inventory_service.check_stock(
+                    product_ids
+                )
+            except Exception as e:
+                raise ExternalServiceException(
+                    f"Inventory service unavailable: {str(e)}"
+                )
+
+            for item in order.items:
+                available = stock_availability.get(item.product_id, 0)
+                if available < item.quantity:
+                    order.reject()
+                    await self.order_repository.save(order)
+                    logger.warning(
+                        f"Order {order.id} rejected: Insufficient stock for product "
+                        f"{item.product_id}. "
+                        f"Available: {available}, Required: {item.quantity}"
+                    )
+                    return order
+
+            # 2. Validate order
+            order.validate()
+            await self.order_repository.save(order)
+            logger.info(f"Order {order.id} validated")
+
+        if order.status == OrderStatus.VALIDATED:
+            # 3. Reserve stock
+            items_to_reserve = {
+                item.product_id: item.quantity for item in order.items
+            }
+            try:
+                stock_reserved = await self.inventory_service.reserve_stock(
+                    items_to_reserve, {order.id: items_to_reserve}
+                )
+            except Exception as e:
+                raise ExternalServiceException(
+                    f"Stock reservation service unavailable: {str(e)}"
+                )
+
+            if not stock_reserved:
+                order.reject()
+                await self.order_repository.save(order)
+                logger.warning(f"Order {order.id} failed to reserve stock")
+                return order
+
+            # 4. Confirm order and set delivery date
+            order.confirm()
+            order.assign_delivery()
+            await self.order_repository.save(order)
+
+            # 5. Publish event
+            await self.event_publisher.publish(
+                "OrderCreated", order_created_payload(order)
+            )
+            logger.info(f"Order {order.id} created successfully")
+
+        return order
+
+    async def give_up(self, order_id: str) -> Order | None:
+        """
+        Reject an order that could not be processed after repeated failures.
+        Raises ExternalServiceException, leaving the order unchanged, if its
+        stock cannot be released.
+        """
+        order = await self.order_repository.find_by_id(order_id)
+        if order is None or order.status not in (
+            OrderStatus.PENDING, OrderStatus.VALIDATED
+        ):
+            return order
+
+        # A reservation that timed out may still have been applied by
+        # inventory; releasing is idempotent, so it is released either way
+        try:
+            await self.inventory_service.release_stock([order.id])
+        except Exception as e:
+            raise ExternalServiceException(f"Stock release failed: {str(e)}")
+
+        order.reject()
+        await self.order_repository.save(order)
+        logger.error(f"Order {order.id} rejected after repeated processing failures")
+        return order
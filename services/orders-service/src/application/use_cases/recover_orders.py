@@ -0,0 +1,140 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.application.ports.event_publisher import EventPublisher
+from src.application.ports.inventory_service import InventoryService
+from src.application.use_cases.create_order import order_created_payload
+from src.application.use_cases.create_orders_batch import order_quantities
+from src.domain.exceptions import ExternalServiceException
+from src.domain.models.order import Order, OrderStatus
+from src.domain.repositories.order_repository import OrderRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RecoveredOrder:
+    """A stuck order and how it was resolved: created, rejected or expired"""
+    order: Order
+    outcome: str
+
+
+class RecoverOrdersUseCase:
+    """
+    Resolve orders left pending or validated by a replica that died in the
+    middle of creating them.
+
+    Whether such an order holds stock is asked of inventory, which records
+    reservations per order. Orders holding stock are confirmed. The others
+    are reserved again, which inventory never applies twice to the same
+    order, and confirmed or rejected. A refused order is asked about once
+    more, as the replica still creating it may have reserved its stock in
+    the meantime. Orders stuck for too long are rejected instead. Whatever
+    a rejected order may hold is released.
+    """
+
+    def __init__(
+        self,
+        order_repository: OrderRepository,
+        inventory_service: InventoryService,
+        event_publisher: EventPublisher
+    ):
+        self.order_repository = order_repository
+        self.inventory_service = inventory_service
+        self.event_publisher = event_publisher
+
+    async def execute(
+        self, stuck_before: datetime, expire_before: datetime, limit: int
+    ) -> list[RecoveredOrder]:
+        """
+        Claim up to `limit` orders created before `stuck_before` and resolve
+        them in one transaction. Orders created before `expire_before` are
+        rejected. On any error the claims are dropped unchanged, and the
+        orders are picked up again by a later call.
+        """
+        orders = await self.order_repository.claim_stuck(stuck_before, limit)
+        if not orders:
+            return []
+        logger.info(f"Recovering {len(orders)} stuck orders")
+
+        # 1. Reconcile with the reservations recorded by inventory
+        try:
+            held = await self.inventory_service.find_reservations(
+                [order.id for order in orders]
+            )
+        except Exception as e:
+            raise ExternalServiceException(f"Inventory service unavailable: {str(e)}")
+
+        # 2. Finish or reject each order
+        recovered = []
+        for order in orders:
+            if order.created_at < expire_before:
+                logger.warning(
+                    f"Order {order.id} stuck in {order.status.value} too "
+                    "long, rejecting it"
+                )
+                order.reject()
+                recovered.append(RecoveredOrder(order, "expired"))
+            elif order.id in held or await self._reserve(order):
+                if order.status == OrderStatus.PENDING:
+                    order.validate()
+                order.confirm()
+                order.assign_delivery()
+                recovered.append(RecoveredOrder(order, "created"))
+            else:
+                order.reject()
+                recovered.append(RecoveredOrder(order, "rejected"))
+                logger.warning(
+                    f"Stuck order {order.id} rejected: failed to reserve stock"
+                )
+
+        # 3. Release the stock of rejected orders with one call per batch.
+        # Releasing is idempotent, so orders holding nothing are included:
+        # an earlier reservation of theirs may have been applied unseen
+        to_release = [item.order.id for item in recovered if item.outcome != "created"]
+        if to_release:
+            try:
+                await self.inventory_service.release_stock(to_release)
+            except Exception as e:
+                raise ExternalServiceException(f"Stock release failed: {str(e)}")
+
+        # 4. Save final statuses in one bulk update, which ends the claims
+        await self.order_repository.save_all(orders)
+
+        created = [item.order for item in recovered if item.outcome == "created"]
+        if created:
+            await self.event_publisher.publish_batch(
+                "OrderCreated", [order_created_payload(order) for order in created]
+            )
+
+        logger.info(
+            f"Recovered {len(orders)} stuck orders: {len(created)} created, "
+            f"{len(orders) - len(created)} rejected"
+        )
+        return recovered
+
+    async def backlog(self, stuck_before: datetime) -> int:
+        """Orders created before `stuck_before` still waiting to be resolved"""
+        return await self.order_repository.count_stuck(stuck_before)
+
+    async def _reserve(self, order: Order) -> bool:
+        """
+        Returns: False if inventory refused the reservation and the order
+                 holds no stock; raises on an outage
+        """
+        quantities = order_quantities(order)
+        try:
+            if await self.inventory_service.reserve_stock(
+                quantities, {order.id: quantities}
+            ):
+                return True
+            # Refused, e.g. out of stock because the replica creating this
+            # order reserved the last units for it after the lookup above
+            held = await self.inventory_service.find_reservations([order.id])
+            return order.id in held
+        except Exception as e:
+            raise ExternalServiceException(
+                "Stock reservation service unavailable for stuck order "
+                f"{order.id}: {str(e)}"
+            )
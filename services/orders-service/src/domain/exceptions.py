@@ -31,6 +31,21 @@ class OrderValidationException(OrderDomainException):
     pass
 
 
+class OrderCancellationException(OrderDomainException):
+    """Raised when an order cannot be cancelled in its current status"""
+    pass
+
+
 class ExternalServiceException(OrderDomainException):
     """Raised when external service calls fail"""
+    pass
+
+
+class IdempotencyKeyReusedException(OrderDomainException):
+    """Raised when an Idempotency-Key is reused with a different request"""
+    pass
+
+
+class IdempotencyKeyInProgressException(OrderDomainException):
+    """Raised when the request holding an Idempotency-Key does not finish in time"""
     pass
\ No newline at end of file
@@ -1,3 +1,26 @@
-from .order import Order, OrderItem, OrderStatus
+from .order import Order, OrderItem, OrderStatus, OrderSummary, OrderView
+from .order_ids import (
+    ORDER_ID_TIMESTAMP_SLACK,
+    OrderIdGenerator,
+    UUID4Generator,
+    UUID7Generator,
+    order_id_timestamp,
+    set_order_id_generator,
+)
+from .sales import SalesAggregate, SalesGrouping
 
-__all__ = ["Order", "OrderItem", "OrderStatus"]
\ No newline at end of file
+__all__ = [
+    "Order",
+    "OrderItem",
+    "OrderStatus",
+    "OrderSummary",
+    "OrderView",
+    "SalesAggregate",
+    "SalesGrouping",
+    "ORDER_ID_TIMESTAMP_SLACK",
+    "OrderIdGenerator",
+    "UUID4Generator",
+    "UUID7Generator",
+    "order_id_timestamp",
+    "set_order_id_generator",
+]
\ No newline at end of file
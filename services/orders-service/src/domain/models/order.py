@@ -1,14 +1,16 @@
-import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
+from .order_ids import new_order_id
+
 
 class OrderStatus(Enum):
     PENDING = "pending"
     VALIDATED = "validated"
     REJECTED = "rejected"
     CREATED = "created"
+    CANCELLED = "cancelled"
 
 
 @dataclass
@@ -25,12 +27,15 @@ class OrderItem:
 class Order:
     client_id: str
     items: list[OrderItem]
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    order_number: str = field(default_factory=lambda: str(uuid.uuid4())[:8].upper())
+    id: str = field(default_factory=new_order_id)
+    # Assigned from a database sequence when the order is first saved
+    order_number: str | None = None
     total: float = field(init=False)
     status: OrderStatus = OrderStatus.PENDING
     created_at: datetime = field(default_factory=datetime.utcnow)
     delivery_id: str | None = None
+    # Row version, incremented by the repository on every update
+    version: int = 1
     
     def __post_init__(self):
         self.total = sum(item.calculate_subtotal() for item in self.items)
@@ -45,9 +50,20 @@ class Order:
             raise ValueError(f"Cannot confirm order in {self.status} status")
         self.status = OrderStatus.CREATED
     
+    def assign_delivery(self) -> None:
+        # The tail of the ID is random for every generator; the head of a
+        # time-ordered ID is shared by orders created close together
+        self.delivery_id = f"delivery-{self.id[-8:]}"
+
     def reject(self) -> None:
         self.status = OrderStatus.REJECTED
 
+    def cancel(self) -> None:
+        # Orders still being created belong to whoever is creating them
+        if self.status != OrderStatus.CREATED:
+            raise ValueError(f"Cannot cancel order in {self.status.value} status")
+        self.status = OrderStatus.CANCELLED
+
     def validate_business_rules(self) -> tuple[bool, str]:
         """Returns (is_valid, error_message)"""
         if not self.items:
@@ -65,4 +81,32 @@ class Order:
             if item.price < 0:
                 return False, "Item price cannot be negative"
 
-        return True, ""
\ No newline at end of file
+        return True, ""
+
+
+@dataclass(slots=True)
+class OrderSummary:
+    """Read model with the order header only, for list views"""
+    id: str
+    order_number: str
+    status: OrderStatus
+    total: float
+    created_at: datetime
+
+
+@dataclass(slots=True)
+class OrderView:
+    """
+    Read model with the order as stored, for list responses. Items stay
+    plain dicts and the stored total is used as is, so none of the Order
+    behaviour is paid for on a page that is only serialized. Fields left
+    out of a projection are None; id and created_at are always loaded.
+    """
+    id: str
+    order_number: str | None = None
+    client_id: str | None = None
+    items: list[dict] | None = None
+    total: float | None = None
+    status: OrderStatus | None = None
+    created_at: datetime = field(kw_only=True)
+    delivery_id: str | None = None
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from datetime import date
+from enum import Enum
+
+from .order import OrderStatus
+
+
+class SalesGrouping(Enum):
+    DAY = "day"
+    PRODUCT = "product"
+    CLIENT = "client"
+
+
+@dataclass(slots=True)
+class SalesAggregate:
+    """Totals of the orders created on a day that reached a status"""
+    day: date
+    status: OrderStatus
+    orders: int
+    units: int
+    revenue: float
+    # product_id or client_id, depending on the grouping
+    key: str | None = None
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from datetime import date, datetime
 
-from src.domain.models.order import Order
+from src.domain.models.order import Order, OrderStatus, OrderSummary, OrderView
+from src.domain.models.sales import SalesAggregate, SalesGrouping
 
 
 class OrderRepository(ABC):
@@ -8,11 +11,131 @@ class OrderRepository(ABC):
     @abstractmethod
     async def save(self, order: Order) -> Order:
         pass
+
+    @abstractmethod
+    async def save_all(self, orders: list[Order]) -> list[Order]:
+        """Insert new orders and update existing ones with a few bulk statements"""
+        pass
+
+    @abstractmethod
+    async def delete_all(self, orders: list[Order]) -> None:
+        """Delete orders and their lines, e.g. once they are archived"""
+        pass
     
     @abstractmethod
-    async def find_all(self) -> list[Order]:
+    async def find_all(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        after: tuple[datetime, str] | None = None,
+        fields: list[str] | None = None,
+        statuses: list[OrderStatus] | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None
+    ) -> list[OrderView]:
+        """
+        List orders newest first, as read models. `after` is the (created_at,
+        id) of the last order of the previous page; `offset` is kept for
+        legacy callers. `fields` limits the OrderView fields loaded from the
+        database (default: all of them). `statuses` and the [created_from,
+        created_to) window filter the orders listed.
+        """
         pass
     
     @abstractmethod
     async def find_by_id(self, order_id: str) -> Order | None:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def find_by_ids(self, order_ids: list[str]) -> dict[str, Order]:
+        """Orders by id with a single query; ids not found are left out"""
+        pass
+
+    @abstractmethod
+    async def lock_by_ids(self, order_ids: list[str]) -> dict[str, Order]:
+        """
+        Like find_by_ids, but reads the primary and locks the orders found
+        until the next save commits
+        """
+        pass
+
+    @abstractmethod
+    async def find_version(self, order_id: str) -> int | None:
+        """The order's row version, without loading the order"""
+        pass
+
+    @abstractmethod
+    async def claim_stuck(self, created_before: datetime, limit: int) -> list[Order]:
+        """
+        Lock up to `limit` orders still pending or validated that were
+        created before `created_before`, oldest first. Orders locked by
+        someone else, or owned by the processing queue, are skipped. The
+        locks are held until the next save commits.
+        """
+        pass
+
+    @abstractmethod
+    async def count_stuck(self, created_before: datetime) -> int:
+        """How many orders claim_stuck() has left to return, locked or not"""
+        pass
+
+    @abstractmethod
+    def stream_orders(
+        self,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+        statuses: list[OrderStatus] | None = None
+    ) -> AsyncIterator[Order]:
+        """
+        Iterate over matching orders oldest first, fetching them in batches
+        from a server-side cursor instead of loading the full result
+        """
+        pass
+
+    @abstractmethod
+    async def find_summaries_by_client(
+        self,
+        client_id: str,
+        limit: int = 100,
+        after: tuple[datetime, str] | None = None,
+        statuses: list[OrderStatus] | None = None
+    ) -> list[OrderSummary]:
+        pass
+
+    @abstractmethod
+    async def find_by_product_id(
+        self, product_id: str, limit: int = 100, offset: int = 0
+    ) -> list[Order]:
+        pass
+
+    @abstractmethod
+    async def units_sold_by_product(self, product_ids: list[str]) -> dict[str, int]:
+        pass
+
+    @abstractmethod
+    def stream_product_demand(
+        self, date_from: date, date_to: date, product_ids: list[str] | None = None
+    ) -> AsyncIterator[list[tuple[str, list[int], list[int]]]]:
+        """
+        Units sold per product and day for days in [date_from, date_to),
+        optionally for the given products only. Streams batches of
+        (product_id, days, units) rows, one per product, where days are
+        offsets from date_from. Days without sales are omitted.
+        """
+        pass
+
+    @abstractmethod
+    async def sales_aggregates(
+        self,
+        grouping: SalesGrouping,
+        date_from: date,
+        date_to: date,
+        status: OrderStatus = OrderStatus.CREATED,
+        key: str | None = None,
+        limit: int = 1000
+    ) -> list[SalesAggregate]:
+        """
+        Per-day totals from the sales rollups for days in [date_from,
+        date_to), optionally per product or client (narrowed to `key`)
+        """
+        pass
@@ -0,0 +1,3 @@
+from .parquet_history_store import ParquetOrderHistoryStore
+
+__all__ = ["ParquetOrderHistoryStore"]
@@ -0,0 +1,184 @@
+"""
+Order history as Parquet datasets, partitioned by day:
+
+    <root>/orders/date=2026-10-19/part-<run>.parquet
+    <root>/order_items/date=2026-10-19/part-<run>.parquet
+    <root>/_watermark.json
+
+The date directories are Hive-style, so pyarrow.dataset, DuckDB or Spark
+can prune by day. A run stages its files under <root>/_staging/<run> and
+moves them into place on commit. Readers skip underscore-prefixed
+directories. Runs are named after the watermark they start from. A run
+that failed before committing is therefore overwritten by the next one and
+leaves no duplicates.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+from datetime import date, datetime
+from itertools import groupby
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pyarrow import fs
+
+from src.application.ports.order_history_store import OrderHistoryStore
+from src.domain.models.order import Order
+
+WATERMARK_FILE = "_watermark.json"
+STAGING_DIR = "_staging"
+
+ORDERS_SCHEMA = pa.schema([
+    ("id", pa.string()),
+    ("order_number", pa.string()),
+    ("client_id", pa.string()),
+    ("status", pa.dictionary(pa.int8(), pa.string())),
+    ("total", pa.float64()),
+    ("item_count", pa.int32()),
+    ("created_at", pa.timestamp("us")),
+    ("delivery_id", pa.string()),
+])
+ORDER_ITEMS_SCHEMA = pa.schema([
+    ("order_id", pa.string()),
+    ("line_number", pa.int32()),
+    ("product_id", pa.string()),
+    ("quantity", pa.int32()),
+    ("price", pa.float64()),
+    ("created_at", pa.timestamp("us")),
+])
+
+
+def _orders_table(orders: list[Order]) -> pa.Table:
+    return pa.Table.from_pydict(
+        {
+            "id": [order.id for order in orders],
+            "order_number": [order.order_number for order in orders],
+            "client_id": [order.client_id for order in orders],
+            "status": [order.status.value for order in orders],
+            "total": [order.total for order in orders],
+            "item_count": [len(order.items) for order in orders],
+            "created_at": [order.created_at for order in orders],
+            "delivery_id": [order.delivery_id for order in orders],
+        },
+        schema=ORDERS_SCHEMA,
+    )
+
+
+def _order_items_table(orders: list[Order]) -> pa.Table:
+    lines = [
+        (order, line_number, item)
+        for order in orders
+        for line_number, item in enumerate(order.items, start=1)
+    ]
+    return pa.Table.from_pydict(
+        {
+            "order_id": [order.id for order, _, _ in lines],
+            "line_number": [line_number for _, line_number, _ in lines],
+            "product_id": [item.product_id for _, _, item in lines],
+            "quantity": [item.quantity for _, _, item in lines],
+            "price": [item.price for _, _, item in lines],
+            "created_at": [order.created_at for order, _, _ in lines],
+        },
+        schema=ORDER_ITEMS_SCHEMA,
+    )
+
+
+class ParquetOrderHistoryStore(OrderHistoryStore):
+    """
+    Order history in Parquet files on a local directory or S3. One
+    instance handles a single run, and only one run should go at a time.
+    """
+
+    def __init__(self, url: str, compression: str = "zstd"):
+        if "://" in url:
+            self.filesystem, self.root = fs.FileSystem.from_uri(url)
+        else:
+            self.filesystem, self.root = fs.LocalFileSystem(), os.path.abspath(url)
+        self.compression = compression
+        self._run: str | None = None
+        self._day: date | None = None
+        self._writers: tuple[pq.ParquetWriter, pq.ParquetWriter] | None = None
+        self._staged: list[str] = []
+
+    async def watermark(self) -> tuple[datetime, str] | None:
+        return await asyncio.to_thread(self._read_watermark)
+
+    async def append(self, orders: list[Order]) -> None:
+        await asyncio.to_thread(self._append, orders)
+
+    async def commit(self, watermark: tuple[datetime, str]) -> None:
+        await asyncio.to_thread(self._commit, watermark)
+
+    def _path(self, *parts: str) -> str:
+        return "/".join([self.root.rstrip("/"), *parts])
+
+    def _read_watermark(self) -> tuple[datetime, str] | None:
+        path = self._path(WATERMARK_FILE)
+        if self.filesystem.get_file_info(path).type == fs.FileType.NotFound:
+            return None
+        with self.filesystem.open_input_stream(path) as stream:
+            data = json.loads(stream.read())
+        return datetime.fromisoformat(data["created_at"]), data["id"]
+
+    def _run_id(self) -> str:
+        if self._run is None:
+            watermark = self._read_watermark()
+            self._run = hashlib.sha1(repr(watermark).encode()).hexdigest()[:16]
+        return self._run
+
+    def _append(self, orders: list[Order]) -> None:
+        for day, group in groupby(orders, key=lambda order: order.created_at.date()):
+            day_orders = list(group)
+            writers = self._writers
+            if writers is None or day != self._day:
+                writers = self._open_day(day)
+            orders_writer, items_writer = writers
+            orders_writer.write_table(_orders_table(day_orders))
+            items_writer.write_table(_order_items_table(day_orders))
+
+    def _open_day(self, day: date) -> tuple[pq.ParquetWriter, pq.ParquetWriter]:
+        self._close_day()
+        run = self._run_id()
+        writers = []
+        for dataset, schema in (
+            ("orders", ORDERS_SCHEMA), ("order_items", ORDER_ITEMS_SCHEMA)
+        ):
+            relative = f"{dataset}/date={day.isoformat()}/part-{run}.parquet"
+            staged = self._path(STAGING_DIR, run, relative)
+            self.filesystem.create_dir(staged.rsplit("/", 1)[0], recursive=True)
+            writers.append(pq.ParquetWriter(
+                staged, schema, filesystem=self.filesystem, compression=self.compression
+            ))
+            self._staged.append(relative)
+        self._day = day
+        self._writers = (writers[0], writers[1])
+        return self._writers
+
+    def _close_day(self) -> None:
+        if self._writers is not None:
+            for writer in self._writers:
+                writer.close()
+        self._writers = None
+        self._day = None
+
+    def _commit(self, watermark: tuple[datetime, str]) -> None:
+        self._close_day()
+        run = self._run_id()
+        for relative in self._staged:
+            target = self._path(relative)
+            self.filesystem.create_dir(target.rsplit("/", 1)[0], recursive=True)
+            self.filesystem.move(self._path(STAGING_DIR, run, relative), target)
+
+        # Advanced last: if anything above fails, the next run redoes it
+        created_at, order_id = watermark
+        with self.filesystem.open_output_stream(self._path(WATERMARK_FILE)) as stream:
+            stream.write(
+                json.dumps(
+                    {"created_at": created_at.isoformat(), "id": order_id}
+                ).encode()
+            )
+        self.filesystem.delete_dir(self._path(STAGING_DIR, run))
+        self._staged = []
+        self._run = None
@@ -0,0 +1,12 @@
+from .segment_archive import SegmentOrderArchive
+from .storage import (
+    LocalSegmentStorage, S3SegmentStorage, SegmentStorage, storage_from_url
+)
+
+__all__ = [
+    "LocalSegmentStorage",
+    "S3SegmentStorage",
+    "SegmentOrderArchive",
+    "SegmentStorage",
+    "storage_from_url",
+]
@@ -0,0 +1,415 @@
+"""
+Archived orders in compressed, immutable segment files.
+
+A segment holds orders sorted by id and cut into blocks, each compressed
+on its own. A sparse index at the end of the file lists the first id of
+every block, so a lookup decompresses a single block. Layout:
+
+    MAGIC | block 0 | block 1 | ... | index | footer
+
+The footer holds the index offset and length, followed by MAGIC again.
+Segment names carry the created_at range of their orders. Time-ordered
+ids can therefore skip every segment from another period without opening
+it. Next to each segment, a `.ids` file holds a Bloom filter of its ids,
+so ids without a timestamp skip the segments that cannot hold them too.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import mmap
+import re
+import struct
+import threading
+import time
+import uuid
+import zlib
+from bisect import bisect_right
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from prometheus_client import Counter, Gauge
+
+from src.application.ports.order_archive import OrderArchive
+from src.domain.models.order import Order, OrderItem, OrderStatus
+from src.domain.models.order_ids import ORDER_ID_TIMESTAMP_SLACK, order_id_timestamp
+
+from .storage import SegmentStorage
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"ORDSEG1\n"
+FOOTER = struct.Struct(">QQ8s")  # index offset, index length, magic
+COMPRESSION_LEVEL = 9  # written once, read rarely
+ID_PREFIX = b'{"id":"'
+
+FILTER_MAGIC = b"ORDIDS1\n"
+FILTER_BITS_PER_ID = 10  # about 1% false positives with FILTER_HASHES
+FILTER_HASHES = 7
+
+SEGMENT_NAME = re.compile(r"^(\d{14})-(\d{14})-[0-9a-f]+\.seg$")
+NAME_TIME_FORMAT = "%Y%m%d%H%M%S"
+
+ARCHIVE_LOOKUPS = Counter(
+    "orders_archive_lookups_total",
+    "Order lookups that reached the archive, by result (hit, miss)",
+    ["result"],
+)
+ARCHIVED_ORDERS = Counter(
+    "orders_archive_orders_written_total",
+    "Orders written to archive segments",
+)
+PROBE_LIMITED_LOOKUPS = Counter(
+    "orders_archive_probe_limited_lookups_total",
+    "Archive lookups that stopped after opening the maximum number of segments",
+)
+OPEN_SEGMENTS = Gauge(
+    "orders_archive_open_segments",
+    "Archive segments currently memory-mapped",
+)
+
+
+def _encode(order: Order) -> dict:
+    return {
+        "id": order.id,
+        "order_number": order.order_number,
+        "client_id": order.client_id,
+        "items": [[item.product_id, item.quantity, item.price] for item in order.items],
+        "status": order.status.value,
+        "created_at": order.created_at.isoformat(),
+        "delivery_id": order.delivery_id,
+        "version": order.version,
+    }
+
+
+def _decode(data: dict) -> Order:
+    return Order(
+        client_id=data["client_id"],
+        items=[
+            OrderItem(product_id=product_id, quantity=quantity, price=price)
+            for product_id, quantity, price in data["items"]
+        ],
+        id=data["id"],
+        order_number=data["order_number"],
+        status=OrderStatus(data["status"]),
+        created_at=datetime.fromisoformat(data["created_at"]),
+        delivery_id=data["delivery_id"],
+        # Absent from segments written before orders had versions
+        version=data.get("version", 1),
+    )
+
+
+def encode_segment(orders: list[Order], block_size: int) -> bytes:
+    orders = sorted(orders, key=lambda order: order.id)
+    out = bytearray(MAGIC)
+    first_ids: list[str] = []
+    offsets: list[int] = []
+    for start in range(0, len(orders), block_size):
+        block = orders[start:start + block_size]
+        lines = b"\n".join(
+            json.dumps(_encode(order), separators=(",", ":")).encode()
+            for order in block
+        )
+        first_ids.append(block[0].id)
+        offsets.append(len(out))
+        out += zlib.compress(lines, COMPRESSION_LEVEL)
+    # The end of the last block
+    offsets.append(len(out))
+
+    index = zlib.compress(json.dumps({
+        "first_ids": first_ids,
+        "offsets": offsets,
+        "last_id": orders[-1].id,
+        "count": len(orders),
+    }).encode())
+    index_offset = len(out)
+    out += index
+    out += FOOTER.pack(index_offset, len(index), MAGIC)
+    return bytes(out)
+
+
+class IdFilter:
+    """Bloom filter over the ids of a segment; false positives only"""
+
+    def __init__(self, bits: bytes | bytearray):
+        self.bits = bits
+        self.size = len(bits) * 8
+
+    @classmethod
+    def build(cls, order_ids: list[str]) -> "IdFilter":
+        bits = bytearray(len(order_ids) * FILTER_BITS_PER_ID // 8 + 1)
+        id_filter = cls(bits)
+        for order_id in order_ids:
+            for position in id_filter._positions(order_id):
+                bits[position >> 3] |= 1 << (position & 7)
+        return id_filter
+
+    @classmethod
+    def decode(cls, data: bytes) -> "IdFilter":
+        if data[:len(FILTER_MAGIC)] != FILTER_MAGIC:
+            raise ValueError("Not an order archive id filter")
+        return cls(data[len(FILTER_MAGIC):])
+
+    def encode(self) -> bytes:
+        return FILTER_MAGIC + bytes(self.bits)
+
+    def _positions(self, order_id: str) -> list[int]:
+        # Double hashing: FILTER_HASHES positions out of one digest
+        digest = hashlib.blake2b(order_id.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "big")
+        step = int.from_bytes(digest[8:], "big") | 1
+        return [(first + i * step) % self.size for i in range(FILTER_HASHES)]
+
+    def __contains__(self, order_id: str) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(order_id)
+        )
+
+
+def filter_name(segment: str) -> str:
+    return segment.removesuffix(".seg") + ".ids"
+
+
+def segment_name(orders: list[Order]) -> str:
+    created = [order.created_at for order in orders]
+    return (
+        f"{min(created):{NAME_TIME_FORMAT}}-{max(created):{NAME_TIME_FORMAT}}"
+        f"-{uuid.uuid4().hex[:12]}.seg"
+    )
+
+
+class _Segment:
+    """A memory-mapped segment and its parsed sparse index"""
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as file:
+            # The mapping outlives the file descriptor
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        index_offset, index_length, magic = FOOTER.unpack_from(
+            self._map, len(self._map) - FOOTER.size
+        )
+        if magic != MAGIC or self._map[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not an order archive segment")
+        index = json.loads(
+            zlib.decompress(self._map[index_offset:index_offset + index_length])
+        )
+        self.first_ids: list[str] = index["first_ids"]
+        self.offsets: list[int] = index["offsets"]
+        self.last_id: str = index["last_id"]
+
+    def block_for(self, order_id: str) -> int | None:
+        if (
+            not self.first_ids
+            or order_id < self.first_ids[0]
+            or order_id > self.last_id
+        ):
+            return None
+        return bisect_right(self.first_ids, order_id) - 1
+
+    def order_ids(self) -> list[str]:
+        return [
+            order_id
+            for block in range(len(self.first_ids))
+            for order_id in self.read_block(block)
+        ]
+
+    def read_block(self, block: int) -> dict[str, bytes]:
+        data = zlib.decompress(self._map[self.offsets[block]:self.offsets[block + 1]])
+        # Every line starts with the id, so only the order asked for is parsed
+        start = len(ID_PREFIX)
+        return {
+            line[start:line.index(b'"', start)].decode(): line
+            for line in data.split(b"\n")
+        }
+
+
+class SegmentOrderArchive(OrderArchive):
+    """
+    Order archive on top of a SegmentStorage.
+
+    Opened segments stay memory-mapped in an LRU, and recently
+    decompressed blocks are cached too. Repeated lookups of the same old
+    orders then cost neither I/O nor decompression. The blocking work runs
+    in a thread so the event loop keeps serving requests.
+
+    A lookup opens at most `max_probes` segments, however many ids it asks
+    for; ids still missing by then are reported as not found.
+    """
+
+    def __init__(
+        self,
+        storage: SegmentStorage,
+        block_size: int,
+        max_open_segments: int,
+        max_cached_blocks: int,
+        refresh_interval_seconds: float,
+        max_probes: int,
+    ):
+        self.storage = storage
+        self.block_size = block_size
+        self.max_open_segments = max_open_segments
+        self.max_cached_blocks = max_cached_blocks
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.max_probes = max_probes
+        self._lock = threading.Lock()
+        self._listing: list[tuple[str, datetime, datetime]] = []
+        self._listed_at = float("-inf")
+        self._segments: OrderedDict[str, _Segment] = OrderedDict()
+        self._blocks: OrderedDict[tuple[str, int], dict[str, bytes]] = OrderedDict()
+        # None for segments written before id filters
+        self._filters: dict[str, IdFilter | None] = {}
+
+    async def write_segment(self, orders: list[Order]) -> str:
+        if not orders:
+            raise ValueError("Cannot write an empty archive segment")
+        return await asyncio.to_thread(self._write_segment, orders)
+
+    async def find_by_id(self, order_id: str) -> Order | None:
+        return (await self.find_by_ids([order_id])).get(order_id)
+
+    async def find_by_ids(self, order_ids: list[str]) -> dict[str, Order]:
+        order_ids = list(dict.fromkeys(order_ids))
+        orders = await asyncio.to_thread(self._find, order_ids)
+        ARCHIVE_LOOKUPS.labels(result="hit").inc(len(orders))
+        ARCHIVE_LOOKUPS.labels(result="miss").inc(len(order_ids) - len(orders))
+        return orders
+
+    async def archived_before(self) -> datetime | None:
+        listing = await asyncio.to_thread(self._current_listing)
+        return max((newest for _, _, newest in listing), default=None)
+
+    def _write_segment(self, orders: list[Order]) -> str:
+        name = segment_name(orders)
+        id_filter = IdFilter.build([order.id for order in orders])
+        # The filter goes first, so a listed segment always has one
+        self.storage.put(filter_name(name), id_filter.encode())
+        self.storage.put(name, encode_segment(orders, self.block_size))
+        ARCHIVED_ORDERS.inc(len(orders))
+        with self._lock:
+            self._filters[name] = id_filter
+            # Make it visible to lookups without waiting for a refresh
+            self._listed_at = float("-inf")
+        return name
+
+    def _find(self, order_ids: list[str]) -> dict[str, Order]:
+        created = {order_id: order_id_timestamp(order_id) for order_id in order_ids}
+        found: dict[str, Order] = {}
+        probes = 0
+        for name, oldest, newest in self._current_listing():
+            wanted = [
+                order_id
+                for order_id, created_at in created.items()
+                if order_id not in found
+                and (
+                    created_at is None
+                    or oldest - ORDER_ID_TIMESTAMP_SLACK
+                    <= created_at
+                    <= newest + ORDER_ID_TIMESTAMP_SLACK
+                )
+            ]
+            if wanted:
+                wanted = self._filtered(name, wanted)
+            if not wanted:
+                continue
+            if probes == self.max_probes:
+                PROBE_LIMITED_LOOKUPS.inc()
+                logger.warning(
+                    f"Archive lookup stopped after {probes} segments, "
+                    f"{len(order_ids) - len(found)} of {len(order_ids)} ids not found"
+                )
+                break
+            probes += 1
+            segment = self._segment(name)
+            if self._filters.get(name) is None:
+                # Written before id filters: build one for the next lookups
+                id_filter = IdFilter.build(segment.order_ids())
+                with self._lock:
+                    self._filters[name] = id_filter
+            for order_id in wanted:
+                block = segment.block_for(order_id)
+                if block is None:
+                    continue
+                line = self._block(name, segment, block).get(order_id)
+                if line is not None:
+                    found[order_id] = _decode(json.loads(line))
+        return found
+
+    def _current_listing(self) -> list[tuple[str, datetime, datetime]]:
+        with self._lock:
+            if time.monotonic() - self._listed_at > self.refresh_interval_seconds:
+                self._listing = self._list()
+                self._listed_at = time.monotonic()
+                names = {name for name, _, _ in self._listing}
+                self._filters = {
+                    name: id_filter
+                    for name, id_filter in self._filters.items()
+                    if name in names
+                }
+            return self._listing
+
+    def _filtered(self, name: str, order_ids: list[str]) -> list[str]:
+        """The ids the segment may hold, per its filter"""
+        with self._lock:
+            loaded = name in self._filters
+            id_filter = self._filters.get(name)
+        if not loaded:
+            data = self.storage.get(filter_name(name))
+            id_filter = IdFilter.decode(data) if data is not None else None
+            with self._lock:
+                self._filters[name] = id_filter
+        if id_filter is None:
+            return order_ids
+        return [order_id for order_id in order_ids if order_id in id_filter]
+
+    def _list(self) -> list[tuple[str, datetime, datetime]]:
+        listing = []
+        for name in self.storage.list_segments():
+            match = SEGMENT_NAME.match(name)
+            if match is None:
+                logger.warning(f"Ignoring unexpected file {name} in the order archive")
+                continue
+            listing.append((
+                name,
+                datetime.strptime(match.group(1), NAME_TIME_FORMAT),
+                # Names are truncated to the second
+                datetime.strptime(match.group(2), NAME_TIME_FORMAT) + timedelta(
+                    seconds=1
+                ),
+            ))
+        # Newest first: recent orders are the likeliest to be looked up
+        return sorted(listing, key=lambda entry: entry[0], reverse=True)
+
+    def _segment(self, name: str) -> _Segment:
+        with self._lock:
+            segment = self._segments.get(name)
+            if segment is not None:
+                self._segments.move_to_end(name)
+                return segment
+
+        # May download the segment; do it without holding the lock
+        segment = _Segment(self.storage.local_path(name))
+        with self._lock:
+            self._segments[name] = segment
+            while len(self._segments) > self.max_open_segments:
+                # Unmapped once the last reader drops its reference
+                self._segments.popitem(last=False)
+            OPEN_SEGMENTS.set(len(self._segments))
+        return segment
+
+    def _block(self, name: str, segment: _Segment, block: int) -> dict[str, bytes]:
+        key = (name, block)
+        with self._lock:
+            lines = self._blocks.get(key)
+            if lines is not None:
+                self._blocks.move_to_end(key)
+                return lines
+
+        lines = segment.read_block(block)
+        with self._lock:
+            self._blocks[key] = lines
+            while len(self._blocks) > self.max_cached_blocks:
+                self._blocks.popitem(last=False)
+        return lines
@@ -0,0 +1,139 @@
+"""Where archive segments are kept: a local directory or an S3 prefix"""
+
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+from urllib.parse import urlparse
+
+import boto3
+from botocore.exceptions import ClientError
+
+from src.infrastructure.config.settings import settings
+
+
+class SegmentStorage(ABC):
+
+    @abstractmethod
+    def list_segments(self) -> list[str]:
+        pass
+
+    @abstractmethod
+    def put(self, name: str, data: bytes) -> None:
+        """Store a segment; readers never see a partial one"""
+        pass
+
+    @abstractmethod
+    def local_path(self, name: str) -> Path:
+        """A local copy of the segment, suitable for memory-mapping"""
+        pass
+
+    @abstractmethod
+    def get(self, name: str) -> bytes | None:
+        """A small file kept next to the segments, None if there is none"""
+        pass
+
+
+def _write_atomically(path: Path, data: bytes) -> None:
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+class LocalSegmentStorage(SegmentStorage):
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def list_segments(self) -> list[str]:
+        return [path.name for path in self.directory.glob("*.seg")]
+
+    def put(self, name: str, data: bytes) -> None:
+        _write_atomically(self.directory / name, data)
+
+    def local_path(self, name: str) -> Path:
+        return self.directory / name
+
+    def get(self, name: str) -> bytes | None:
+        try:
+            return (self.directory / name).read_bytes()
+        except FileNotFoundError:
+            return None
+
+
+class S3SegmentStorage(SegmentStorage):
+    """
+    Segments in S3, downloaded once into a local cache directory. Segments
+    are immutable, so a cached copy never goes stale.
+    """
+
+    def __init__(self, bucket: str, prefix: str, cache_dir: str):
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        if settings.AWS_ENDPOINT_URL:  # LocalStack
+            self.s3_client = boto3.client(
+                's3',
+                region_name=settings.AWS_REGION,
+                endpoint_url=settings.AWS_ENDPOINT_URL,
+                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
+            )
+        else:
+            self.s3_client = boto3.client('s3', region_name=settings.AWS_REGION)
+
+    def _key(self, name: str) -> str:
+        return f"{self.prefix}/{name}" if self.prefix else name
+
+    def list_segments(self) -> list[str]:
+        names = []
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self._key("")):
+            for item in page.get("Contents", []):
+                name = item["Key"].rsplit("/", 1)[-1]
+                if name.endswith(".seg"):
+                    names.append(name)
+        return names
+
+    def put(self, name: str, data: bytes) -> None:
+        self.s3_client.put_object(Bucket=self.bucket, Key=self._key(name), Body=data)
+
+    def local_path(self, name: str) -> Path:
+        path = self.cache_dir / name
+        if not path.exists():
+            response = self.s3_client.get_object(
+                Bucket=self.bucket, Key=self._key(name)
+            )
+            _write_atomically(path, response["Body"].read())
+        return path
+
+    def get(self, name: str) -> bytes | None:
+        try:
+            response = self.s3_client.get_object(
+                Bucket=self.bucket, Key=self._key(name)
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") == "NoSuchKey":
+                return None
+            raise
+        data: bytes = response["Body"].read()
+        return data
+
+
+def storage_from_url(url: str, cache_dir: str) -> SegmentStorage:
+    """`s3://bucket/prefix` or a local directory (optionally `file://`)"""
+    parsed = urlparse(url)
+    if parsed.scheme == "s3":
+        return S3SegmentStorage(parsed.netloc, parsed.path, cache_dir)
+    if parsed.scheme in ("", "file"):
+        return LocalSegmentStorage(parsed.path)
+    raise ValueError(f"Unsupported order archive URL '{url}'")
@@ -0,0 +1,4 @@
+from .cached_order_repository import CachedOrderRepository
+from .order_cache import OrderCache
+
+__all__ = ["CachedOrderRepository", "OrderCache"]
\ No newline at end of file
@@ -0,0 +1,144 @@
+from collections.abc import AsyncIterator
+from datetime import date, datetime
+
+from src.domain.models.order import Order, OrderStatus, OrderSummary, OrderView
+from src.domain.models.sales import SalesAggregate, SalesGrouping
+from src.domain.repositories.order_repository import OrderRepository
+
+from .order_cache import OrderCache
+
+
+class CachedOrderRepository(OrderRepository):
+    """
+    Read-through, write-through cache for find_by_id in front of another repository
+    """
+
+    def __init__(self, repository: OrderRepository, cache: OrderCache):
+        self.repository = repository
+        self.cache = cache
+
+    async def save(self, order: Order) -> Order:
+        try:
+            saved = await self.repository.save(order)
+        except Exception:
+            self.cache.invalidate(order.id)
+            raise
+        # Write-through: later reads in this process see the new state even
+        # when they are routed to a lagging replica
+        self.cache.put(saved)
+        return saved
+
+    async def save_all(self, orders: list[Order]) -> list[Order]:
+        try:
+            saved = await self.repository.save_all(orders)
+        except Exception:
+            for order in orders:
+                self.cache.invalidate(order.id)
+            raise
+        for order in saved:
+            self.cache.put(order)
+        return saved
+
+    async def delete_all(self, orders: list[Order]) -> None:
+        try:
+            await self.repository.delete_all(orders)
+        finally:
+            for order in orders:
+                self.cache.invalidate(order.id)
+
+    async def find_by_id(self, order_id: str) -> Order | None:
+        return await self.cache.get_or_load(order_id, self.repository.find_by_id)
+
+    async def find_by_ids(self, order_ids: list[str]) -> dict[str, Order]:
+        return await self.cache.get_many_or_load(order_ids, self.repository.find_by_ids)
+
+    async def lock_by_ids(self, order_ids: list[str]) -> dict[str, Order]:
+        # Always from the database: the rows must be locked
+        return await self.repository.lock_by_ids(order_ids)
+
+    async def find_version(self, order_id: str) -> int | None:
+        # Answers repeated polls without a query while the order is cached
+        cached = self.cache.peek(order_id)
+        if cached is not None:
+            return cached.version
+        return await self.repository.find_version(order_id)
+
+    async def claim_stuck(self, created_before: datetime, limit: int) -> list[Order]:
+        # Always from the database: the rows must be locked
+        return await self.repository.claim_stuck(created_before, limit)
+
+    async def count_stuck(self, created_before: datetime) -> int:
+        return await self.repository.count_stuck(created_before)
+
+    async def find_all(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        after: tuple[datetime, str] | None = None,
+        fields: list[str] | None = None,
+        statuses: list[OrderStatus] | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None
+    ) -> list[OrderView]:
+        return await self.repository.find_all(
+            limit=limit,
+            offset=offset,
+            after=after,
+            fields=fields,
+            statuses=statuses,
+            created_from=created_from,
+            created_to=created_to
+        )
+
+    async def stream_orders(
+        self,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+        statuses: list[OrderStatus] | None = None
+    ) -> AsyncIterator[Order]:
+        async for order in self.repository.stream_orders(
+            created_from=created_from, created_to=created_to, statuses=statuses
+        ):
+            yield order
+
+    async def find_summaries_by_client(
+        self,
+        client_id: str,
+        limit: int = 100,
+        after: tuple[datetime, str] | None = None,
+        statuses: list[OrderStatus] | None = None
+    ) -> list[OrderSummary]:
+        return await self.repository.find_summaries_by_client(
+            client_id, limit=limit, after=after, statuses=statuses
+        )
+
+    async def find_by_product_id(
+        self, product_id: str, limit: int = 100, offset: int = 0
+    ) -> list[Order]:
+        return await self.repository.find_by_product_id(
+            product_id, limit=limit, offset=offset
+        )
+
+    async def units_sold_by_product(self, product_ids: list[str]) -> dict[str, int]:
+        return await self.repository.units_sold_by_product(product_ids)
+
+    async def stream_product_demand(
+        self, date_from: date, date_to: date, product_ids: list[str] | None = None
+    ) -> AsyncIterator[list[tuple[str, list[int], list[int]]]]:
+        async for rows in self.repository.stream_product_demand(
+            date_from, date_to, product_ids
+        ):
+            yield rows
+
+    async def sales_aggregates(
+        self,
+        grouping: SalesGrouping,
+        date_from: date,
+        date_to: date,
+        status: OrderStatus = OrderStatus.CREATED,
+        key: str | None = None,
+        limit: int = 1000
+    ) -> list[SalesAggregate]:
+        return await self.repository.sales_aggregates(
+            grouping, date_from, date_to, status=status, key=key, limit=limit
+        )
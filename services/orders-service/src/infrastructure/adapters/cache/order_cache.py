@@ -0,0 +1,222 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import replace
+
+from prometheus_client import Counter, Gauge
+
+from src.domain.models.order import Order, OrderStatus
+
+logger = logging.getLogger(__name__)
+
+# Orders in these states never change again, so they can be kept much
+# longer. Created orders are left out: another instance may cancel them,
+# and only this instance's own writes invalidate its entries
+TERMINAL_STATUSES = frozenset({OrderStatus.REJECTED, OrderStatus.CANCELLED})
+
+# Hit ratio: sum(rate(orders_cache_requests_total{result!="miss"}[5m]))
+#            / sum(rate(orders_cache_requests_total[5m]))
+CACHE_REQUESTS = Counter(
+    "orders_cache_requests_total",
+    "Order cache lookups, by result (hit, miss, coalesced)",
+    ["result"],
+)
+CACHE_EVICTIONS = Counter(
+    "orders_cache_evictions_total",
+    "Order cache entries evicted to stay within the size bound",
+)
+CACHE_ENTRIES = Gauge(
+    "orders_cache_entries",
+    "Orders currently held in the cache",
+)
+
+
+class OrderCache:
+    """
+    Bounded in-process LRU cache of orders with per-status TTLs.
+
+    Concurrent misses for the same id share a single load, so a burst of
+    polls for one order costs one query.
+    """
+
+    def __init__(
+        self, max_entries: int, ttl_seconds: float, terminal_ttl_seconds: float
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.terminal_ttl_seconds = terminal_ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, Order]] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Future] = {}
+        self._stale_loads: set[str] = set()
+
+    async def get_or_load(
+        self,
+        order_id: str,
+        loader: Callable[[str], Awaitable[Order | None]]
+    ) -> Order | None:
+        entry = self._entries.get(order_id)
+        if entry is not None:
+            expires_at, cached = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(order_id)
+                CACHE_REQUESTS.labels(result="hit").inc()
+                return self._copy(cached)
+            self._remove(order_id)
+
+        in_flight = self._in_flight.get(order_id)
+        if in_flight is not None:
+            CACHE_REQUESTS.labels(result="coalesced").inc()
+            try:
+                order = await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                if not in_flight.cancelled():
+                    raise
+                # The request that was loading went away; load it ourselves
+                return await self.get_or_load(order_id, loader)
+            return self._copy(order) if order else None
+
+        CACHE_REQUESTS.labels(result="miss").inc()
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[order_id] = future
+        try:
+            order = await loader(order_id)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark as retrieved; waiters (if any) still receive it
+            future.exception()
+            raise
+        finally:
+            self._in_flight.pop(order_id, None)
+            stale = order_id in self._stale_loads
+            self._stale_loads.discard(order_id)
+
+        if order is not None and not stale:
+            self._put(order)
+        future.set_result(order)
+        return self._copy(order) if order else None
+
+    async def get_many_or_load(
+        self,
+        order_ids: list[str],
+        loader: Callable[[list[str]], Awaitable[dict[str, Order]]]
+    ) -> dict[str, Order]:
+        """
+        get_or_load for many orders: fresh entries are served from the
+        cache, loads already in flight are joined, and every other id is
+        loaded with a single loader call. Ids not found are left out.
+        """
+        found: dict[str, Order] = {}
+        joined: dict[str, asyncio.Future] = {}
+        missing: list[str] = []
+        now = time.monotonic()
+        for order_id in dict.fromkeys(order_ids):
+            entry = self._entries.get(order_id)
+            if entry is not None:
+                expires_at, cached = entry
+                if expires_at > now:
+                    self._entries.move_to_end(order_id)
+                    CACHE_REQUESTS.labels(result="hit").inc()
+                    found[order_id] = self._copy(cached)
+                    continue
+                self._remove(order_id)
+            in_flight = self._in_flight.get(order_id)
+            if in_flight is not None:
+                CACHE_REQUESTS.labels(result="coalesced").inc()
+                joined[order_id] = in_flight
+            else:
+                CACHE_REQUESTS.labels(result="miss").inc()
+                missing.append(order_id)
+
+        if missing:
+            loop = asyncio.get_running_loop()
+            futures = {order_id: loop.create_future() for order_id in missing}
+            self._in_flight.update(futures)
+            try:
+                loaded = await loader(missing)
+            except asyncio.CancelledError:
+                for future in futures.values():
+                    future.cancel()
+                raise
+            except Exception as e:
+                for future in futures.values():
+                    future.set_exception(e)
+                    future.exception()
+                raise
+            finally:
+                stale = set()
+                for order_id in missing:
+                    self._in_flight.pop(order_id, None)
+                    if order_id in self._stale_loads:
+                        stale.add(order_id)
+                        self._stale_loads.discard(order_id)
+
+            for order_id in missing:
+                order = loaded.get(order_id)
+                if order is not None:
+                    if order_id not in stale:
+                        self._put(order)
+                    found[order_id] = self._copy(order)
+                futures[order_id].set_result(order)
+
+        async def load_one(order_id: str) -> Order | None:
+            return (await loader([order_id])).get(order_id)
+
+        for order_id, in_flight in joined.items():
+            try:
+                order = await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                if not in_flight.cancelled():
+                    raise
+                # The request that was loading went away; load it ourselves
+                order = await self.get_or_load(order_id, load_one)
+            else:
+                order = self._copy(order) if order else None
+            if order is not None:
+                found[order_id] = order
+        return found
+
+    def peek(self, order_id: str) -> Order | None:
+        """The cached order if it is still fresh, without loading it. Do not mutate."""
+        entry = self._entries.get(order_id)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def invalidate(self, order_id: str) -> None:
+        self._remove(order_id)
+        if order_id in self._in_flight:
+            # A load that started before this write must not be cached
+            self._stale_loads.add(order_id)
+
+    def put(self, order: Order) -> None:
+        """Store the state just written, superseding any load in progress"""
+        self.invalidate(order.id)
+        self._put(self._copy(order))
+
+    def _put(self, order: Order) -> None:
+        if order.status in TERMINAL_STATUSES:
+            ttl = self.terminal_ttl_seconds
+        else:
+            ttl = self.ttl_seconds
+        if ttl <= 0:
+            return
+        self._entries[order.id] = (time.monotonic() + ttl, order)
+        self._entries.move_to_end(order.id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            CACHE_EVICTIONS.inc()
+        CACHE_ENTRIES.set(len(self._entries))
+
+    def _remove(self, order_id: str) -> None:
+        if self._entries.pop(order_id, None) is not None:
+            CACHE_ENTRIES.set(len(self._entries))
+
+    @staticmethod
+    def _copy(order: Order) -> Order:
+        # Callers may mutate what they get back (e.g. status transitions)
+        return replace(order, items=list(order.items))
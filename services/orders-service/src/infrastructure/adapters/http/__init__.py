@@ -1,3 +1,4 @@
+from .batching_inventory_service import BatchingInventoryService
 from .inventory_service_impl import HTTPInventoryService
 
-__all__ = ["HTTPInventoryService"]
\ No newline at end of file
+__all__ = ["BatchingInventoryService", "HTTPInventoryService"]
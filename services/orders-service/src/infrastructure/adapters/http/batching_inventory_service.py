@@ -0,0 +1,136 @@
+import asyncio
+import logging
+from collections.abc import Callable
+
+from prometheus_client import Histogram
+
+from src.application.ports.inventory_service import InventoryService
+
+from .inventory_service_impl import MAX_CHECK_PRODUCTS
+
+logger = logging.getLogger(__name__)
+
+CHECK_BATCH_PRODUCTS = Histogram(
+    "orders_inventory_check_batch_products",
+    "Distinct product ids per batched inventory stock check",
+    buckets=(1, 2, 5, 10, 20, 50, 100),
+)
+CHECK_BATCH_REQUESTS = Histogram(
+    "orders_inventory_check_batch_requests",
+    "check_stock calls answered by one batched inventory stock check",
+    buckets=(1, 2, 5, 10, 20, 50, 100),
+)
+
+
+class _CheckBatch:
+    __slots__ = ("product_ids", "requests", "result", "timer")
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        window_seconds: float,
+        dispatch: Callable[[], None],
+    ):
+        # A dict keeps the ids in arrival order, without duplicates
+        self.product_ids: dict[str, None] = {}
+        self.requests = 0
+        self.result: asyncio.Future = loop.create_future()
+        self.timer = loop.call_later(window_seconds, dispatch)
+
+
+class BatchingInventoryService(InventoryService):
+    """
+    Batches stock checks in front of another inventory service, like a
+    DataLoader.
+
+    check_stock() calls made within `window_seconds` of each other share
+    one check of the union of their product ids, and each caller gets the
+    stock of its own ids. A batch is sent early once it holds
+    `max_batch_size` ids (at most the 100 a /check request accepts).
+    Callers asking for more ids than that are not batched. Reservations
+    and releases go straight to the wrapped service.
+    """
+
+    def __init__(
+        self,
+        inventory_service: InventoryService,
+        window_seconds: float,
+        max_batch_size: int,
+    ):
+        self.inventory_service = inventory_service
+        self.window_seconds = max(0.0, window_seconds)
+        self.max_batch_size = max(1, min(max_batch_size, MAX_CHECK_PRODUCTS))
+        self._batch: _CheckBatch | None = None
+        self._loads: set[asyncio.Task] = set()
+
+    async def check_stock(self, product_ids: list[str]) -> dict[str, int]:
+        wanted = list(dict.fromkeys(product_ids))
+        if not wanted:
+            return {}
+        if len(wanted) > self.max_batch_size:
+            CHECK_BATCH_PRODUCTS.observe(len(wanted))
+            CHECK_BATCH_REQUESTS.observe(1)
+            return await self.inventory_service.check_stock(wanted)
+
+        batch = self._batch
+        if (
+            batch is not None
+            and len(batch.product_ids.keys() | set(wanted)) > self.max_batch_size
+        ):
+            self._dispatch()
+            batch = None
+        if batch is None:
+            batch = self._batch = _CheckBatch(
+                asyncio.get_running_loop(), self.window_seconds, self._dispatch
+            )
+
+        batch.product_ids.update(dict.fromkeys(wanted))
+        batch.requests += 1
+        if len(batch.product_ids) >= self.max_batch_size:
+            self._dispatch()
+
+        # Shielded: a cancelled caller must not cancel the batch of the others
+        stock = await asyncio.shield(batch.result)
+        return {
+            product_id: stock[product_id]
+            for product_id in wanted
+            if product_id in stock
+        }
+
+    def _dispatch(self) -> None:
+        batch, self._batch = self._batch, None
+        if batch is None:
+            return
+        batch.timer.cancel()
+        task = asyncio.get_running_loop().create_task(self._load(batch))
+        self._loads.add(task)
+        task.add_done_callback(self._loads.discard)
+
+    async def _load(self, batch: _CheckBatch) -> None:
+        CHECK_BATCH_PRODUCTS.observe(len(batch.product_ids))
+        CHECK_BATCH_REQUESTS.observe(batch.requests)
+        try:
+            stock = await self.inventory_service.check_stock(list(batch.product_ids))
+        except Exception as e:
+            logger.error(
+                f"Batched stock check of {len(batch.product_ids)} products "
+                f"failed: {str(e)}"
+            )
+            batch.result.set_exception(e)
+            # Retrieved here too, in case every caller was cancelled meanwhile
+            batch.result.exception()
+            return
+        batch.result.set_result(stock)
+
+    async def reserve_stock(
+        self, items: dict[str, int], orders: dict[str, dict[str, int]] | None = None
+    ) -> bool:
+        return await self.inventory_service.reserve_stock(items, orders)
+
+    async def find_reservations(
+        self, order_ids: list[str]
+    ) -> dict[str, dict[str, int]]:
+        return await self.inventory_service.find_reservations(order_ids)
+
+    async def release_stock(self, order_ids: list[str]) -> list[str]:
+        return await self.inventory_service.release_stock(order_ids)
@@ -4,75 +4,150 @@ from typing import Dict, List
 import httpx
 
 from src.application.ports.inventory_service import InventoryService
+from src.domain.exceptions import ExternalServiceException
 from src.infrastructure.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Limit of a single /api/v1/inventory/check request
+MAX_CHECK_PRODUCTS = 100
+# Limit of a single reservation lookup or release request
+MAX_RESERVATION_ORDERS = 100
+# Answers of /reserve that mean the stock is not there, as opposed to an outage
+RESERVATION_REFUSED_STATUSES = (404, 409)
+
 
 class HTTPInventoryService(InventoryService):
     
-    def __init__(self):
+    def __init__(self, transport: httpx.AsyncBaseTransport | None = None):
         self.base_url = settings.INVENTORY_SERVICE_URL
         self.timeout = httpx.Timeout(5.0, connect=2.0)
         self.max_retries = 3
+        # Replaced in tests to stand in for the inventory service
+        self.transport = transport
     
     async def check_stock(self, product_ids: list[str]) -> dict[str, int]:
         """
-        Check stock availability for products
-        Returns empty dict on error (fail-safe)
+        Check stock availability for products, in chunks of at most
+        MAX_CHECK_PRODUCTS ids per request
+        Raises: ExternalServiceException when inventory cannot answer, so
+                an outage is never mistaken for products out of stock
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            for attempt in range(self.max_retries):
-                try:
-                    response = await client.post(
-                        f"{self.base_url}/api/v1/inventory/check",
-                        json={"product_ids": product_ids}
+        unique_ids = list(dict.fromkeys(product_ids))
+        stock: dict[str, int] = {}
+        async with self._client() as client:
+            for start in range(0, len(unique_ids), MAX_CHECK_PRODUCTS):
+                chunk = unique_ids[start:start + MAX_CHECK_PRODUCTS]
+                stock.update(await self._check_stock_chunk(client, chunk))
+        return stock
+
+    async def _check_stock_chunk(
+        self, client: httpx.AsyncClient, product_ids: list[str]
+    ) -> dict[str, int]:
+        for attempt in range(self.max_retries):
+            try:
+                response = await client.post(
+                    f"{self.base_url}/api/v1/inventory/check",
+                    json={"product_ids": product_ids}
+                )
+                response.raise_for_status()
+                
+                data = response.json()
+                return data.get("stock", {})
+                
+            except httpx.TransportError as e:
+                # Timeouts and connection errors; the check is safe to repeat
+                logger.warning(
+                    "Error checking inventory (attempt "
+                    f"{attempt + 1}/{self.max_retries}): "
+                    f"{type(e).__name__}"
+                )
+                if attempt == self.max_retries - 1:
+                    logger.error("All retry attempts failed for inventory check")
+                    raise ExternalServiceException(
+                        f"Inventory check failed: {type(e).__name__}"
                     )
-                    response.raise_for_status()
-                    
-                    data = response.json()
-                    return data.get("stock", {})
-                    
-                except httpx.TimeoutException:
-                    logger.warning(f"Timeout checking inventory (attempt {attempt + 1}/{self.max_retries})")
-                    if attempt == self.max_retries - 1:
-                        logger.error("All retry attempts failed for inventory check")
-                        return {}
-                    
-                except httpx.HTTPStatusError as e:
-                    logger.error(f"HTTP error checking inventory: {e.response.status_code}")
-                    return {}
-                    
-                except Exception as e:
-                    logger.error(f"Unexpected error checking inventory: {str(e)}")
-                    return {}
+                
+            except httpx.HTTPStatusError as e:
+                logger.error(f"HTTP error checking inventory: {e.response.status_code}")
+                raise ExternalServiceException(
+                    f"Inventory check failed with HTTP {e.response.status_code}"
+                )
         
-        return {}
+        raise ExternalServiceException("Inventory check failed")
     
-    async def reserve_stock(self, items: Dict[str, int]) -> bool:
+    async def reserve_stock(
+        self, items: Dict[str, int], orders: Dict[str, Dict[str, int]] | None = None
+    ) -> bool:
         """
         Reserve stock for order items
-        Returns False on any error
+        Returns False when inventory refuses the reservation: not enough
+        stock, or unknown products
+        Raises: ExternalServiceException on timeouts, connection errors and
+                other error responses. The reservation may have been applied
+                anyway; reserving the same orders again is harmless.
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        payload: dict = {"items": items}
+        if orders is not None:
+            payload["orders"] = orders
+        async with self._client() as client:
             try:
                 response = await client.post(
                     f"{self.base_url}/api/v1/inventory/reserve",
-                    json={"items": items}
+                    json=payload
+                )
+            except httpx.TransportError as e:
+                logger.error(f"Error reserving stock: {type(e).__name__}")
+                raise ExternalServiceException(
+                    f"Stock reservation failed: {type(e).__name__}"
+                )
+
+        if response.status_code in RESERVATION_REFUSED_STATUSES:
+            logger.warning(f"Stock reservation refused: {response.status_code}")
+            return False
+        if response.is_error:
+            logger.error(f"HTTP error reserving stock: {response.status_code}")
+            raise ExternalServiceException(
+                f"Stock reservation failed with HTTP {response.status_code}"
+            )
+        return response.json().get("reserved", False)
+
+    async def find_reservations(
+        self, order_ids: List[str]
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Stock held by each order, in chunks of at most MAX_RESERVATION_ORDERS
+        ids per request. Errors are raised, not swallowed.
+        """
+        reservations: Dict[str, Dict[str, int]] = {}
+        async with self._client() as client:
+            for start in range(0, len(order_ids), MAX_RESERVATION_ORDERS):
+                response = await client.get(
+                    f"{self.base_url}/api/v1/inventory/reservations",
+                    params={
+                        "order_ids": order_ids[start:start + MAX_RESERVATION_ORDERS]
+                    }
                 )
                 response.raise_for_status()
-                
-                data = response.json()
-                return data.get("reserved", False)
-                
-            except httpx.TimeoutException:
-                logger.error("Timeout reserving stock")
-                return False
-                
-            except httpx.HTTPStatusError as e:
-                logger.error(f"HTTP error reserving stock: {e.response.status_code}")
-                return False
-                
-            except Exception as e:
-                logger.error(f"Unexpected error reserving stock: {str(e)}")
-                return False
\ No newline at end of file
+                reservations.update(response.json()["reservations"])
+        return reservations
+
+    async def release_stock(self, order_ids: List[str]) -> List[str]:
+        """
+        Release the stock held by orders, with one request per
+        MAX_RESERVATION_ORDERS orders. Errors are raised, not swallowed.
+        """
+        released: List[str] = []
+        async with self._client() as client:
+            for start in range(0, len(order_ids), MAX_RESERVATION_ORDERS):
+                response = await client.post(
+                    f"{self.base_url}/api/v1/inventory/release",
+                    json={"order_ids": order_ids[start:start + MAX_RESERVATION_ORDERS]}
+                )
+                response.raise_for_status()
+                released.extend(response.json()["released"])
+        logger.info(f"Released stock of {len(released)} of {len(order_ids)} orders")
+        return released
+
+    def _client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(timeout=self.timeout, transport=self.transport)
@@ -1,18 +1,78 @@
+import asyncio
 import json
 import logging
+import random
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Any
 
 import boto3
-from botocore.exceptions import ClientError
+from botocore.exceptions import BotoCoreError, ClientError
+from prometheus_client import Counter, Gauge
 
 from src.application.ports.event_publisher import EventPublisher
+from src.domain.exceptions import ExternalServiceException
 from src.infrastructure.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# SendMessageBatch limits
+MAX_BATCH_ENTRIES = 10
+MAX_BATCH_BYTES = 256 * 1024
+
+OVERFLOW_POLICIES = ("block", "drop_newest", "drop_oldest")
+
+# Error codes SQS reports as sender faults that still succeed when retried
+THROTTLING_CODES = frozenset({
+    "RequestThrottled",
+    "ThrottlingException",
+    "Throttling",
+    "KMS.ThrottlingException",
+})
+
+_STOP = object()
+
+EVENTS_TOTAL = Counter(
+    "orders_event_publisher_messages_total",
+    "Events handled by the SQS publisher, by outcome",
+    ["outcome"],
+)
+QUEUE_DEPTH = Gauge(
+    "orders_event_publisher_queue_depth",
+    "Events waiting in the in-memory publish queue",
+)
+BATCH_SIZE = Gauge(
+    "orders_event_publisher_last_batch_size",
+    "Number of entries in the last SendMessageBatch call",
+)
+FLUSHER_RESTARTS = Counter(
+    "orders_event_publisher_flusher_restarts_total",
+    "Times the background flusher died and was restarted",
+)
+
+
+def is_retryable(error: ClientError) -> bool:
+    """Only sender faults are final, apart from throttling"""
+    details = error.response.get("Error", {})
+    if details.get("Code") in THROTTLING_CODES:
+        return True
+    return details.get("Type") != "Sender"
+
 
 class SQSEventPublisher(EventPublisher):
-    
+    """
+    Non-blocking SQS publisher.
+
+    publish() only enqueues the event; a background flusher groups queued
+    events into SendMessageBatch calls (flushed by size or after
+    SQS_BATCH_MAX_WAIT_MS) and runs the blocking boto3 call on a bounded
+    thread pool, so the event loop never waits on an SQS round trip.
+
+    Failed sends and failed entries are retried with exponential backoff
+    and full jitter, up to SQS_PUBLISH_MAX_RETRIES attempts; only sender
+    faults are given up on at once. A flusher that dies is restarted.
+    """
+
     def __init__(self):
         self.queue_url = settings.SQS_QUEUE_URL
         self.is_mock = self.queue_url.startswith('mock://')
@@ -35,38 +95,275 @@ class SQSEventPublisher(EventPublisher):
                 region_name=settings.AWS_REGION
             )
 
+        if settings.SQS_PUBLISH_OVERFLOW_POLICY not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Invalid SQS_PUBLISH_OVERFLOW_POLICY "
+                f"'{settings.SQS_PUBLISH_OVERFLOW_POLICY}', expected one of "
+                f"{OVERFLOW_POLICIES}"
+            )
+
+        self.overflow_policy = settings.SQS_PUBLISH_OVERFLOW_POLICY
+        self.enqueue_timeout = settings.SQS_PUBLISH_ENQUEUE_TIMEOUT_SECONDS
+        self.batch_size = max(1, min(settings.SQS_BATCH_SIZE, MAX_BATCH_ENTRIES))
+        self.batch_max_wait = settings.SQS_BATCH_MAX_WAIT_MS / 1000
+        self.max_retries = max(1, settings.SQS_PUBLISH_MAX_RETRIES)
+        self.retry_base = settings.SQS_PUBLISH_RETRY_BASE_SECONDS
+        self.retry_max = settings.SQS_PUBLISH_RETRY_MAX_SECONDS
+        self.workers = settings.SQS_PUBLISH_WORKERS
+
+        # Created lazily so they bind to the running event loop
+        self._queue: asyncio.Queue | None = None
+        self._in_flight: asyncio.Semaphore | None = None
+        self._flusher: asyncio.Task | None = None
+        self._send_tasks: set[asyncio.Task] = set()
+        self._executor: ThreadPoolExecutor | None = None
+        self._closed = False
+
     async def publish(self, event_type: str, payload: dict[str, Any]) -> None:
         """
-        Publish event to SQS queue
+        Enqueue event for batched delivery to the SQS queue
         """
-        try:
-            message = {
-                "event_type": event_type,
-                "payload": payload
-            }
+        message = {
+            "event_type": event_type,
+            "payload": payload
+        }
+
+        if self.is_mock:
+            # Mock mode - just log the event
+            logger.info(f"[MOCK] Published {event_type} event: {json.dumps(message, indent=2)}")
+            return
+
+        if self._closed:
+            raise ExternalServiceException("Event publisher is shutting down")
+
+        self._ensure_started()
 
-            if self.is_mock:
-                # Mock mode - just log the event
-                logger.info(f"[MOCK] Published {event_type} event: {json.dumps(message, indent=2)}")
-                return
-
-            response = self.sqs_client.send_message(
-                QueueUrl=self.queue_url,
-                MessageBody=json.dumps(message),
-                MessageAttributes={
-                    'EventType': {
-                        'StringValue': event_type,
-                        'DataType': 'String'
-                    }
+        entry = {
+            "MessageBody": json.dumps(message),
+            "MessageAttributes": {
+                'EventType': {
+                    'StringValue': event_type,
+                    'DataType': 'String'
                 }
+            }
+        }
+        await self._enqueue(entry, event_type)
+
+    async def close(self) -> None:
+        """
+        Stop accepting events and flush everything still queued or in flight
+        """
+        if self.is_mock or self._closed:
+            return
+        self._closed = True
+
+        if self._queue is None:
+            return
+
+        try:
+            await asyncio.wait_for(
+                self._drain(), timeout=settings.SQS_PUBLISH_SHUTDOWN_TIMEOUT_SECONDS
+            )
+        except TimeoutError:
+            logger.error(
+                f"Timed out flushing event publisher, {self._queue.qsize()} events "
+                "not sent"
             )
+        finally:
+            if self._executor:
+                self._executor.shutdown(wait=False)
+        logger.info("Event publisher flushed and closed")
+
+    def _ensure_started(self) -> None:
+        if self._flusher is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=settings.SQS_PUBLISH_QUEUE_SIZE)
+        self._in_flight = asyncio.Semaphore(self.workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="sqs-publisher"
+        )
+        self._start_flusher()
+
+    def _start_flusher(self) -> None:
+        self._flusher = asyncio.get_running_loop().create_task(self._run_flusher())
+        self._flusher.add_done_callback(self._flusher_done)
+
+    def _flusher_done(self, flusher: asyncio.Task) -> None:
+        # The flusher only returns on close; anything else would leave
+        # events piling up in the queue with nothing sending them
+        if flusher.cancelled() or self._closed:
+            return
+        FLUSHER_RESTARTS.inc()
+        logger.error(
+            f"Event publisher flusher died, restarting it: {flusher.exception()!r}"
+        )
+        self._start_flusher()
+
+    async def _enqueue(self, entry: dict[str, Any], event_type: str) -> None:
+        if self.overflow_policy == "block":
+            # Backpressure: callers wait for room, up to the enqueue timeout
+            try:
+                await asyncio.wait_for(
+                    self._queue.put(entry), timeout=self.enqueue_timeout
+                )
+            except TimeoutError:
+                EVENTS_TOTAL.labels(outcome="rejected").inc()
+                logger.error(f"Publish queue full, rejected {event_type} event")
+                raise ExternalServiceException("Event publish queue is full")
+        elif self._queue.full() and self.overflow_policy == "drop_newest":
+            EVENTS_TOTAL.labels(outcome="dropped").inc()
+            logger.warning(f"Publish queue full, dropped {event_type} event")
+            return
+        else:
+            if self._queue.full():  # drop_oldest
+                self._queue.get_nowait()
+                EVENTS_TOTAL.labels(outcome="dropped").inc()
+                logger.warning("Publish queue full, dropped oldest queued event")
+            self._queue.put_nowait(entry)
+
+        QUEUE_DEPTH.set(self._queue.qsize())
+
+    async def _run_flusher(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            first = await self._queue.get()
+            if first is _STOP:
+                break
+
+            batch = [first]
+            batch_bytes = len(first["MessageBody"])
+            deadline = loop.time() + self.batch_max_wait
+
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    entry = await asyncio.wait_for(self._queue.get(), timeout=timeout)
+                except TimeoutError:
+                    break
+                if entry is _STOP:
+                    stopping = True
+                    break
+                entry_bytes = len(entry["MessageBody"])
+                if batch_bytes + entry_bytes > MAX_BATCH_BYTES:
+                    await self._dispatch(batch)
+                    batch, batch_bytes = [], 0
+                batch.append(entry)
+                batch_bytes += entry_bytes
+
+            QUEUE_DEPTH.set(self._queue.qsize())
+            await self._dispatch(batch)
+
+    async def _dispatch(self, batch: list[dict[str, Any]]) -> None:
+        # Bounded concurrency: wait for a free worker before taking more work
+        await self._in_flight.acquire()
+        task = asyncio.get_running_loop().create_task(self._send_batch(batch))
+        self._send_tasks.add(task)
+        task.add_done_callback(self._send_tasks.discard)
 
-            logger.info(f"Published {event_type} event with MessageId: {response['MessageId']}")
+    async def _drain(self) -> None:
+        await self._queue.put(_STOP)
+        # Not restarted once closed: what it left in the queue is sent below
+        await asyncio.gather(self._flusher, return_exceptions=True)
 
-        except ClientError as e:
-            logger.error(f"AWS client error publishing event: {e}")
-            raise
+        # Events enqueued by publishers that were already waiting for room
+        leftover = []
+        while not self._queue.empty():
+            entry = self._queue.get_nowait()
+            if entry is not _STOP:
+                leftover.append(entry)
+        for start in range(0, len(leftover), self.batch_size):
+            await self._dispatch(leftover[start:start + self.batch_size])
+
+        if self._send_tasks:
+            await asyncio.gather(*self._send_tasks, return_exceptions=True)
+        QUEUE_DEPTH.set(0)
+
+    async def _send_batch(self, batch: list[dict[str, Any]]) -> None:
+        loop = asyncio.get_running_loop()
+        entries = [{"Id": str(index), **entry} for index, entry in enumerate(batch)]
+        BATCH_SIZE.set(len(entries))
+
+        try:
+            for attempt in range(self.max_retries):
+                if attempt:
+                    await asyncio.sleep(self._backoff(attempt))
+
+                try:
+                    response = await loop.run_in_executor(
+                        self._executor,
+                        partial(
+                            self.sqs_client.send_message_batch,
+                            QueueUrl=self.queue_url,
+                            Entries=entries
+                        )
+                    )
+                except ClientError as e:
+                    if not is_retryable(e):
+                        EVENTS_TOTAL.labels(outcome="failed").inc(len(entries))
+                        logger.error(f"AWS client error publishing events: {e}")
+                        return
+                    logger.warning(
+                        f"AWS client error publishing {len(entries)} events "
+                        f"(attempt {attempt + 1}/{self.max_retries}): {e}"
+                    )
+                    continue
+                except BotoCoreError as e:
+                    # Connection errors and timeouts
+                    logger.warning(
+                        f"Failed to reach SQS with {len(entries)} events "
+                        f"(attempt {attempt + 1}/{self.max_retries}): {e}"
+                    )
+                    continue
+
+                successful = response.get("Successful", [])
+                failed = response.get("Failed", [])
+                EVENTS_TOTAL.labels(outcome="sent").inc(len(successful))
+                if successful:
+                    logger.info(f"Published batch of {len(successful)} events")
+                if not failed:
+                    return
+
+                # Sender faults (e.g. malformed message) will never succeed
+                retry_ids = set()
+                for failure in failed:
+                    if (
+                        failure.get("SenderFault")
+                        and failure.get("Code") not in THROTTLING_CODES
+                    ):
+                        EVENTS_TOTAL.labels(outcome="failed").inc()
+                        logger.error(
+                            f"SQS rejected event: {failure.get('Code')} "
+                            f"{failure.get('Message')}"
+                        )
+                    else:
+                        retry_ids.add(failure["Id"])
+
+                entries = [entry for entry in entries if entry["Id"] in retry_ids]
+                if not entries:
+                    return
+                logger.warning(
+                    f"Retrying {len(entries)} events (attempt "
+                    f"{attempt + 1}/{self.max_retries})"
+                )
+
+            EVENTS_TOTAL.labels(outcome="failed").inc(len(entries))
+            logger.error(
+                f"Giving up on {len(entries)} events after {self.max_retries} attempts"
+            )
 
         except Exception as e:
-            logger.error(f"Unexpected error publishing event: {str(e)}")
-            raise
\ No newline at end of file
+            EVENTS_TOTAL.labels(outcome="failed").inc(len(entries))
+            logger.error(f"Unexpected error publishing events: {str(e)}")
+
+        finally:
+            self._in_flight.release()
+
+    def _backoff(self, attempt: int) -> float:
+        """Full jitter: spreads the retries of concurrent senders apart"""
+        return random.uniform(
+            0, min(self.retry_base * 2 ** (attempt - 1), self.retry_max)
+        )
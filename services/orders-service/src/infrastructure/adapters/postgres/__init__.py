@@ -1,5 +1,19 @@
-from .models import Base, OrderModel
+from .idempotency_store_impl import PostgresIdempotencyStore
+from .models import (
+    Base, IdempotencyKeyModel, OrderItemModel, OrderModel, OrderQueueModel
+)
+from .order_queue_impl import PostgresOrderQueue
 from .order_repository_impl import PostgresOrderRepository
 from .session import get_db_session
 
-__all__ = ["PostgresOrderRepository", "get_db_session", "Base", "OrderModel"]
\ No newline at end of file
+__all__ = [
+    "PostgresOrderRepository",
+    "PostgresOrderQueue",
+    "PostgresIdempotencyStore",
+    "get_db_session",
+    "Base",
+    "OrderModel",
+    "OrderItemModel",
+    "OrderQueueModel",
+    "IdempotencyKeyModel",
+]
\ No newline at end of file
@@ -0,0 +1,160 @@
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.ports.idempotency_store import IdempotencyRecord, IdempotencyStore
+
+from .models import IdempotencyKeyModel
+
+
+class PostgresIdempotencyStore(IdempotencyStore):
+    """
+    Idempotency keys in the order_idempotency_keys table. The primary key on
+    (client_id, key) is what makes claiming atomic across instances.
+
+    Every call runs in a short session of its own, never in the request's:
+    the key must still be released or completed after the request's
+    transaction failed, and renewed while that transaction is busy.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        ttl_seconds: float,
+        lease_seconds: float,
+    ):
+        self.session_factory = session_factory
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.lease = timedelta(seconds=lease_seconds)
+
+    async def claim(
+        self, client_id: str, key: str, request_hash: str, order_id: str
+    ) -> IdempotencyRecord | None:
+        async with self.session_factory() as session:
+            # Two rounds: the second runs after an expired or abandoned key is cleared
+            for _ in range(2):
+                now = datetime.utcnow()
+                session.add(
+                    IdempotencyKeyModel(
+                        client_id=client_id,
+                        key=key,
+                        request_hash=request_hash,
+                        order_id=order_id,
+                        created_at=now,
+                        claimed_at=now,
+                    )
+                )
+                try:
+                    await session.commit()
+                    return None
+                except IntegrityError:
+                    await session.rollback()
+
+                existing = await self._get(session, client_id, key)
+                if existing is None:
+                    continue
+                if not self._reusable(existing):
+                    return existing
+
+                # The claimed_at match keeps a row claimed or renewed
+                # concurrently from being deleted
+                await session.execute(
+                    delete(IdempotencyKeyModel).where(
+                        IdempotencyKeyModel.client_id == client_id,
+                        IdempotencyKeyModel.key == key,
+                        IdempotencyKeyModel.claimed_at == existing.claimed_at,
+                    )
+                )
+                await session.commit()
+
+            return await self._get(session, client_id, key)
+
+    async def renew(self, client_id: str, key: str, order_id: str) -> bool:
+        async with self.session_factory() as session:
+            result = await session.execute(
+                update(IdempotencyKeyModel)
+                .where(
+                    *self._owned(client_id, key, order_id),
+                    IdempotencyKeyModel.response_status.is_(None),
+                )
+                .values(claimed_at=datetime.utcnow())
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
+            return result.rowcount > 0
+
+    async def get(self, client_id: str, key: str) -> IdempotencyRecord | None:
+        async with self.session_factory() as session:
+            return await self._get(session, client_id, key)
+
+    async def complete(
+        self,
+        client_id: str,
+        key: str,
+        order_id: str,
+        response_status: int,
+        response_body: Any,
+    ) -> None:
+        async with self.session_factory() as session:
+            await session.execute(
+                update(IdempotencyKeyModel)
+                .where(*self._owned(client_id, key, order_id))
+                .values(response_status=response_status, response_body=response_body)
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
+
+    async def release(self, client_id: str, key: str, order_id: str) -> None:
+        async with self.session_factory() as session:
+            await session.execute(
+                delete(IdempotencyKeyModel).where(
+                    *self._owned(client_id, key, order_id),
+                    # A completed key is kept, whatever happens to its owner afterwards
+                    IdempotencyKeyModel.response_status.is_(None),
+                )
+            )
+            await session.commit()
+
+    def _reusable(self, record: IdempotencyRecord) -> bool:
+        now = datetime.utcnow()
+        if record.completed:
+            return record.created_at < now - self.ttl
+        return record.claimed_at < now - self.lease
+
+    async def _get(
+        self, session: AsyncSession, client_id: str, key: str
+    ) -> IdempotencyRecord | None:
+        db_record = await session.scalar(
+            select(IdempotencyKeyModel).where(
+                IdempotencyKeyModel.client_id == client_id,
+                IdempotencyKeyModel.key == key,
+            ).execution_options(populate_existing=True)
+        )
+        # End the transaction so a caller polling this key does not hold a connection
+        await session.commit()
+        return self._to_record(db_record) if db_record else None
+
+    @staticmethod
+    def _owned(client_id: str, key: str, order_id: str) -> tuple:
+        # Each request creates a new order, so its order_id tells its claim
+        # apart from a later claim of the same key
+        return (
+            IdempotencyKeyModel.client_id == client_id,
+            IdempotencyKeyModel.key == key,
+            IdempotencyKeyModel.order_id == order_id,
+        )
+
+    def _to_record(self, db_record: IdempotencyKeyModel) -> IdempotencyRecord:
+        return IdempotencyRecord(
+            client_id=db_record.client_id,
+            key=db_record.key,
+            request_hash=db_record.request_hash,
+            order_id=db_record.order_id,
+            created_at=db_record.created_at,
+            claimed_at=db_record.claimed_at,
+            response_status=db_record.response_status,
+            response_body=db_record.response_body,
+        )
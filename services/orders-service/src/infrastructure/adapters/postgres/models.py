@@ -1,28 +1,193 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import JSON, Column, DateTime, Enum, Float, String
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Column,
+    Date,
+    DateTime,
+    Enum,
+    Float,
+    Index,
+    Integer,
+    Sequence,
+    String,
+    text,
+)
 from sqlalchemy.dialects.postgresql import ENUM
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import declarative_base, relationship
 
 Base = declarative_base()
 
+# Source of order numbers; each nextval() reserves a block of `increment` numbers
+ORDER_NUMBER_SEQUENCE = Sequence(
+    "order_number_seq", start=1, increment=100, metadata=Base.metadata
+)
+
 
 class OrderStatusEnum(enum.Enum):
     PENDING = "pending"
     VALIDATED = "validated"
     REJECTED = "rejected"
     CREATED = "created"
+    CANCELLED = "cancelled"
 
 
 class OrderModel(Base):
+    """
+    Range partitioned by month on created_at (see partitions.py), so
+    created_at is part of the primary key
+    """
     __tablename__ = "orders"
+    __table_args__ = (
+        # Keyset pagination over (created_at, id), scanned backwards for newest first
+        Index("ix_orders_created_at_id", "created_at", "id"),
+        # Per-client history; includes the summary columns for index-only scans
+        Index(
+            "ix_orders_client_id_created_at",
+            "client_id",
+            text("created_at DESC"),
+            text("id DESC"),
+            postgresql_include=["order_number", "status", "total"],
+        ),
+        # Orders still in flight by status and age; finished orders stay out
+        Index(
+            "ix_orders_in_flight_status_created_at",
+            "status",
+            "created_at",
+            "id",
+            postgresql_where=text("status IN ('pending', 'validated')"),
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id = Column(String, primary_key=True)
-    order_number = Column(String, nullable=False, unique=True, index=True)
-    client_id = Column(String, nullable=False, index=True)
+    # Unique by construction (sequence allocated); a unique index on a
+    # partitioned table would have to include created_at
+    order_number = Column(String, nullable=False, index=True)
+    client_id = Column(String, nullable=False)
     items = Column(JSON, nullable=False)
     total = Column(Float, nullable=False)
-    status = Column(ENUM('pending', 'validated', 'rejected', 'created', name='orderstatusenum'), nullable=False, default='pending')
+    status = Column(
+        ENUM(
+            'pending', 'validated', 'rejected', 'created', 'cancelled',
+            name='orderstatusenum',
+        ),
+        nullable=False,
+        default='pending',
+    )
+    created_at = Column(DateTime, primary_key=True, default=datetime.utcnow)
+    delivery_id = Column(String, nullable=True)
+    # Bumped by every update; the ETag of the order representation
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+
+    # Normalized copy of `items`, written once when the order is inserted.
+    # No database foreign key: it would have to reference (id, created_at).
+    lines = relationship(
+        "OrderItemModel",
+        primaryjoin="OrderModel.id == foreign(OrderItemModel.order_id)",
+        cascade="all, delete-orphan",
+        lazy="raise",
+    )
+
+
+class OrderItemModel(Base):
+    __tablename__ = "order_items"
+    __table_args__ = (
+        # Covers "orders containing product X" and per-product unit sums
+        Index(
+            "ix_order_items_product_id_order_id",
+            "product_id",
+            "order_id",
+            postgresql_include=["quantity"],
+        ),
+    )
+
+    order_id = Column(String, primary_key=True)
+    line_number = Column(Integer, primary_key=True)
+    product_id = Column(String, nullable=False)
+    quantity = Column(Integer, nullable=False)
+    price = Column(Float, nullable=False)
+
+
+class DailySalesModel(Base):
+    """
+    Sales rollup: orders per creation day and final status. Kept up to date
+    as orders reach a final status (see sales_rollups.py).
+    """
+    __tablename__ = "order_sales_daily"
+
+    day = Column(Date, primary_key=True)
+    status = Column(String, primary_key=True)
+    orders = Column(Integer, nullable=False, default=0)
+    units = Column(BigInteger, nullable=False, default=0)
+    revenue = Column(Float, nullable=False, default=0.0)
+
+
+class DailyProductSalesModel(Base):
+    """Sales rollup per creation day, product and final status"""
+    __tablename__ = "order_sales_daily_product"
+    __table_args__ = (
+        # One product over a date range
+        Index("ix_order_sales_daily_product_product_id_day", "product_id", "day"),
+    )
+
+    day = Column(Date, primary_key=True)
+    product_id = Column(String, primary_key=True)
+    status = Column(String, primary_key=True)
+    orders = Column(Integer, nullable=False, default=0)
+    units = Column(BigInteger, nullable=False, default=0)
+    revenue = Column(Float, nullable=False, default=0.0)
+
+
+class DailyClientSalesModel(Base):
+    """Sales rollup per creation day, client and final status"""
+    __tablename__ = "order_sales_daily_client"
+    __table_args__ = (
+        # One client over a date range
+        Index("ix_order_sales_daily_client_client_id_day", "client_id", "day"),
+    )
+
+    day = Column(Date, primary_key=True)
+    client_id = Column(String, primary_key=True)
+    status = Column(String, primary_key=True)
+    orders = Column(Integer, nullable=False, default=0)
+    units = Column(BigInteger, nullable=False, default=0)
+    revenue = Column(Float, nullable=False, default=0.0)
+
+
+class OrderQueueModel(Base):
+    """Durable queue of accepted orders awaiting background processing"""
+    __tablename__ = "order_processing_queue"
+    __table_args__ = (
+        Index("ix_order_processing_queue_available_at", "available_at"),
+    )
+
+    # No foreign key: a job row may briefly outlive or predate its order
+    order_id = Column(String, primary_key=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    # Claiming pushes this past the lease, like an SQS visibility timeout
+    available_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    last_error = Column(String, nullable=True)
+    enqueued_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class IdempotencyKeyModel(Base):
+    """Idempotency-Key of an order creation request and its stored response"""
+    __tablename__ = "order_idempotency_keys"
+    __table_args__ = (
+        Index("ix_order_idempotency_keys_created_at", "created_at"),
+    )
+
+    # Keys are scoped per client so clients cannot collide with each other
+    client_id = Column(String, primary_key=True)
+    key = Column(String, primary_key=True)
+    request_hash = Column(String, nullable=False)
+    order_id = Column(String, nullable=False)
+    response_status = Column(Integer, nullable=True)
+    response_body = Column(JSON, nullable=True)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    delivery_id = Column(String, nullable=True)
\ No newline at end of file
+    # Renewed while the request holding the key runs; an unfinished key not
+    # renewed for a lease is abandoned, e.g. by a crashed instance
+    claimed_at = Column(DateTime, nullable=False, default=datetime.utcnow)
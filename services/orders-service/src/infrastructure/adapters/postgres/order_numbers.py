@@ -0,0 +1,52 @@
+import asyncio
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import ORDER_NUMBER_SEQUENCE
+
+
+def format_order_number(number: int) -> str:
+    return f"ORD-{number:08d}"
+
+
+class OrderNumberAllocator:
+    """
+    Hands out human-readable order numbers from a database sequence.
+
+    The sequence increments by the block size, so each nextval() reserves a
+    whole block and only one order per block costs a round trip. Sequences
+    never return the same value twice, so numbers cannot collide across
+    instances. Numbers left in a block when the process exits are skipped,
+    which leaves gaps.
+    """
+
+    def __init__(self, block_size: int = ORDER_NUMBER_SEQUENCE.increment):
+        self.block_size = block_size
+        self._next = 0
+        self._end = 0
+        self._lock = asyncio.Lock()
+
+    async def allocate(self, session: AsyncSession) -> str:
+        return (await self.allocate_many(session, 1))[0]
+
+    async def allocate_many(self, session: AsyncSession, count: int) -> list[str]:
+        numbers: list[str] = []
+        async with self._lock:
+            while len(numbers) < count:
+                if self._next >= self._end:
+                    # nextval() is not transactional, so the block stays ours
+                    # even if the caller's transaction rolls back
+                    start = await session.scalar(
+                        select(ORDER_NUMBER_SEQUENCE.next_value())
+                    )
+                    self._next, self._end = start, start + self.block_size
+                take = min(count - len(numbers), self._end - self._next)
+                numbers.extend(
+                    format_order_number(n) for n in range(self._next, self._next + take)
+                )
+                self._next += take
+        return numbers
+
+
+order_number_allocator = OrderNumberAllocator()
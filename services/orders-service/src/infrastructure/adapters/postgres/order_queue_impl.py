@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.ports.order_queue import OrderQueue, QueuedOrder
+
+from .models import OrderQueueModel
+
+
+class PostgresOrderQueue(OrderQueue):
+    """
+    Order processing queue backed by the order_processing_queue table.
+
+    Workers claim rows with FOR UPDATE SKIP LOCKED, so any number of them
+    can poll the table without handing out the same order twice.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def enqueue(self, order_id: str) -> None:
+        now = datetime.utcnow()
+        self.session.add(
+            OrderQueueModel(
+                order_id=order_id, attempts=0, available_at=now, enqueued_at=now
+            )
+        )
+        await self.session.commit()
+
+    async def claim(self, limit: int, lease_seconds: float) -> list[QueuedOrder]:
+        now = datetime.utcnow()
+        due = (
+            select(OrderQueueModel.order_id)
+            .where(OrderQueueModel.available_at <= now)
+            .order_by(OrderQueueModel.available_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(
+            update(OrderQueueModel)
+            .where(OrderQueueModel.order_id.in_(due.scalar_subquery()))
+            .values(
+                attempts=OrderQueueModel.attempts + 1,
+                available_at=now + timedelta(seconds=lease_seconds),
+            )
+            .returning(OrderQueueModel.order_id, OrderQueueModel.attempts)
+            .execution_options(synchronize_session=False)
+        )
+        claimed = [
+            QueuedOrder(order_id=row.order_id, attempts=row.attempts) for row in result
+        ]
+        await self.session.commit()
+        return claimed
+
+    async def complete(self, order_id: str) -> None:
+        await self.session.execute(
+            delete(OrderQueueModel).where(OrderQueueModel.order_id == order_id)
+        )
+        await self.session.commit()
+
+    async def retry(self, order_id: str, delay_seconds: float, error: str) -> None:
+        await self.session.execute(
+            update(OrderQueueModel)
+            .where(OrderQueueModel.order_id == order_id)
+            .values(
+                available_at=datetime.utcnow() + timedelta(seconds=delay_seconds),
+                last_error=error,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+
+    async def depth(self) -> int:
+        return await self.session.scalar(
+            select(func.count()).select_from(OrderQueueModel)
+        )
@@ -1,22 +1,74 @@
-from sqlalchemy import select
+import dataclasses
+from collections.abc import AsyncIterator
+from datetime import date, datetime
+
+from sqlalchemy import (
+    String, any_, bindparam, delete, exists, func, insert, select, tuple_, update
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.domain.models.order import Order, OrderItem, OrderStatus
+from src.domain.models.order import (
+    Order, OrderItem, OrderStatus, OrderSummary, OrderView
+)
+from src.domain.models.order_ids import ORDER_ID_TIMESTAMP_SLACK, order_id_timestamp
+from src.domain.models.sales import SalesAggregate, SalesGrouping
 from src.domain.repositories.order_repository import OrderRepository
 
-from .models import OrderModel
+from .models import (
+    DailyClientSalesModel,
+    DailyProductSalesModel,
+    DailySalesModel,
+    OrderItemModel,
+    OrderModel,
+    OrderQueueModel,
+)
+from .order_numbers import OrderNumberAllocator, order_number_allocator
+from .partitions import recent_partitions_start
+from .sales_rollups import apply_status_changes
+
+# Rows fetched per round trip by server-side cursor streams
+STREAM_BATCH_SIZE = 1000
+
+# Orders deleted per statement, well within the bind parameter limit
+DELETE_BATCH_SIZE = 1000
+
+# OrderView fields in constructor order, each named after its OrderModel column
+ORDER_VIEW_FIELDS = [field.name for field in dataclasses.fields(OrderView)]
 
 
 class PostgresOrderRepository(OrderRepository):
     
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        read_session: AsyncSession | None = None,
+        order_numbers: OrderNumberAllocator = order_number_allocator
+    ):
         self.session = session
+        # Queries that never feed a write may run on a read replica
+        self.read_session = read_session or session
+        self.order_numbers = order_numbers
     
     async def save(self, order: Order) -> Order:
-        db_order = await self.session.get(OrderModel, order.id)
+        # The full primary key, so only the order's own partition is probed
+        db_order = await self.session.get(OrderModel, (order.id, order.created_at))
+        previous_status = db_order.status if db_order else None
         
         if not db_order:
+            if order.order_number is None:
+                order.order_number = await self.order_numbers.allocate(self.session)
             db_order = OrderModel()
+            # Items never change after creation, so lines are only written once
+            db_order.lines = [
+                OrderItemModel(
+                    line_number=line_number,
+                    product_id=item.product_id,
+                    quantity=item.quantity,
+                    price=item.price
+                )
+                for line_number, item in enumerate(order.items, start=1)
+            ]
         
         db_order.id = order.id
         db_order.order_number = order.order_number
@@ -33,32 +85,491 @@ class PostgresOrderRepository(OrderRepository):
         db_order.status = order.status.value
         db_order.created_at = order.created_at
         db_order.delivery_id = order.delivery_id
+        if previous_status is not None:
+            db_order.version = OrderModel.version + 1
         
         self.session.add(db_order)
+        await apply_status_changes(self.session, [(order, previous_status)])
         await self.session.commit()
         await self.session.refresh(db_order)
         
         return self._to_domain(db_order)
     
-    async def find_by_id(self, order_id: str) -> Order | None:
+    async def save_all(self, orders: list[Order]) -> list[Order]:
+        if not orders:
+            return []
+
+        order_ids = [order.id for order in orders]
         result = await self.session.execute(
-            select(OrderModel).where(OrderModel.id == order_id)
+            select(OrderModel.id, OrderModel.status).where(
+                OrderModel.id.in_(order_ids),
+                # Lets the planner prune to the partitions of the batch
+                OrderModel.created_at.in_({order.created_at for order in orders})
+            )
+        )
+        previous_statuses = dict(result.all())
+        existing_ids = previous_statuses.keys()
+
+        # Multi-row INSERTs for new orders and their lines
+        new_orders = [order for order in orders if order.id not in existing_ids]
+        if new_orders:
+            unnumbered = [order for order in new_orders if order.order_number is None]
+            if unnumbered:
+                numbers = await self.order_numbers.allocate_many(
+                    self.session, len(unnumbered)
+                )
+                for order, number in zip(unnumbered, numbers):
+                    order.order_number = number
+            await self.session.execute(
+                insert(OrderModel), [self._to_row(order) for order in new_orders]
+            )
+            await self.session.execute(
+                insert(OrderItemModel),
+                [
+                    {
+                        "order_id": order.id,
+                        "line_number": line_number,
+                        "product_id": item.product_id,
+                        "quantity": item.quantity,
+                        "price": item.price
+                    }
+                    for order in new_orders
+                    for line_number, item in enumerate(order.items, start=1)
+                ]
+            )
+
+        # Only status and delivery change after creation: bulk UPDATE by primary key
+        existing_orders = [order for order in orders if order.id in existing_ids]
+        if existing_orders:
+            await self.session.execute(
+                update(OrderModel).values(version=OrderModel.version + 1),
+                [
+                    {
+                        "id": order.id,
+                        "created_at": order.created_at,
+                        "status": order.status.value,
+                        "delivery_id": order.delivery_id
+                    }
+                    for order in existing_orders
+                ]
+            )
+            # The rows are locked until commit, so these are the versions written here
+            result = await self.session.execute(
+                select(OrderModel.id, OrderModel.version).where(
+                    OrderModel.id.in_([order.id for order in existing_orders]),
+                    OrderModel.created_at.in_(
+                        {order.created_at for order in existing_orders}
+                    )
+                )
+            )
+            versions = dict(result.all())
+            for order in existing_orders:
+                order.version = versions[order.id]
+
+        await apply_status_changes(
+            self.session, [(order, previous_statuses.get(order.id)) for order in orders]
+        )
+        await self.session.commit()
+        return orders
+
+    async def delete_all(self, orders: list[Order]) -> None:
+        for start in range(0, len(orders), DELETE_BATCH_SIZE):
+            batch = orders[start:start + DELETE_BATCH_SIZE]
+            # order_items has no foreign key to cascade from
+            await self.session.execute(
+                delete(OrderItemModel)
+                .where(OrderItemModel.order_id.in_([order.id for order in batch]))
+            )
+            await self.session.execute(
+                delete(OrderModel)
+                .where(
+                    tuple_(OrderModel.id, OrderModel.created_at)
+                    .in_([(order.id, order.created_at) for order in batch])
+                )
+            )
+        await self.session.commit()
+
+    async def find_by_id(self, order_id: str) -> Order | None:
+        result = await self.read_session.execute(
+            self._where_id(select(OrderModel), order_id)
         )
         db_order = result.scalar_one_or_none()
         
         return self._to_domain(db_order) if db_order else None
-    
-    async def find_all(self, limit: int = 100, offset: int = 0) -> list[Order]:
+
+    async def find_by_ids(self, order_ids: list[str]) -> dict[str, Order]:
+        if not order_ids:
+            return {}
+        result = await self.read_session.execute(
+            self._where_ids(select(OrderModel), order_ids)
+        )
+        return {db_order.id: self._to_domain(db_order) for db_order in result.scalars()}
+
+    async def lock_by_ids(self, order_ids: list[str]) -> dict[str, Order]:
+        if not order_ids:
+            return {}
+        # Locked in id order, so concurrent callers cannot deadlock each other
         result = await self.session.execute(
+            self._where_ids(select(*OrderModel.__table__.columns), order_ids)
+            .order_by(OrderModel.id)
+            .with_for_update(of=OrderModel)
+        )
+        return {row.id: self._to_domain(row) for row in result}
+
+    async def find_version(self, order_id: str) -> int | None:
+        # A single integer: the items JSON is neither transferred nor parsed
+        result = await self.read_session.execute(
+            self._where_id(select(OrderModel.version), order_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def claim_stuck(self, created_before: datetime, limit: int) -> list[Order]:
+        # Oldest first; the lock is on orders only, not on the queue
+        result = await self.session.execute(
+            self._where_stuck(select(*OrderModel.__table__.columns), created_before)
+            .order_by(OrderModel.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True, of=OrderModel)
+        )
+        return [self._to_domain(row) for row in result]
+
+    async def count_stuck(self, created_before: datetime) -> int:
+        return await self.session.scalar(
+            self._where_stuck(
+                select(func.count()).select_from(OrderModel), created_before
+            )
+        )
+
+    @staticmethod
+    def _where_stuck(query, created_before: datetime):
+        # Matches ix_orders_in_flight_status_created_at, which only holds
+        # pending and validated orders. Queued orders have their own retries.
+        return query.where(
+            OrderModel.status.in_(
+                [OrderStatus.PENDING.value, OrderStatus.VALIDATED.value]
+            ),
+            OrderModel.created_at < created_before,
+            ~exists().where(OrderQueueModel.order_id == OrderModel.id),
+        )
+
+    @staticmethod
+    def _where_ids(query, order_ids: list[str]):
+        # One array parameter: the same prepared statement for any number of ids
+        query = query.where(
+            OrderModel.id == any_(
+                bindparam("order_ids", list(order_ids), type_=ARRAY(String))
+            )
+        )
+        # Like find_by_id: when every id is time-ordered, probe only the
+        # partitions covering their creation times
+        timestamps = [order_id_timestamp(order_id) for order_id in order_ids]
+        if None not in timestamps:
+            query = query.where(
+                OrderModel.created_at.between(
+                    min(timestamps) - ORDER_ID_TIMESTAMP_SLACK,
+                    max(timestamps) + ORDER_ID_TIMESTAMP_SLACK,
+                )
+            )
+        return query
+
+    @staticmethod
+    def _where_id(query, order_id: str):
+        query = query.where(OrderModel.id == order_id)
+        # Time-ordered ids carry their creation time: probe only the
+        # partitions around it instead of every partition's index
+        created_at = order_id_timestamp(order_id)
+        if created_at is not None:
+            query = query.where(
+                OrderModel.created_at.between(
+                    created_at - ORDER_ID_TIMESTAMP_SLACK,
+                    created_at + ORDER_ID_TIMESTAMP_SLACK,
+                )
+            )
+        return query
+    
+    async def find_all(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        after: tuple[datetime, str] | None = None,
+        fields: list[str] | None = None,
+        statuses: list[OrderStatus] | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None
+    ) -> list[OrderView]:
+        # Only the projected columns are fetched, so a page without items
+        # never reads the items JSON. The keyset columns always come along.
+        names = ORDER_VIEW_FIELDS if fields is None else [
+            name for name in ORDER_VIEW_FIELDS
+            if name in ("id", "created_at") or name in fields
+        ]
+        query = (
+            select(*(getattr(OrderModel, name) for name in names))
+            .order_by(OrderModel.created_at.desc(), OrderModel.id.desc())
+        )
+        # A single in-flight status is a backward scan of
+        # ix_orders_in_flight_status_created_at; a window is a range of
+        # ix_orders_created_at_id and prunes the partitions outside it
+        if statuses:
+            query = query.where(
+                OrderModel.status.in_([status.value for status in statuses])
+            )
+        if created_from is not None:
+            query = query.where(OrderModel.created_at >= created_from)
+        if created_to is not None:
+            query = query.where(OrderModel.created_at < created_to)
+        if offset:
+            result = await self.read_session.execute(query.limit(limit).offset(offset))
+            rows = result.all()
+        else:
+            rows = await self._newest_first(query, limit, after)
+
+        # Rows map straight onto the read model: no Order or OrderItem
+        # objects, and the stored total is not recomputed
+        if fields is None:
+            return [
+                OrderView(
+                    id,
+                    order_number,
+                    client_id,
+                    items,
+                    total,
+                    OrderStatus(status),
+                    delivery_id=delivery_id,
+                    created_at=created_at,
+                )
+                for (
+                    id, order_number, client_id, items, total, status, created_at,
+                    delivery_id,
+                ) in rows
+            ]
+        views = [OrderView(**row._mapping) for row in rows]
+        if "status" in names:
+            for view in views:
+                view.status = OrderStatus(view.status)
+        return views
+
+    async def stream_orders(
+        self,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+        statuses: list[OrderStatus] | None = None
+    ) -> AsyncIterator[Order]:
+        # Plain rows rather than ORM entities: nothing accumulates in the
+        # session while millions of orders go by
+        query = (
+            select(*OrderModel.__table__.columns)
+            .order_by(OrderModel.created_at, OrderModel.id)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        if created_from is not None:
+            query = query.where(OrderModel.created_at >= created_from)
+        if created_to is not None:
+            query = query.where(OrderModel.created_at < created_to)
+        if statuses:
+            query = query.where(
+                OrderModel.status.in_([status.value for status in statuses])
+            )
+
+        result = await self.read_session.stream(query)
+        async for row in result:
+            yield self._to_domain(row)
+
+    async def find_summaries_by_client(
+        self,
+        client_id: str,
+        limit: int = 100,
+        after: tuple[datetime, str] | None = None,
+        statuses: list[OrderStatus] | None = None
+    ) -> list[OrderSummary]:
+        # Only columns stored in ix_orders_client_id_created_at, so the page
+        # is served by an index-only scan
+        query = (
+            select(
+                OrderModel.id,
+                OrderModel.order_number,
+                OrderModel.status,
+                OrderModel.total,
+                OrderModel.created_at
+            )
+            .where(OrderModel.client_id == client_id)
+            .order_by(OrderModel.created_at.desc(), OrderModel.id.desc())
+        )
+        if statuses:
+            query = query.where(
+                OrderModel.status.in_([status.value for status in statuses])
+            )
+
+        rows = await self._newest_first(query, limit, after)
+
+        return [
+            OrderSummary(
+                id=row.id,
+                order_number=row.order_number,
+                status=OrderStatus(row.status),
+                total=row.total,
+                created_at=row.created_at
+            )
+            for row in rows
+        ]
+
+    async def _newest_first(
+        self, query, limit: int, after: tuple[datetime, str] | None
+    ) -> list:
+        """
+        Run a newest-first keyset query against the recent partitions alone,
+        and only reach into older ones when the page is not full. Recent
+        pages then cost the same however many months of history exist.
+        """
+        if after is not None:
+            # Keyset pagination: seek past the last row of the previous page.
+            # The plain created_at bound is what lets newer partitions be pruned.
+            query = query.where(
+                tuple_(OrderModel.created_at, OrderModel.id) < tuple_(*after),
+                OrderModel.created_at <= after[0]
+            )
+
+        horizon = recent_partitions_start()
+        result = await self.read_session.execute(
+            query.where(OrderModel.created_at >= horizon).limit(limit)
+        )
+        rows = result.all()
+        if len(rows) < limit:
+            result = await self.read_session.execute(
+                query.where(OrderModel.created_at < horizon).limit(limit - len(rows))
+            )
+            rows.extend(result.all())
+        return rows
+
+    async def find_by_product_id(
+        self, product_id: str, limit: int = 100, offset: int = 0
+    ) -> list[Order]:
+        # Order ids come from ix_order_items_product_id_order_id
+        order_ids = (
+            select(OrderItemModel.order_id)
+            .where(OrderItemModel.product_id == product_id)
+        )
+        result = await self.read_session.execute(
             select(OrderModel)
+            .where(OrderModel.id.in_(order_ids))
             .order_by(OrderModel.created_at.desc())
             .limit(limit)
             .offset(offset)
         )
         db_orders = result.scalars().all()
-        
+
         return [self._to_domain(db_order) for db_order in db_orders]
+
+    async def units_sold_by_product(self, product_ids: list[str]) -> dict[str, int]:
+        result = await self.read_session.execute(
+            select(OrderItemModel.product_id, func.sum(OrderItemModel.quantity))
+            .join(OrderModel, OrderModel.id == OrderItemModel.order_id)
+            .where(
+                OrderItemModel.product_id.in_(product_ids),
+                OrderModel.status == OrderStatus.CREATED.value
+            )
+            .group_by(OrderItemModel.product_id)
+        )
+        units = {product_id: int(quantity) for product_id, quantity in result.all()}
+
+        return {product_id: units.get(product_id, 0) for product_id in product_ids}
     
+    async def stream_product_demand(
+        self, date_from: date, date_to: date, product_ids: list[str] | None = None
+    ) -> AsyncIterator[list[tuple[str, list[int], list[int]]]]:
+        # From the per-product rollup, already one row per product and day.
+        # Aggregated into arrays per product, so the caller handles one row
+        # per product instead of one per product and day.
+        query = (
+            select(
+                DailyProductSalesModel.product_id,
+                func.array_agg(DailyProductSalesModel.day - date_from),
+                func.array_agg(DailyProductSalesModel.units)
+            )
+            .where(
+                DailyProductSalesModel.day >= date_from,
+                DailyProductSalesModel.day < date_to,
+                DailyProductSalesModel.status == OrderStatus.CREATED.value,
+                DailyProductSalesModel.units > 0
+            )
+            .group_by(DailyProductSalesModel.product_id)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        if product_ids:
+            query = query.where(DailyProductSalesModel.product_id.in_(product_ids))
+        result = await self.read_session.stream(query)
+        async for partition in result.partitions():
+            yield [tuple(row) for row in partition]
+
+    async def sales_aggregates(
+        self,
+        grouping: SalesGrouping,
+        date_from: date,
+        date_to: date,
+        status: OrderStatus = OrderStatus.CREATED,
+        key: str | None = None,
+        limit: int = 1000
+    ) -> list[SalesAggregate]:
+        model, key_column = {
+            SalesGrouping.DAY: (DailySalesModel, None),
+            SalesGrouping.PRODUCT: (
+                DailyProductSalesModel, DailyProductSalesModel.product_id
+            ),
+            SalesGrouping.CLIENT: (
+                DailyClientSalesModel, DailyClientSalesModel.client_id
+            ),
+        }[grouping]
+
+        columns = [model.day, model.orders, model.units, model.revenue]
+        if key_column is not None:
+            columns.append(key_column)
+        query = select(*columns).where(
+            model.day >= date_from,
+            model.day < date_to,
+            model.status == status.value,
+            # Rows whose orders all moved on to another status
+            model.orders != 0
+        )
+        if key_column is not None:
+            if key is not None:
+                query = query.where(key_column == key)
+            query = query.order_by(model.day, key_column)
+        else:
+            query = query.order_by(model.day)
+
+        result = await self.read_session.execute(query.limit(limit))
+        return [
+            SalesAggregate(
+                day=row.day,
+                status=status,
+                orders=row.orders,
+                units=row.units,
+                revenue=row.revenue,
+                key=row[4] if key_column is not None else None
+            )
+            for row in result.all()
+        ]
+
+    def _to_row(self, order: Order) -> dict:
+        return {
+            "id": order.id,
+            "order_number": order.order_number,
+            "client_id": order.client_id,
+            "items": [
+                {
+                    "product_id": item.product_id,
+                    "quantity": item.quantity,
+                    "price": item.price
+                }
+                for item in order.items
+            ],
+            "total": order.total,
+            "status": order.status.value,
+            "created_at": order.created_at,
+            "delivery_id": order.delivery_id,
+            "version": order.version
+        }
+
     def _to_domain(self, db_order: OrderModel) -> Order:
         items = [
             OrderItem(
@@ -71,12 +582,13 @@ class PostgresOrderRepository(OrderRepository):
         
         order = Order(
             client_id=db_order.client_id,
-            items=items
+            items=items,
+            id=db_order.id,
+            order_number=db_order.order_number,
+            status=OrderStatus(db_order.status),
+            created_at=db_order.created_at,
+            delivery_id=db_order.delivery_id,
+            version=db_order.version
         )
-        order.id = db_order.id
-        order.order_number = db_order.order_number
-        order.status = OrderStatus(db_order.status)
-        order.created_at = db_order.created_at
-        order.delivery_id = db_order.delivery_id
         
-        return order
\ No newline at end of file
+        return order
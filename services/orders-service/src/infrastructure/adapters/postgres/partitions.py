@@ -0,0 +1,234 @@
+"""
+Monthly range partitions of the orders table.
+
+Each month lives in its own partition, orders_pYYYYMM. Rows from before
+the partitioning migration stay in orders_legacy. PartitionManager keeps
+future months created ahead of time. When a retention period is
+configured, it also detaches partitions that fall out of it. Detached
+partitions become plain tables, ready to be archived or dropped.
+"""
+
+import asyncio
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime
+
+from prometheus_client import Counter, Gauge
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "orders"
+
+# Lets a single instance run maintenance at a time
+MAINTENANCE_LOCK_KEY = 0x6F7264657273  # "orders"
+
+PARTITIONS_QUERY = text(
+    "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)"
+    " FROM pg_inherits"
+    " JOIN pg_class parent ON parent.oid = pg_inherits.inhparent"
+    " JOIN pg_class child ON child.oid = pg_inherits.inhrelid"
+    " WHERE parent.relname = :parent"
+)
+BOUND_PATTERN = re.compile(r"FROM \((.+)\) TO \((.+)\)")
+
+PARTITIONS = Gauge(
+    "orders_partitions",
+    "Partitions attached to the orders table",
+)
+PARTITION_COVERAGE = Gauge(
+    "orders_partition_coverage_seconds",
+    "How far into the future the orders partitions reach",
+)
+MAINTENANCE_RUNS = Counter(
+    "orders_partition_maintenance_runs_total",
+    "Partition maintenance runs, by outcome",
+    ["outcome"],
+)
+PARTITIONS_CHANGED = Counter(
+    "orders_partition_changes_total",
+    "Partitions created or detached by maintenance",
+    ["action"],
+)
+
+
+def month_start(moment: datetime) -> datetime:
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(month: datetime) -> str:
+    return f"{PARENT_TABLE}_p{month:%Y%m}"
+
+
+def recent_partitions_start(now: datetime | None = None) -> datetime:
+    """
+    Lower bound of the partitions holding recent orders (this month and the
+    last), used by newest-first queries to try those partitions alone first
+    """
+    return add_months(month_start(now or datetime.utcnow()), -1)
+
+
+@dataclass
+class Partition:
+    name: str
+    lower: datetime
+    upper: datetime
+
+
+def _parse_bound(value: str) -> datetime:
+    if value == "MINVALUE":
+        return datetime.min
+    if value == "MAXVALUE":
+        return datetime.max
+    return datetime.fromisoformat(value.strip("'"))
+
+
+class PartitionManager:
+    """Creates upcoming monthly partitions and detaches expired ones"""
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        months_ahead: int,
+        retention_months: int,
+        interval_seconds: float,
+    ):
+        self.engine = engine
+        self.months_ahead = months_ahead
+        self.retention_months = retention_months
+        self.interval_seconds = interval_seconds
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def run_once(self, now: datetime | None = None) -> bool:
+        """Run maintenance; False if another instance holds the lock"""
+        now = now or datetime.utcnow()
+        async with self.engine.connect() as connection:
+            # DETACH ... CONCURRENTLY cannot run inside a transaction block
+            connection = await connection.execution_options(
+                isolation_level="AUTOCOMMIT"
+            )
+            locked = await connection.scalar(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": MAINTENANCE_LOCK_KEY}
+            )
+            if not locked:
+                return False
+            try:
+                await self._create_upcoming(connection, now)
+                if self.retention_months > 0:
+                    await self._detach_expired(connection, now)
+
+                partitions = await self.partitions(connection)
+                PARTITIONS.set(len(partitions))
+                if partitions:
+                    coverage = max(partition.upper for partition in partitions)
+                    PARTITION_COVERAGE.set(
+                        (coverage - now).total_seconds()
+                        if coverage < datetime.max
+                        else float("inf")
+                    )
+            finally:
+                await connection.execute(
+                    text("SELECT pg_advisory_unlock(:key)"), {
+                        "key": MAINTENANCE_LOCK_KEY
+                    }
+                )
+        return True
+
+    async def partitions(self, connection: AsyncConnection) -> list[Partition]:
+        result = await connection.execute(PARTITIONS_QUERY, {"parent": PARENT_TABLE})
+        partitions = []
+        for name, bound in result:
+            match = BOUND_PATTERN.search(bound or "")
+            if match:
+                partitions.append(
+                    Partition(
+                        name, _parse_bound(match.group(1)), _parse_bound(match.group(2))
+                    )
+                )
+        return sorted(partitions, key=lambda partition: partition.lower)
+
+    async def _create_upcoming(
+        self, connection: AsyncConnection, now: datetime
+    ) -> None:
+        existing = await self.partitions(connection)
+        current = month_start(now)
+        for offset in range(self.months_ahead + 1):
+            lower = add_months(current, offset)
+            upper = add_months(lower, 1)
+            # Months still inside orders_legacy, or already created
+            if any(
+                partition.lower < upper and lower < partition.upper
+                for partition in existing
+            ):
+                continue
+
+            name = partition_name(lower)
+            await connection.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {PARENT_TABLE}"
+                f" FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+            ))
+            PARTITIONS_CHANGED.labels(action="created").inc()
+            logger.info(f"Created partition {name}")
+
+    async def _detach_expired(self, connection: AsyncConnection, now: datetime) -> None:
+        cutoff = add_months(month_start(now), -self.retention_months)
+        for partition in await self.partitions(connection):
+            if partition.upper > cutoff:
+                continue
+            await connection.execute(text(
+                f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION "
+                f"{partition.name} CONCURRENTLY"
+            ))
+            PARTITIONS_CHANGED.labels(action="detached").inc()
+            logger.info(
+                f"Detached partition {partition.name} (orders before "
+                f"{partition.upper:%Y-%m-%d})"
+            )
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+                MAINTENANCE_RUNS.labels(outcome="success").inc()
+            except Exception as e:
+                MAINTENANCE_RUNS.labels(outcome="error").inc()
+                logger.error(f"Partition maintenance failed: {str(e)}")
+            await asyncio.sleep(self.interval_seconds)
+
+
+async def main() -> None:
+    """Run partition maintenance once, e.g. from a scheduled job"""
+    from .session import engine, partition_manager
+
+    logging.basicConfig(level=logging.INFO)
+    try:
+        ran = await partition_manager.run_once()
+        if not ran:
+            logger.info("Partition maintenance already running elsewhere")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,77 @@
+import asyncio
+import logging
+
+from prometheus_client import Gauge
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+# Zero when the replica has replayed everything it received, so an idle
+# primary does not show up as growing lag
+REPLICA_LAG_QUERY = text(
+    "SELECT CASE"
+    " WHEN NOT pg_is_in_recovery() THEN 0"
+    " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)"
+    " END"
+)
+
+REPLICA_LAG = Gauge(
+    "orders_db_replica_lag_seconds",
+    "Replication lag of the read replica (-1 when it cannot be measured)",
+)
+
+
+class ReplicaLagMonitor:
+    """Periodically measures read replica lag"""
+
+    def __init__(
+        self, engine: AsyncEngine, max_lag_seconds: float, interval_seconds: float
+    ):
+        self.engine = engine
+        self.max_lag_seconds = max_lag_seconds
+        self.interval_seconds = interval_seconds
+        self.lag_seconds: float | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def healthy(self) -> bool:
+        """True once the replica has been measured within the lag budget"""
+        return self.lag_seconds is not None and self.lag_seconds <= self.max_lag_seconds
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def check(self) -> float | None:
+        try:
+            async with self.engine.connect() as connection:
+                lag = await connection.scalar(REPLICA_LAG_QUERY)
+            self.lag_seconds = float(lag)
+        except Exception as e:
+            logger.warning(f"Could not measure replica lag: {str(e)}")
+            self.lag_seconds = None
+
+        REPLICA_LAG.set(self.lag_seconds if self.lag_seconds is not None else -1)
+        if self.lag_seconds is not None and not self.healthy:
+            logger.warning(
+                f"Replica lag {self.lag_seconds:.1f}s exceeds "
+                f"{self.max_lag_seconds}s, reading from primary"
+            )
+        return self.lag_seconds
+
+    async def _run(self) -> None:
+        while True:
+            await self.check()
+            await asyncio.sleep(self.interval_seconds)
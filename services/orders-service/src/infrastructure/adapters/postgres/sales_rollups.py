@@ -0,0 +1,285 @@
+"""
+Sales rollups: per-day totals of orders by final status, overall and per
+product and client.
+
+The repository applies each status change in the same transaction as the
+order write. Reports therefore read a few rows per day instead of
+aggregating every order. Counts are keyed by creation day, so a change
+moves an order from its old status row to its new one. rebuild()
+recomputes a date range from the orders themselves, for backfills and
+repairs:
+
+    python -m src.infrastructure.adapters.postgres.sales_rollups --from 2026-01-01
+
+Archived orders are gone from the table, so days that may hold any keep
+their rollups: a rebuild only covers the days after the archive.
+"""
+
+import argparse
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import String, cast, delete, func, insert, literal_column, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.models.order import Order, OrderStatus
+
+from .models import (
+    DailyClientSalesModel,
+    DailyProductSalesModel,
+    DailySalesModel,
+    OrderItemModel,
+    OrderModel,
+)
+
+logger = logging.getLogger(__name__)
+
+# Final statuses; orders still in flight are not counted anywhere yet
+ROLLUP_STATUSES = frozenset({
+    OrderStatus.CREATED.value, OrderStatus.REJECTED.value, OrderStatus.CANCELLED.value
+})
+
+ROLLUP_MODELS = (DailySalesModel, DailyProductSalesModel, DailyClientSalesModel)
+
+
+class _Totals:
+    __slots__ = ("orders", "units", "revenue")
+
+    def __init__(self):
+        self.orders = 0
+        self.units = 0
+        self.revenue = 0.0
+
+    def add(self, sign: int, units: int, revenue: float) -> None:
+        self.orders += sign
+        self.units += sign * units
+        self.revenue += sign * revenue
+
+
+async def apply_status_changes(
+    session: AsyncSession, changes: list[tuple[Order, str | None]]
+) -> None:
+    """
+    Fold (order, previous status) pairs into the rollups, without committing.
+    Orders whose status did not change, or that never left the in-flight
+    statuses, contribute nothing.
+    """
+    daily: dict[tuple, _Totals] = defaultdict(_Totals)
+    per_product: dict[tuple, _Totals] = defaultdict(_Totals)
+    per_client: dict[tuple, _Totals] = defaultdict(_Totals)
+
+    for order, previous in changes:
+        current = order.status.value
+        if previous == current:
+            continue
+        day = order.created_at.date()
+        units = sum(item.quantity for item in order.items)
+        products: dict[str, list] = defaultdict(lambda: [0, 0.0])
+        for item in order.items:
+            products[item.product_id][0] += item.quantity
+            products[item.product_id][1] += item.calculate_subtotal()
+
+        for status, sign in ((previous, -1), (current, 1)):
+            if status not in ROLLUP_STATUSES:
+                continue
+            daily[(day, status)].add(sign, units, order.total)
+            per_client[(day, order.client_id, status)].add(sign, units, order.total)
+            for product_id, (product_units, revenue) in products.items():
+                per_product[(day, product_id, status)].add(sign, product_units, revenue)
+
+    await _upsert(session, DailySalesModel, ("day", "status"), daily)
+    await _upsert(
+        session, DailyProductSalesModel, ("day", "product_id", "status"), per_product
+    )
+    await _upsert(
+        session, DailyClientSalesModel, ("day", "client_id", "status"), per_client
+    )
+
+
+async def _upsert(
+    session: AsyncSession, model, key_columns: tuple, deltas: dict
+) -> None:
+    if not deltas:
+        return
+    # Keys in a fixed order, so concurrent transactions lock rows in the
+    # same order and cannot deadlock
+    rows = [
+        {
+            **dict(zip(key_columns, key)),
+            "orders": totals.orders,
+            "units": totals.units,
+            "revenue": totals.revenue,
+        }
+        for key, totals in sorted(deltas.items())
+    ]
+    statement = pg_insert(model)
+    table = model.__table__
+    await session.execute(
+        statement.on_conflict_do_update(
+            index_elements=list(key_columns),
+            set_={
+                column: table.c[column] + statement.excluded[column]
+                for column in ("orders", "units", "revenue")
+            },
+        ),
+        rows,
+    )
+
+
+def unarchived_range(
+    date_from: date | None, date_to: date | None, archived_before: datetime | None
+) -> tuple[date | None, date | None] | None:
+    """
+    [date_from, date_to) without the days that may hold archived orders,
+    None if no day is left
+    """
+    if archived_before is None:
+        return date_from, date_to
+    first_day = archived_before.date()
+    if archived_before > datetime.combine(first_day, time.min):
+        first_day += timedelta(days=1)
+    if date_from is None or date_from < first_day:
+        date_from = first_day
+    if date_to is not None and date_to <= date_from:
+        return None
+    return date_from, date_to
+
+
+async def rebuild(
+    session: AsyncSession,
+    date_from: date | None,
+    date_to: date | None,
+    archived_before: datetime | None = None,
+) -> None:
+    """
+    Recompute the rollups of days in [date_from, date_to) from the orders,
+    without committing. Concurrent order writes wait until the caller commits.
+    Days before `archived_before` are left alone, as their recount would miss
+    the archived orders.
+    """
+    requested = (date_from, date_to)
+    clamped = unarchived_range(date_from, date_to, archived_before)
+    if clamped is None:
+        logger.warning(
+            f"Not rebuilding sales rollups from {date_from} to {date_to}: "
+            f"orders created before {archived_before} may be archived"
+        )
+        return
+    date_from, date_to = clamped
+    if (date_from, date_to) != requested:
+        logger.warning(
+            f"Rebuilding sales rollups from {date_from} instead of "
+            f"{requested[0] or 'the start'}: earlier orders may be archived"
+        )
+
+    # Blocks concurrent deltas (but not reads) until commit. A delta that
+    # was already written commits first, so it shows up in the recount.
+    await session.execute(text(
+        "LOCK TABLE " + ", ".join(model.__tablename__ for model in ROLLUP_MODELS)
+        + " IN EXCLUSIVE MODE"
+    ))
+
+    day = func.date(OrderModel.created_at).label("day")
+    status = cast(OrderModel.status, String).label("status")
+    filters = [OrderModel.status.in_(sorted(ROLLUP_STATUSES))]
+    if date_from is not None:
+        filters.append(OrderModel.created_at >= datetime.combine(date_from, time.min))
+    if date_to is not None:
+        filters.append(OrderModel.created_at < datetime.combine(date_to, time.min))
+
+    for model in ROLLUP_MODELS:
+        statement = delete(model)
+        if date_from is not None:
+            statement = statement.where(model.day >= date_from)
+        if date_to is not None:
+            statement = statement.where(model.day < date_to)
+        await session.execute(statement)
+
+    # Units come from order_items, one primary key probe per order
+    units = (
+        select(func.coalesce(func.sum(OrderItemModel.quantity), 0))
+        .where(OrderItemModel.order_id == OrderModel.id)
+        .scalar_subquery()
+    )
+    await session.execute(
+        insert(DailySalesModel).from_select(
+            ["day", "status", "orders", "units", "revenue"],
+            select(
+                day, status, func.count(), func.sum(units), func.sum(OrderModel.total)
+            )
+            .where(*filters)
+            .group_by(literal_column("1"), OrderModel.status),
+        )
+    )
+    await session.execute(
+        insert(DailyClientSalesModel).from_select(
+            ["day", "client_id", "status", "orders", "units", "revenue"],
+            select(
+                day, OrderModel.client_id, status,
+                func.count(), func.sum(units), func.sum(OrderModel.total)
+            )
+            .where(*filters)
+            .group_by(literal_column("1"), OrderModel.client_id, OrderModel.status),
+        )
+    )
+    await session.execute(
+        insert(DailyProductSalesModel).from_select(
+            ["day", "product_id", "status", "orders", "units", "revenue"],
+            select(
+                day, OrderItemModel.product_id, status,
+                func.count(func.distinct(OrderModel.id)),
+                func.sum(OrderItemModel.quantity),
+                func.sum(OrderItemModel.quantity * OrderItemModel.price),
+            )
+            .join(OrderItemModel, OrderItemModel.order_id == OrderModel.id)
+            .where(*filters)
+            .group_by(
+                literal_column("1"), OrderItemModel.product_id, OrderModel.status
+            ),
+        )
+    )
+
+
+async def main() -> None:
+    """Rebuild the sales rollups, e.g. after the first deploy or a repair"""
+    from src.infrastructure.api.dependencies import get_order_archive
+
+    from .session import AsyncSessionLocal, engine
+
+    parser = argparse.ArgumentParser(description="Rebuild the order sales rollups")
+    parser.add_argument(
+        "--from",
+        dest="date_from",
+        type=date.fromisoformat,
+        help="First day (default: the first one after the archive)",
+    )
+    parser.add_argument(
+        "--to",
+        dest="date_to",
+        type=date.fromisoformat,
+        help="Day after the last one (default: no limit)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    order_archive = get_order_archive()
+    try:
+        archived_before = None
+        if order_archive is not None:
+            archived_before = await order_archive.archived_before()
+        async with AsyncSessionLocal() as session:
+            await rebuild(session, args.date_from, args.date_to, archived_before)
+            await session.commit()
+        logger.info(
+            f"Rebuilt sales rollups from {args.date_from or 'the start'} to "
+            f"{args.date_to or 'now'}"
+        )
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,15 +1,21 @@
 from collections.abc import AsyncGenerator
 
+from pydantic_core import from_json
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from src.infrastructure.config.settings import settings
 
+from .partitions import PartitionManager
+from .replica_monitor import ReplicaLagMonitor
+
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
     pool_size=20,
     max_overflow=10,
     pool_pre_ping=True,
+    # Order items are JSON; pydantic's parser is several times faster than json.loads
+    json_deserializer=from_json,
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -18,9 +24,44 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False
 )
 
+# Optional read replica; without one, reads share the primary engine
+has_read_replica = bool(settings.DATABASE_READ_URL)
+
+if has_read_replica:
+    read_engine = create_async_engine(
+        settings.DATABASE_READ_URL,
+        echo=settings.DEBUG,
+        pool_size=20,
+        max_overflow=10,
+        pool_pre_ping=True,
+        json_deserializer=from_json,
+    )
+    ReadSessionLocal = async_sessionmaker(
+        read_engine,
+        class_=AsyncSession,
+        expire_on_commit=False
+    )
+    replica_monitor: ReplicaLagMonitor | None = ReplicaLagMonitor(
+        read_engine,
+        max_lag_seconds=settings.REPLICA_MAX_LAG_SECONDS,
+        interval_seconds=settings.REPLICA_LAG_CHECK_INTERVAL_SECONDS,
+    )
+else:
+    read_engine = engine
+    ReadSessionLocal = AsyncSessionLocal
+    replica_monitor = None
+
+partition_manager = PartitionManager(
+    engine,
+    months_ahead=settings.ORDERS_PARTITION_MONTHS_AHEAD,
+    retention_months=settings.ORDERS_PARTITION_RETENTION_MONTHS,
+    interval_seconds=settings.ORDERS_PARTITION_MAINTENANCE_INTERVAL_SECONDS,
+)
+
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         try:
             yield session
         finally:
-            await session.close()
\ No newline at end of file
+            await session.close()
+
@@ -0,0 +1,28 @@
+"""Entity tags and conditional GET (If-None-Match)"""
+
+from fastapi import Response, status
+
+ETAG_HEADER = "ETag"
+
+
+def version_etag(version: int) -> str:
+    """Strong entity tag of a representation built from a versioned row"""
+    return f'"v{version}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match uses the weak comparison: W/ prefixes are ignored"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED, headers={ETAG_HEADER: etag}
+    )
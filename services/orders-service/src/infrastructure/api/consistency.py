@@ -0,0 +1,48 @@
+"""Read-your-writes routing between the primary and the read replica"""
+
+from fastapi import Request
+from prometheus_client import Counter
+
+from src.infrastructure.adapters.postgres.session import replica_monitor
+from src.infrastructure.config.settings import settings
+
+# Set after a client's own write; while present its reads go to the primary
+PRIMARY_STICKY_COOKIE = "orders_primary_sticky"
+# Clients without a cookie jar can send "X-Consistency: strong" instead
+CONSISTENCY_HEADER = "X-Consistency"
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+READ_ROUTING = Counter(
+    "orders_db_read_routing_total",
+    "Read sessions opened, by target database",
+    ["target"],
+)
+
+
+def use_replica(request: Request) -> bool:
+    """Whether this request's reads may be served by the read replica"""
+    if replica_monitor is None:
+        return False
+    if request.cookies.get(PRIMARY_STICKY_COOKIE):
+        target = False
+    elif request.headers.get(CONSISTENCY_HEADER, "").lower() == "strong":
+        target = False
+    else:
+        target = replica_monitor.healthy
+    READ_ROUTING.labels(target="replica" if target else "primary").inc()
+    return target
+
+
+async def read_your_writes_middleware(request: Request, call_next):
+    """Pin a client to the primary for a short window after it writes"""
+    response = await call_next(request)
+    if request.method not in SAFE_METHODS:
+        response.set_cookie(
+            PRIMARY_STICKY_COOKIE,
+            "1",
+            max_age=settings.READ_YOUR_WRITES_WINDOW_SECONDS,
+            httponly=True,
+            samesite="lax",
+        )
+    return response
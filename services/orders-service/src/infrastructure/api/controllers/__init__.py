@@ -1,3 +1,4 @@
+from .client_controller import router as client_router
 from .order_controller import router as order_router
 
-__all__ = ["order_router"]
\ No newline at end of file
+__all__ = ["order_router", "client_router"]
\ No newline at end of file
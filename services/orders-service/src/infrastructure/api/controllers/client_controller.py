@@ -0,0 +1,94 @@
+from fastapi import APIRouter, Depends, Query, Response
+from typing import List, Optional
+
+from src.application.use_cases.get_order import GetOrderUseCase
+from src.domain.models.order import OrderStatus
+from src.infrastructure.api.dependencies import get_order_use_case
+from src.infrastructure.api.dto.order_dto import OrderSummaryResponse
+from src.infrastructure.api.pagination import (
+    NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+)
+
+router = APIRouter(prefix="/api/v1/clients", tags=["orders"])
+
+
+@router.get(
+    "/{client_id}/orders",
+    response_model=List[OrderSummaryResponse],
+    summary="Get a client's order history",
+    description="""
+    Retrieves a client's orders, newest first, without line items.
+
+    **Path Parameters:**
+    - `client_id`: The client whose orders to list
+
+    **Query Parameters:**
+    - `limit`: Maximum number of orders to return (default: 20, max: 1000)
+    - `cursor`: Opaque token from the `X-Next-Cursor` header of the previous page
+    - `status`: Only return orders in this status; repeat for several statuses
+
+    **Returns:**
+    Order summaries (id, number, status, total, creation date). When a full page
+    is returned, the `X-Next-Cursor` response header carries the token for the
+    next page.
+
+    **Example Usage:**
+    - Open orders:
+      `GET /api/v1/clients/client-456/orders?status=pending&status=validated`
+    """,
+    responses={
+        200: {
+            "description": "Orders retrieved successfully",
+            "content": {
+                "application/json": {
+                    "example": [
+                        {
+                            "id": "550e8400-e29b-41d4-a716-446655440000",
+                            "order_number": "ORD-A1B2C3D4",
+                            "status": "created",
+                            "total": 59.98,
+                            "created_at": "2023-12-01T10:00:00Z"
+                        }
+                    ]
+                }
+            }
+        }
+    }
+)
+async def get_client_orders(
+    client_id: str,
+    response: Response,
+    limit: int = Query(
+        20, ge=1, le=1000, description="Maximum number of orders to return"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from the X-Next-Cursor header of the previous page"
+    ),
+    status: Optional[List[OrderStatus]] = Query(
+        None, description="Filter by order status"
+    ),
+    use_case: GetOrderUseCase = Depends(get_order_use_case)
+):
+    """Get a client's order history"""
+
+    after = decode_cursor(cursor) if cursor else None
+
+    # Execute use case - exceptions will be handled by global exception handlers
+    orders = await use_case.by_client(
+        client_id, limit=limit, after=after, statuses=status
+    )
+
+    if len(orders) == limit:
+        last = orders[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
+
+    return [
+        OrderSummaryResponse(
+            id=order.id,
+            order_number=order.order_number,
+            status=order.status.value,
+            total=order.total,
+            created_at=order.created_at
+        )
+        for order in orders
+    ]
@@ -1,17 +1,119 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import List
+import csv
+import io
+from collections.abc import AsyncIterator
+from datetime import date, datetime, timedelta, timezone
 
+from fastapi import (
+    APIRouter, Depends, Header, HTTPException, Request, Response, status, Query
+)
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic_core import to_json
+from typing import List, Optional
+
+from src.application.ports.idempotency_store import IdempotencyStore
+from src.application.use_cases.accept_order import AcceptOrderUseCase
+from src.application.use_cases.cancel_orders import CancelOrdersUseCase
 from src.application.use_cases.create_order import CreateOrderUseCase
+from src.application.use_cases.create_orders_batch import CreateOrdersBatchUseCase
+from src.application.use_cases.export_orders import ExportOrdersUseCase
+from src.application.use_cases.forecast_demand import ForecastDemandUseCase
 from src.application.use_cases.get_order import GetOrderUseCase
-from src.domain.models.order import Order, OrderItem
+from src.domain.exceptions import OrderValidationException
+from src.domain.models.order import Order, OrderItem, OrderStatus
+from src.domain.models.sales import SalesGrouping
+from src.infrastructure.api.conditional import (
+    ETAG_HEADER, etag_matches, not_modified, version_etag
+)
 from src.infrastructure.api.dependencies import (
+    get_accept_order_use_case,
+    get_cancel_orders_use_case,
     get_create_order_use_case,
+    get_create_orders_batch_use_case,
+    get_export_orders_use_case,
+    get_forecast_demand_use_case,
+    get_idempotency_store,
     get_order_use_case,
 )
-from src.infrastructure.api.dto.order_dto import CreateOrderRequest, OrderResponse, OrderItemResponse
+from src.infrastructure.api.dto.order_dto import (
+    BatchCreateOrdersRequest,
+    BatchCreateOrdersResponse,
+    BatchOrderResult,
+    CancelOrderResult,
+    CancelOrdersRequest,
+    CancelOrdersResponse,
+    CreateOrderRequest,
+    ExportFormat,
+    ORDER_SUMMARY_FIELDS,
+    OrderItemResponse,
+    OrderListView,
+    OrderLookupRequest,
+    OrderLookupResponse,
+    OrderLookupResult,
+    OrderResponse,
+    ReorderPointResponse,
+    SalesAggregateResponse,
+    UnitsSoldResponse,
+)
+from src.infrastructure.api.idempotency import (
+    IDEMPOTENCY_KEY_HEADER,
+    request_fingerprint,
+    run_idempotent,
+)
+from src.infrastructure.api.pagination import (
+    NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+)
+from src.infrastructure.config.settings import settings
 
 router = APIRouter(prefix="/api/v1/orders", tags=["orders"])
 
+# Orders serialized per chunk written to the export stream
+EXPORT_CHUNK_ROWS = 500
+
+# Last line of an export that failed after the response started, so a
+# truncated file cannot pass for a complete one
+EXPORT_NDJSON_INCOMPLETE = (
+    '{"error": "Export failed before completion", "type": "export_incomplete"}\n'
+)
+EXPORT_CSV_INCOMPLETE = "#export_incomplete\n"
+
+EXPORT_CSV_COLUMNS = [
+    "order_id",
+    "order_number",
+    "client_id",
+    "status",
+    "created_at",
+    "delivery_id",
+    "order_total",
+    "product_id",
+    "quantity",
+    "price",
+]
+
+
+def _to_order_response(order: Order) -> OrderResponse:
+    """Map domain model to response DTO"""
+    if order.order_number is None:
+        # Numbers are allocated when an order is first saved
+        raise ValueError(f"Order {order.id} has no order number yet")
+    return OrderResponse(
+        id=order.id,
+        order_number=order.order_number,
+        client_id=order.client_id,
+        items=[
+            OrderItemResponse(
+                product_id=item.product_id,
+                quantity=item.quantity,
+                price=item.price
+            )
+            for item in order.items
+        ],
+        total=order.total,
+        status=order.status.value,
+        created_at=order.created_at,
+        delivery_id=order.delivery_id
+    )
+
 
 @router.post(
     "/",
@@ -34,6 +136,18 @@ router = APIRouter(prefix="/api/v1/orders", tags=["orders"])
     3. Reserves stock if available
     4. Creates confirmed order with delivery date
 
+    **Asynchronous mode:** when enabled, send `Prefer: respond-async` to get
+    `202 Accepted` as soon as the order is saved as `pending`. Steps 2-4 then
+    run in the background; poll the URL in the `Location` header for the
+    final status. While the inventory service is unavailable, queued orders
+    wait and are retried instead of being rejected.
+
+    **Retries:** send an `Idempotency-Key` header (unique per attempt, reused
+    on retry) to make the request safe to repeat. A retry with the same key
+    returns the original response with `Idempotent-Replayed: true` instead of
+    creating another order; a duplicate sent while the original is still
+    running waits for it. Reusing a key for a different body returns 422.
+
     **Possible Statuses:**
     - `pending`: Order created but not yet validated
     - `validated`: Order passed validation
@@ -65,6 +179,14 @@ router = APIRouter(prefix="/api/v1/orders", tags=["orders"])
                 }
             }
         },
+        202: {
+            "description": (
+                "Order accepted for asynchronous processing (`Prefer: respond-async`)"
+            ),
+            "headers": {
+                "Location": {"description": "URL to poll for the order status"}
+            }
+        },
         400: {
             "description": "Invalid order data or business rule violation",
             "content": {
@@ -116,7 +238,19 @@ router = APIRouter(prefix="/api/v1/orders", tags=["orders"])
 )
 async def create_order(
     request: CreateOrderRequest,
-    use_case: CreateOrderUseCase = Depends(get_create_order_use_case)
+    http_request: Request,
+    response: Response,
+    prefer: Optional[str] = Header(
+        None, description="Send `respond-async` to process the order in the background"
+    ),
+    idempotency_key: Optional[str] = Header(
+        None,
+        alias=IDEMPOTENCY_KEY_HEADER,
+        description="Client-chosen key that makes retries of this request safe"
+    ),
+    use_case: CreateOrderUseCase = Depends(get_create_order_use_case),
+    accept_use_case: AcceptOrderUseCase = Depends(get_accept_order_use_case),
+    idempotency_store: IdempotencyStore = Depends(get_idempotency_store)
 ):
     """Create a new order"""
     
@@ -134,28 +268,499 @@ async def create_order(
         client_id=request.client_id,
         items=order_items
     )
-    
-    # Execute use case - exceptions will be handled by global exception handlers
-    result = await use_case.execute(order)
 
-    # Map domain model to response DTO
-    return OrderResponse(
-        id=result.id,
-        order_number=result.order_number,
-        client_id=result.client_id,
-        items=[
-            OrderItemResponse(
-                product_id=item.product_id,
-                quantity=item.quantity,
-                price=item.price
+    respond_async = settings.ASYNC_ORDER_ACCEPTANCE_ENABLED and _prefers_async(prefer)
+
+    async def execute() -> tuple[int, OrderResponse, dict[str, str]]:
+        if respond_async:
+            result = await accept_use_case.execute(order)
+            headers = {
+                "Location": f"{router.prefix}/{result.id}",
+                "Preference-Applied": "respond-async",
+            }
+            return status.HTTP_202_ACCEPTED, _to_order_response(result), headers
+
+        # Execute use case - exceptions will be handled by global exception handlers
+        result = await use_case.execute(order)
+        return status.HTTP_201_CREATED, _to_order_response(result), {}
+
+    if idempotency_key is None:
+        status_code, order_response, headers = await execute()
+        response.status_code = status_code
+        response.headers.update(headers)
+        return order_response
+
+    async def execute_json() -> JSONResponse:
+        status_code, order_response, headers = await execute()
+        return JSONResponse(
+            status_code=status_code,
+            content=jsonable_encoder(order_response),
+            headers=headers,
+        )
+
+    return await run_idempotent(
+        http_request,
+        idempotency_store,
+        client_id=request.client_id,
+        key=idempotency_key,
+        request_hash=request_fingerprint(request),
+        order_id=order.id,
+        execute=execute_json,
+    )
+
+
+def _prefers_async(prefer: Optional[str]) -> bool:
+    """True if the Prefer header (RFC 7240) asks for respond-async"""
+    if not prefer:
+        return False
+    return any(
+        preference.split(";")[0].strip().lower() == "respond-async"
+        for preference in prefer.split(",")
+    )
+
+
+@router.post(
+    "/batch",
+    response_model=BatchCreateOrdersResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Create orders in bulk",
+    description="""
+    Creates up to 500 orders in one request. Each order follows the same
+    business rules as `POST /api/v1/orders/` and succeeds or fails on its own.
+
+    **Process:**
+    1. Validates every order against business rules
+    2. Saves all orders in one bulk insert
+    3. Checks inventory once for every product in the batch
+    4. Allocates stock to orders in request order
+    5. Reserves stock for groups of orders in as few calls as possible
+    6. Saves final statuses and publishes `OrderCreated` events in bulk
+
+    Rejected orders are returned with `status: rejected` and an `error`.
+    """,
+)
+async def create_orders_batch(
+    request: BatchCreateOrdersRequest,
+    use_case: CreateOrdersBatchUseCase = Depends(get_create_orders_batch_use_case)
+):
+    """Create many orders at once"""
+
+    orders = [
+        Order(
+            client_id=order_request.client_id,
+            items=[
+                OrderItem(
+                    product_id=item.product_id,
+                    quantity=item.quantity,
+                    price=item.price
+                )
+                for item in order_request.items
+            ]
+        )
+        for order_request in request.orders
+    ]
+
+    outcomes = await use_case.execute(orders)
+
+    results = [
+        BatchOrderResult(
+            index=index, order=_to_order_response(outcome.order), error=outcome.error
+        )
+        for index, outcome in enumerate(outcomes)
+    ]
+    created = sum(
+        1 for outcome in outcomes if outcome.order.status == OrderStatus.CREATED
+    )
+    return BatchCreateOrdersResponse(
+        created=created,
+        rejected=len(outcomes) - created,
+        results=results
+    )
+
+
+@router.post(
+    "/lookup",
+    response_model=OrderLookupResponse,
+    summary="Get many orders by ID",
+    description="""
+    Fetches up to 500 orders by ID in one request, instead of one
+    `GET /api/v1/orders/{order_id}` per order. Cached orders are served from
+    memory and the rest are read with a single query.
+
+    **Returns:**
+    One result per requested ID, in request order. IDs that do not exist have
+    `order: null`. Duplicate IDs get one result each.
+    """,
+    responses={
+        200: {
+            "description": "Lookup done, including when some orders were not found",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "found": 1,
+                        "missing": 1,
+                        "results": [
+                            {
+                                "id": "550e8400-e29b-41d4-a716-446655440000",
+                                "order": {
+                                    "id": "550e8400-e29b-41d4-a716-446655440000",
+                                    "order_number": "ORD-A1B2C3D4",
+                                    "client_id": "client-456",
+                                    "items": [
+                                        {
+                                            "product_id": "prod-123",
+                                            "quantity": 2,
+                                            "price": 29.99
+                                        }
+                                    ],
+                                    "total": 59.98,
+                                    "status": "created",
+                                    "created_at": "2023-12-01T10:00:00Z",
+                                    "delivery_id": "delivery-123"
+                                }
+                            },
+                            {
+                                "id": "6ba7b810-9dad-11d1-80b4-00c04fd430c8",
+                                "order": None
+                            }
+                        ]
+                    }
+                }
+            }
+        }
+    }
+)
+async def lookup_orders(
+    request: OrderLookupRequest,
+    use_case: GetOrderUseCase = Depends(get_order_use_case)
+):
+    """Get many orders by ID"""
+
+    orders = await use_case.by_ids(request.ids)
+
+    results = [
+        OrderLookupResult(
+            id=order_id,
+            order=_to_order_response(orders[order_id]) if order_id in orders else None
+        )
+        for order_id in request.ids
+    ]
+    found = sum(1 for result in results if result.order is not None)
+    return OrderLookupResponse(
+        found=found, missing=len(results) - found, results=results
+    )
+
+
+@router.post(
+    "/cancel",
+    response_model=CancelOrdersResponse,
+    summary="Cancel many orders",
+    description="""
+    Cancels up to 100 orders in one transaction. Only `created` orders can be
+    cancelled; orders that are already `cancelled` are returned unchanged.
+    Orders created before inventory recorded reservations per order hold no
+    stock it could release, and are not cancelled.
+
+    The stock held by every cancelled order is released with a single call to
+    the inventory service, however many orders and lines the batch has.
+
+    **Returns:**
+    One result per distinct requested ID, in request order. Orders that do not
+    exist or cannot be cancelled have an `error` and are left as they are.
+    """,
+    responses={
+        200: {
+            "description": (
+                "Batch processed, including when some orders were not cancelled"
+            ),
+            "content": {
+                "application/json": {
+                    "example": {
+                        "cancelled": 1,
+                        "failed": 1,
+                        "results": [
+                            {
+                                "id": "550e8400-e29b-41d4-a716-446655440000",
+                                "order": {
+                                    "id": "550e8400-e29b-41d4-a716-446655440000",
+                                    "order_number": "ORD-A1B2C3D4",
+                                    "client_id": "client-456",
+                                    "items": [
+                                        {
+                                            "product_id": "prod-123",
+                                            "quantity": 2,
+                                            "price": 29.99
+                                        }
+                                    ],
+                                    "total": 59.98,
+                                    "status": "cancelled",
+                                    "created_at": "2023-12-01T10:00:00Z",
+                                    "delivery_id": "delivery-123"
+                                },
+                                "error": None
+                            },
+                            {
+                                "id": "6ba7b810-9dad-11d1-80b4-00c04fd430c8",
+                                "order": None,
+                                "error": (
+                                    "Order 6ba7b810-9dad-11d1-80b4-00c04fd430c8"
+                                    " not found"
+                                )
+                            }
+                        ]
+                    }
+                }
+            }
+        },
+        503: {"description": "Inventory service unavailable; no order was cancelled"}
+    }
+)
+async def cancel_orders(
+    request: CancelOrdersRequest,
+    use_case: CancelOrdersUseCase = Depends(get_cancel_orders_use_case)
+):
+    """Cancel many orders"""
+
+    outcomes = await use_case.execute(request.ids)
+
+    results = [
+        CancelOrderResult(
+            id=outcome.order_id,
+            order=(
+                _to_order_response(outcome.order)
+                if outcome.order is not None
+                else None
+            ),
+            error=outcome.error
+        )
+        for outcome in outcomes
+    ]
+    failed = sum(1 for result in results if result.error is not None)
+    return CancelOrdersResponse(
+        cancelled=len(results) - failed, failed=failed, results=results
+    )
+
+
+@router.get(
+    "/export",
+    summary="Export orders",
+    description="""
+    Streams every order matching the filters as NDJSON or CSV, oldest first.
+
+    Rows are read from a server-side cursor and written as they are fetched,
+    so memory use stays flat and the first bytes arrive immediately no matter
+    how many orders match.
+
+    **Query Parameters:**
+    - `format`: `ndjson` (one order per line, default) or `csv` (one row per order line)
+    - `created_from`: Only orders created at or after this timestamp
+    - `created_to`: Only orders created before this timestamp
+    - `status`: Only orders in this status; repeat for several statuses
+
+    Timestamps without an offset are taken as UTC.
+
+    Errors found before the first order is read get an error status as usual.
+    If the export fails once streaming started, the last line written is
+    `{"error": ..., "type": "export_incomplete"}` for NDJSON and
+    `#export_incomplete` for CSV, and the connection is closed.
+
+    **Example Usage:**
+    - `GET /api/v1/orders/export?format=csv&created_from=2025-01-01&status=created`
+    """,
+    responses={
+        200: {
+            "description": "Orders streamed successfully",
+            "content": {
+                "application/x-ndjson": {},
+                "text/csv": {}
+            }
+        }
+    }
+)
+async def export_orders(
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="Output format"),
+    created_from: Optional[datetime] = Query(
+        None, description="Inclusive lower bound on creation time"
+    ),
+    created_to: Optional[datetime] = Query(
+        None, description="Exclusive upper bound on creation time"
+    ),
+    status: Optional[List[OrderStatus]] = Query(
+        None, description="Filter by order status"
+    ),
+    use_case: ExportOrdersUseCase = Depends(get_export_orders_use_case)
+):
+    """Export orders as a stream"""
+
+    orders = await _started(use_case.stream(
+        created_from=_to_naive_utc(created_from),
+        created_to=_to_naive_utc(created_to),
+        statuses=status
+    ))
+
+    if format == ExportFormat.CSV:
+        body = _marking_failure(_csv_chunks(orders), EXPORT_CSV_INCOMPLETE)
+        media_type = "text/csv"
+    else:
+        body = _marking_failure(_ndjson_chunks(orders), EXPORT_NDJSON_INCOMPLETE)
+        media_type = "application/x-ndjson"
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="orders-export.{format.value}"'
             )
-            for item in result.items
-        ],
-        total=result.total,
-        status=result.status.value,
-        created_at=result.created_at,
-        delivery_id=result.delivery_id
+        }
+    )
+
+
+def _to_naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """
+    Creation times are stored as naive UTC; timestamps with an offset are
+    converted
+    """
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+async def _started(orders: AsyncIterator[Order]) -> AsyncIterator[Order]:
+    """
+    Read the first order before the response starts, so a failing query
+    still gets an error status instead of an empty 200
+    """
+    first = await anext(orders, None)
+
+    async def resumed() -> AsyncIterator[Order]:
+        if first is None:
+            return
+        yield first
+        async for order in orders:
+            yield order
+
+    return resumed()
+
+
+async def _marking_failure(
+    chunks: AsyncIterator[str], marker: str
+) -> AsyncIterator[str]:
+    try:
+        async for chunk in chunks:
+            yield chunk
+    except Exception:
+        yield marker
+        # Re-raised so the connection is dropped rather than ended cleanly
+        raise
+
+
+async def _ndjson_chunks(orders: AsyncIterator[Order]) -> AsyncIterator[str]:
+    buffer = []
+    async for order in orders:
+        buffer.append(_to_order_response(order).model_dump_json())
+        if len(buffer) >= EXPORT_CHUNK_ROWS:
+            yield "\n".join(buffer) + "\n"
+            buffer = []
+    if buffer:
+        yield "\n".join(buffer) + "\n"
+
+
+async def _csv_chunks(orders: AsyncIterator[Order]) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_CSV_COLUMNS)
+    rows = 0
+    async for order in orders:
+        for item in order.items:
+            writer.writerow([
+                order.id,
+                order.order_number,
+                order.client_id,
+                order.status.value,
+                order.created_at.isoformat(),
+                order.delivery_id or "",
+                order.total,
+                item.product_id,
+                item.quantity,
+                item.price
+            ])
+        rows += 1
+        if rows >= EXPORT_CHUNK_ROWS:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            rows = 0
+    yield buffer.getvalue()
+
+
+@router.get(
+    "/aggregates",
+    response_model=List[SalesAggregateResponse],
+    summary="Get daily sales aggregates",
+    description="""
+    Per-day order counts, units and revenue, read from rollup tables that are
+    updated as orders reach a final status. The cost depends on the number of
+    days (and products or clients) returned, not on the number of orders.
+
+    **Query Parameters:**
+    - `group_by`: `day` (default), `product` or `client`
+    - `date_from`: First day, inclusive (default: 30 days before `date_to`)
+    - `date_to`: Last day, exclusive (default: tomorrow, UTC)
+    - `status`: Final status to aggregate, `created` (default), `rejected` or
+      `cancelled`
+    - `key`: Only this product or client, when grouping by product or client
+    - `limit`: Maximum number of rows to return (default: 1000, max: 10000)
+
+    **Example Usage:**
+    - Revenue per day this month: `GET /api/v1/orders/aggregates?date_from=2026-10-01`
+    - One product since July:
+      `GET /api/v1/orders/aggregates?group_by=product&key=p-1&date_from=2026-07-01`
+    """,
+)
+async def get_sales_aggregates(
+    group_by: SalesGrouping = Query(
+        SalesGrouping.DAY, description="Grouping of the totals"
+    ),
+    date_from: Optional[date] = Query(None, description="First day, inclusive"),
+    date_to: Optional[date] = Query(None, description="Last day, exclusive"),
+    status: OrderStatus = Query(
+        OrderStatus.CREATED, description="Final status to aggregate"
+    ),
+    key: Optional[str] = Query(None, description="Product or client ID to narrow to"),
+    limit: int = Query(
+        1000, ge=1, le=10000, description="Maximum number of rows to return"
+    ),
+    use_case: GetOrderUseCase = Depends(get_order_use_case)
+):
+    """Get daily sales aggregates"""
+    if status not in (OrderStatus.CREATED, OrderStatus.REJECTED, OrderStatus.CANCELLED):
+        raise OrderValidationException(
+            "Aggregates are only kept for created, rejected and cancelled orders"
+        )
+    if key is not None and group_by == SalesGrouping.DAY:
+        raise OrderValidationException(
+            "key requires group_by=product or group_by=client"
+        )
+    date_to = date_to or datetime.utcnow().date() + timedelta(days=1)
+    date_from = date_from or date_to - timedelta(days=30)
+    if date_from >= date_to:
+        raise OrderValidationException("date_from must be before date_to")
+
+    aggregates = await use_case.sales(
+        group_by, date_from, date_to, status=status, key=key, limit=limit
     )
+    return [
+        SalesAggregateResponse(
+            day=aggregate.day,
+            key=aggregate.key,
+            status=aggregate.status.value,
+            orders=aggregate.orders,
+            units=aggregate.units,
+            revenue=aggregate.revenue
+        )
+        for aggregate in aggregates
+    ]
 
 
 @router.get(
@@ -170,6 +775,11 @@ async def create_order(
 
     **Returns:**
     Complete order information including items, status, and timestamps.
+
+    **Conditional requests:**
+    The `ETag` header carries the order's version. Send it back in
+    `If-None-Match` to get `304 Not Modified` without a body while the order
+    has not changed; only the version is looked up.
     """,
     responses={
         200: {
@@ -196,6 +806,9 @@ async def create_order(
                 }
             }
         },
+        304: {
+            "description": "Order unchanged since the version in If-None-Match"
+        },
         404: {
             "description": "Order not found",
             "content": {
@@ -226,30 +839,71 @@ async def create_order(
 )
 async def get_order(
     order_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     use_case: GetOrderUseCase = Depends(get_order_use_case)
 ):
     """Get order by ID"""
 
+    if if_none_match:
+        # Polls of an unchanged order cost a version lookup, not the order
+        version = await use_case.version(order_id)
+        if version is not None and etag_matches(if_none_match, version_etag(version)):
+            return not_modified(version_etag(version))
+
     # Execute use case - exceptions will be handled by global exception handlers
     order = await use_case.by_id(order_id)
 
-    return OrderResponse(
-        id=order.id,
-        order_number=order.order_number,
-        client_id=order.client_id,
-        items=[
-            OrderItemResponse(
-                product_id=item.product_id,
-                quantity=item.quantity,
-                price=item.price
-            )
-            for item in order.items
-        ],
-        total=order.total,
-        status=order.status.value,
-        created_at=order.created_at,
-        delivery_id=order.delivery_id
-    )
+    response.headers[ETAG_HEADER] = version_etag(order.version)
+    return _to_order_response(order)
+
+
+@router.post(
+    "/{order_id}/cancel",
+    response_model=OrderResponse,
+    summary="Cancel an order",
+    description="""
+    Cancels a `created` order and releases its stock in the inventory service.
+    Cancelling an order that is already `cancelled` returns it unchanged.
+    An order without a stock reservation recorded by inventory is refused.
+
+    **Path Parameters:**
+    - `order_id`: The unique UUID of the order to cancel
+    """,
+    responses={
+        200: {"description": "Order cancelled"},
+        404: {"description": "Order not found"},
+        409: {
+            "description": (
+                "Order cannot be cancelled in its current status, or has no"
+                " recorded reservation"
+            ),
+            "content": {
+                "application/json": {
+                    "example": {
+                        "error": "Order Cannot Be Cancelled",
+                        "detail": "Cannot cancel order in rejected status",
+                        "type": "order_cancellation_refused"
+                    }
+                }
+            }
+        },
+        503: {
+            "description": "Inventory service unavailable; the order was not cancelled"
+        }
+    }
+)
+async def cancel_order(
+    order_id: str,
+    response: Response,
+    use_case: CancelOrdersUseCase = Depends(get_cancel_orders_use_case)
+):
+    """Cancel an order"""
+
+    order = await use_case.cancel(order_id)
+
+    response.headers[ETAG_HEADER] = version_etag(order.version)
+    return _to_order_response(order)
 
 
 @router.get(
@@ -261,14 +915,33 @@ async def get_order(
 
     **Query Parameters:**
     - `limit`: Maximum number of orders to return (default: 100, max: 1000)
-    - `offset`: Number of orders to skip for pagination (default: 0)
+    - `cursor`: Opaque token from the `X-Next-Cursor` header of the previous page
+    - `offset`: **Deprecated** - number of orders to skip; cost grows with the offset
+    - `fields`: Comma-separated order fields to return, e.g.
+      `id,status,total,created_at`
+    - `view`: `full` (default) or `summary` (id, order_number, status, total,
+      created_at)
+    - `status`: Only orders in this status; repeat for several statuses
+    - `created_from`: Only orders created at or after this timestamp
+    - `created_to`: Only orders created before this timestamp; timestamps
+      without an offset are taken as UTC
+
+    Fields left out are not read from the database, so lists without `items`
+    are much cheaper. Responses above a small size are gzip compressed for
+    clients sending `Accept-Encoding: gzip`.
 
     **Returns:**
-    List of orders sorted by creation date (newest first).
+    List of orders sorted by creation date (newest first). When a full page is
+    returned, the `X-Next-Cursor` response header carries the token for the next page.
 
     **Example Usage:**
     - Get first 50 orders: `GET /api/v1/orders?limit=50`
-    - Get next 50 orders: `GET /api/v1/orders?limit=50&offset=50`
+    - Get next 50 orders: `GET /api/v1/orders?limit=50&cursor=<X-Next-Cursor>`
+    - Dashboard list: `GET /api/v1/orders?limit=50&view=summary`
+    - Orders stuck before validation:
+      `GET /api/v1/orders?status=pending&created_to=2025-01-01T10:00:00`
+    - Orders of one day:
+      `GET /api/v1/orders?created_from=2025-01-01&created_to=2025-01-02`
     """,
     responses={
         200: {
@@ -317,33 +990,212 @@ async def get_order(
 )
 async def get_orders(
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of orders to return"),
-    offset: int = Query(0, ge=0, description="Number of orders to skip"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from the X-Next-Cursor header of the previous page"
+    ),
+    offset: int = Query(
+        0, ge=0, description="Number of orders to skip", deprecated=True
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated order fields to return, e.g. id,status,total",
+    ),
+    view: OrderListView = Query(OrderListView.FULL, description="full or summary"),
+    status: Optional[List[OrderStatus]] = Query(
+        None, description="Filter by order status"
+    ),
+    created_from: Optional[datetime] = Query(
+        None, description="Inclusive lower bound on creation time"
+    ),
+    created_to: Optional[datetime] = Query(
+        None, description="Exclusive upper bound on creation time"
+    ),
     use_case: GetOrderUseCase = Depends(get_order_use_case)
 ):
-    """Get all orders with pagination"""
+    """Get orders with pagination and filters"""
+
+    if cursor and offset:
+        raise OrderValidationException("cursor and offset cannot be combined")
+    after = decode_cursor(cursor) if cursor else None
+    projection = _list_projection(fields, view)
 
     # Execute use case - exceptions will be handled by global exception handlers
-    orders = await use_case.find_all(limit=limit, offset=offset)
-    
-    return [
-        OrderResponse(
-            id=order.id,
-            order_number=order.order_number,
-            client_id=order.client_id,
-            items=[
-                OrderItemResponse(
-                    product_id=item.product_id,
-                    quantity=item.quantity,
-                    price=item.price
-                )
-                for item in order.items
-            ],
-            total=order.total,
-            status=order.status.value,
-            created_at=order.created_at,
-            delivery_id=order.delivery_id
+    orders = await use_case.find_all(
+        limit=limit,
+        offset=offset,
+        after=after,
+        fields=projection,
+        statuses=status,
+        created_from=_to_naive_utc(created_from),
+        created_to=_to_naive_utc(created_to)
+    )
+
+    headers = {}
+    if offset:
+        headers["Deprecation"] = "true"
+    if len(orders) == limit:
+        last = orders[-1]
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
+
+    # The read models already have the OrderResponse shape: encode them
+    # directly instead of building and re-validating a model per order
+    if projection is None:
+        content = to_json(orders)
+    else:
+        content = to_json(orders, include={"__all__": set(projection)})
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+def _list_projection(fields: Optional[str], view: OrderListView) -> Optional[List[str]]:
+    """OrderResponse fields requested for a list, None for all of them"""
+    if view == OrderListView.SUMMARY:
+        if fields:
+            raise OrderValidationException("fields and view=summary cannot be combined")
+        return ORDER_SUMMARY_FIELDS
+    if not fields:
+        return None
+    projection = list(
+        dict.fromkeys(name.strip() for name in fields.split(",") if name.strip())
+    )
+    unknown = [name for name in projection if name not in OrderResponse.model_fields]
+    if unknown or not projection:
+        raise OrderValidationException(
+            f"Unknown fields: {', '.join(unknown) if unknown else repr(fields)}; "
+            f"valid fields are {', '.join(OrderResponse.model_fields)}"
         )
-        for order in orders
-    ]
+    return projection
+
+
+@router.get(
+    "/products/units-sold",
+    response_model=UnitsSoldResponse,
+    summary="Get units sold per product",
+    description="""
+    Sums the quantities ordered for each product across orders in `created` status.
+
+    **Query Parameters:**
+    - `product_ids`: Product to aggregate; repeat the parameter for several
+      products (max 100)
 
+    **Example Usage:**
+    - `GET /api/v1/orders/products/units-sold?product_ids=prod-123&product_ids=prod-456`
+    """,
+)
+async def get_units_sold(
+    product_ids: List[str] = Query(
+        ..., min_length=1, max_length=100, description="Product IDs to aggregate"
+    ),
+    use_case: GetOrderUseCase = Depends(get_order_use_case)
+):
+    """Get units sold per product"""
+    units = await use_case.units_sold(product_ids)
+    return UnitsSoldResponse(units=units)
+
+
+@router.get(
+    "/products/{product_id}",
+    response_model=List[OrderResponse],
+    summary="Get orders containing a product",
+    description="""
+    Retrieves a paginated list of orders that include the given product, newest first.
 
+    **Query Parameters:**
+    - `limit`: Maximum number of orders to return (default: 100, max: 1000)
+    - `offset`: Number of orders to skip for pagination (default: 0)
+    """,
+)
+async def get_orders_by_product(
+    product_id: str,
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of orders to return"),
+    offset: int = Query(0, ge=0, description="Number of orders to skip"),
+    use_case: GetOrderUseCase = Depends(get_order_use_case)
+):
+    """Get orders containing a product"""
+    orders = await use_case.by_product(product_id, limit=limit, offset=offset)
+    return [_to_order_response(order) for order in orders]
+
+
+@router.get(
+    "/forecast/reorder-points",
+    response_model=List[ReorderPointResponse],
+    summary="Get demand forecasts and reorder points",
+    description="""
+    Forecasts daily demand per product from the daily sales rollups and derives
+    a reorder point for each, compared with current stock from the inventory service.
+
+    - Forecast: simple exponential smoothing of daily units sold (`alpha`)
+    - Safety stock:
+      `z(service_level) * std(daily demand over window) * sqrt(lead_time_days)`
+    - Reorder point: `forecast * lead_time_days + safety stock`
+
+    All products are computed together with vectorized NumPy operations.
+
+    **Query Parameters:**
+    - `product_ids`: Only these products; repeat the parameter for several
+      (max 1000, default: every product with sales)
+    - `history_days`, `window_days`, `alpha`, `lead_time_days`, `service_level`:
+      Model parameters (defaults from settings)
+    - `below_only`: Only products at or below their reorder point
+    - `limit`: Maximum number of products to return (default: 1000, max: 10000)
+
+    **Returns:**
+    Products ordered by shortfall (reorder point minus available stock), largest first.
+    """,
+)
+async def get_reorder_points(
+    product_ids: Optional[List[str]] = Query(
+        None, max_length=1000, description="Product IDs to forecast"
+    ),
+    history_days: int = Query(
+        settings.FORECAST_HISTORY_DAYS, ge=7, le=3660,
+        description="Days of sales history",
+    ),
+    window_days: int = Query(
+        settings.FORECAST_WINDOW_DAYS, ge=2, le=3660,
+        description="Days for the moving average and variability",
+    ),
+    alpha: float = Query(
+        settings.FORECAST_SMOOTHING_ALPHA, gt=0, le=1,
+        description="Exponential smoothing factor",
+    ),
+    lead_time_days: float = Query(
+        settings.FORECAST_LEAD_TIME_DAYS, gt=0, le=365,
+        description="Replenishment lead time in days",
+    ),
+    service_level: float = Query(
+        settings.FORECAST_SERVICE_LEVEL, gt=0.5, lt=1,
+        description="Probability of not running out during the lead time",
+    ),
+    below_only: bool = Query(
+        False, description="Only products at or below their reorder point"
+    ),
+    limit: int = Query(
+        1000, ge=1, le=10000, description="Maximum number of products to return"
+    ),
+    use_case: ForecastDemandUseCase = Depends(get_forecast_demand_use_case)
+):
+    """Get demand forecasts and reorder points"""
+    points = await use_case.execute(
+        history_days=history_days,
+        window_days=window_days,
+        alpha=alpha,
+        lead_time_days=lead_time_days,
+        service_level=service_level,
+        product_ids=product_ids
+    )
+    if below_only:
+        points = [point for point in points if point.below_reorder_point]
+
+    return [
+        ReorderPointResponse(
+            product_id=point.product_id,
+            average_daily_demand=point.average_daily_demand,
+            forecast_daily_demand=point.forecast_daily_demand,
+            demand_std=point.demand_std,
+            safety_stock=point.safety_stock,
+            reorder_point=point.reorder_point,
+            available=point.available,
+            below_reorder_point=point.below_reorder_point
+        )
+        for point in points[:limit]
+    ]
@@ -1,22 +1,55 @@
-from functools import lru_cache
-from fastapi import Depends
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache, partial
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.application.ports.inventory_service import InventoryService
+from src.application.use_cases.accept_order import AcceptOrderUseCase
+from src.application.use_cases.cancel_orders import CancelOrdersUseCase
 from src.application.use_cases.create_order import CreateOrderUseCase
+from src.application.use_cases.create_orders_batch import CreateOrdersBatchUseCase
+from src.application.use_cases.export_orders import ExportOrdersUseCase
+from src.application.use_cases.forecast_demand import ForecastDemandUseCase
 from src.application.use_cases.get_order import GetOrderUseCase
-from src.infrastructure.adapters.http.inventory_service_impl import HTTPInventoryService
+from src.application.use_cases.process_order import ProcessOrderUseCase
+from src.application.use_cases.recover_orders import RecoverOrdersUseCase
+from src.domain.repositories.order_repository import OrderRepository
+from src.infrastructure.adapters.archive import SegmentOrderArchive, storage_from_url
+from src.infrastructure.adapters.cache import CachedOrderRepository, OrderCache
+from src.infrastructure.adapters.http import (
+    BatchingInventoryService, HTTPInventoryService
+)
 from src.infrastructure.adapters.messaging.sqs_event_publisher import SQSEventPublisher
+from src.infrastructure.adapters.postgres.idempotency_store_impl import (
+    PostgresIdempotencyStore,
+)
+from src.infrastructure.adapters.postgres.order_queue_impl import PostgresOrderQueue
 from src.infrastructure.adapters.postgres.order_repository_impl import (
     PostgresOrderRepository,
 )
-from src.infrastructure.adapters.postgres.session import get_db_session
+from src.infrastructure.adapters.postgres.session import (
+    AsyncSessionLocal,
+    ReadSessionLocal,
+    get_db_session,
+)
+from src.infrastructure.api.consistency import use_replica
 from src.infrastructure.config.settings import settings
+from src.infrastructure.workers.order_processing_worker import OrderProcessingWorker
+from src.infrastructure.workers.order_recovery_worker import OrderRecoveryWorker
 
 
 @lru_cache()
-def get_inventory_service() -> HTTPInventoryService:
-    """Singleton factory for HTTPInventoryService"""
-    return HTTPInventoryService()
+def get_inventory_service() -> InventoryService:
+    """Singleton factory for the inventory service client"""
+    inventory_service = HTTPInventoryService()
+    if settings.INVENTORY_CHECK_BATCHING_ENABLED:
+        return BatchingInventoryService(
+            inventory_service,
+            window_seconds=settings.INVENTORY_CHECK_BATCH_WINDOW_MS / 1000,
+            max_batch_size=settings.INVENTORY_CHECK_MAX_BATCH_SIZE,
+        )
+    return inventory_service
 
 
 @lru_cache()
@@ -31,14 +64,73 @@ def get_event_publisher():
         return SQSEventPublisher()
 
 
+@lru_cache()
+def get_order_cache() -> OrderCache:
+    """Singleton factory for the in-process order cache"""
+    return OrderCache(
+        max_entries=settings.ORDER_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.ORDER_CACHE_TTL_SECONDS,
+        terminal_ttl_seconds=settings.ORDER_CACHE_TERMINAL_TTL_SECONDS,
+    )
+
+
+@lru_cache()
+def get_order_archive() -> SegmentOrderArchive | None:
+    """Singleton factory for the archive of old orders, if enabled"""
+    if not settings.ORDER_ARCHIVE_ENABLED:
+        return None
+    return SegmentOrderArchive(
+        storage=storage_from_url(
+            settings.ORDER_ARCHIVE_URL, settings.ORDER_ARCHIVE_CACHE_DIR
+        ),
+        block_size=settings.ORDER_ARCHIVE_BLOCK_ORDERS,
+        max_open_segments=settings.ORDER_ARCHIVE_MAX_OPEN_SEGMENTS,
+        max_cached_blocks=settings.ORDER_ARCHIVE_MAX_CACHED_BLOCKS,
+        refresh_interval_seconds=settings.ORDER_ARCHIVE_REFRESH_INTERVAL_SECONDS,
+        max_probes=settings.ORDER_ARCHIVE_MAX_PROBES,
+    )
+
+
+async def get_read_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Session for read-only queries: the replica unless the request needs the primary
+    """
+    session_factory = ReadSessionLocal if use_replica(request) else AsyncSessionLocal
+    async with session_factory() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+def get_order_repository(
+    session: AsyncSession, read_session: AsyncSession | None = None
+) -> OrderRepository:
+    """Factory for repository - not cached as session is per request"""
+    repository = PostgresOrderRepository(session, read_session=read_session)
+    if settings.ORDER_CACHE_ENABLED:
+        return CachedOrderRepository(repository, get_order_cache())
+    return repository
+
+
+@lru_cache()
+def get_idempotency_store() -> PostgresIdempotencyStore:
+    """Singleton factory for the Idempotency-Key store, which opens its own sessions"""
+    return PostgresIdempotencyStore(
+        AsyncSessionLocal,
+        ttl_seconds=settings.IDEMPOTENCY_KEY_TTL_SECONDS,
+        lease_seconds=settings.IDEMPOTENCY_LEASE_SECONDS,
+    )
+
+
 def get_create_order_use_case(
     session: AsyncSession = Depends(get_db_session),
-    inventory_service: HTTPInventoryService = Depends(get_inventory_service),
+    inventory_service: InventoryService = Depends(get_inventory_service),
     event_publisher = Depends(get_event_publisher)
 ) -> CreateOrderUseCase:
     """Dependency injection for CreateOrderUseCase"""
 
-    order_repository = PostgresOrderRepository(session)
+    order_repository = get_order_repository(session)
 
     return CreateOrderUseCase(
         order_repository=order_repository,
@@ -47,10 +139,127 @@ def get_create_order_use_case(
     )
 
 
-def get_order_use_case(
+def get_cancel_orders_use_case(
+    session: AsyncSession = Depends(get_db_session),
+    inventory_service: InventoryService = Depends(get_inventory_service),
+    event_publisher = Depends(get_event_publisher)
+) -> CancelOrdersUseCase:
+    """Dependency injection for CancelOrdersUseCase"""
+
+    return CancelOrdersUseCase(
+        order_repository=get_order_repository(session),
+        inventory_service=inventory_service,
+        event_publisher=event_publisher
+    )
+
+
+def get_accept_order_use_case(
     session: AsyncSession = Depends(get_db_session)
+) -> AcceptOrderUseCase:
+    """Dependency injection for AcceptOrderUseCase"""
+
+    return AcceptOrderUseCase(
+        order_repository=get_order_repository(session),
+        order_queue=PostgresOrderQueue(session)
+    )
+
+
+def build_process_order_use_case(session: AsyncSession) -> ProcessOrderUseCase:
+    """Factory for ProcessOrderUseCase, used by the worker outside any request"""
+    return ProcessOrderUseCase(
+        order_repository=get_order_repository(session),
+        inventory_service=get_inventory_service(),
+        event_publisher=get_event_publisher()
+    )
+
+
+@lru_cache()
+def get_order_processing_worker() -> OrderProcessingWorker:
+    """Singleton factory for the background order processing worker"""
+    return OrderProcessingWorker(
+        session_factory=AsyncSessionLocal,
+        use_case_factory=build_process_order_use_case,
+        concurrency=settings.ORDER_WORKER_CONCURRENCY,
+        poll_interval_seconds=settings.ORDER_WORKER_POLL_INTERVAL_SECONDS,
+        lease_seconds=settings.ORDER_WORKER_LEASE_SECONDS,
+        max_attempts=settings.ORDER_WORKER_MAX_ATTEMPTS,
+        retry_base_seconds=settings.ORDER_WORKER_RETRY_BASE_SECONDS,
+        retry_max_seconds=settings.ORDER_WORKER_RETRY_MAX_SECONDS,
+    )
+
+
+def build_recover_orders_use_case(session: AsyncSession) -> RecoverOrdersUseCase:
+    """Factory for RecoverOrdersUseCase, used by the worker outside any request"""
+    return RecoverOrdersUseCase(
+        order_repository=get_order_repository(session),
+        inventory_service=get_inventory_service(),
+        event_publisher=get_event_publisher()
+    )
+
+
+@lru_cache()
+def get_order_recovery_worker() -> OrderRecoveryWorker:
+    """Singleton factory for the background stuck-order recovery worker"""
+    return OrderRecoveryWorker(
+        session_factory=AsyncSessionLocal,
+        use_case_factory=build_recover_orders_use_case,
+        interval_seconds=settings.ORDER_RECOVERY_INTERVAL_SECONDS,
+        timeout_seconds=settings.ORDER_RECOVERY_TIMEOUT_SECONDS,
+        max_age_seconds=settings.ORDER_RECOVERY_MAX_AGE_SECONDS,
+        batch_size=settings.ORDER_RECOVERY_BATCH_SIZE,
+    )
+
+
+def get_create_orders_batch_use_case(
+    session: AsyncSession = Depends(get_db_session),
+    inventory_service: InventoryService = Depends(get_inventory_service),
+    event_publisher = Depends(get_event_publisher)
+) -> CreateOrdersBatchUseCase:
+    """Dependency injection for CreateOrdersBatchUseCase"""
+
+    order_repository = get_order_repository(session)
+
+    return CreateOrdersBatchUseCase(
+        order_repository=order_repository,
+        inventory_service=inventory_service,
+        event_publisher=event_publisher
+    )
+
+
+def get_order_use_case(
+    session: AsyncSession = Depends(get_db_session),
+    read_session: AsyncSession = Depends(get_read_session)
 ) -> GetOrderUseCase:
     """Dependency injection for GetOrderUseCase"""
     
-    order_repository = PostgresOrderRepository(session)
-    return GetOrderUseCase(order_repository=order_repository)
\ No newline at end of file
+    order_repository = get_order_repository(session, read_session=read_session)
+    return GetOrderUseCase(
+        order_repository=order_repository,
+        order_archive=get_order_archive()
+    )
+
+
+def get_forecast_demand_use_case(
+    read_session: AsyncSession = Depends(get_read_session),
+    inventory_service: InventoryService = Depends(get_inventory_service)
+) -> ForecastDemandUseCase:
+    """Dependency injection for ForecastDemandUseCase"""
+    return ForecastDemandUseCase(
+        order_repository=PostgresOrderRepository(read_session),
+        inventory_service=inventory_service
+    )
+
+
+@asynccontextmanager
+async def order_repository_scope(session_factory) -> AsyncIterator[OrderRepository]:
+    async with session_factory() as session:
+        yield PostgresOrderRepository(session)
+
+
+def get_export_orders_use_case(request: Request) -> ExportOrdersUseCase:
+    """Dependency injection for ExportOrdersUseCase"""
+
+    session_factory = ReadSessionLocal if use_replica(request) else AsyncSessionLocal
+    return ExportOrdersUseCase(
+        repository_scope=partial(order_repository_scope, session_factory)
+    )
@@ -1,3 +1,43 @@
-from .order_dto import CreateOrderRequest, OrderItemDTO, OrderResponse
+from .order_dto import (
+    BatchCreateOrdersRequest,
+    BatchCreateOrdersResponse,
+    BatchOrderResult,
+    CancelOrderResult,
+    CancelOrdersRequest,
+    CancelOrdersResponse,
+    CreateOrderRequest,
+    ExportFormat,
+    ORDER_SUMMARY_FIELDS,
+    OrderItemDTO,
+    OrderListView,
+    OrderLookupRequest,
+    OrderLookupResponse,
+    OrderLookupResult,
+    OrderResponse,
+    OrderSummaryResponse,
+    ReorderPointResponse,
+    SalesAggregateResponse,
+    UnitsSoldResponse,
+)
 
-__all__ = ["CreateOrderRequest", "OrderResponse", "OrderItemDTO"]
\ No newline at end of file
+__all__ = [
+    "BatchCreateOrdersRequest",
+    "BatchCreateOrdersResponse",
+    "BatchOrderResult",
+    "CancelOrderResult",
+    "CancelOrdersRequest",
+    "CancelOrdersResponse",
+    "CreateOrderRequest",
+    "ExportFormat",
+    "ORDER_SUMMARY_FIELDS",
+    "OrderListView",
+    "OrderLookupRequest",
+    "OrderLookupResponse",
+    "OrderLookupResult",
+    "OrderResponse",
+    "OrderItemDTO",
+    "OrderSummaryResponse",
+    "ReorderPointResponse",
+    "SalesAggregateResponse",
+    "UnitsSoldResponse",
+]
\ No newline at end of file
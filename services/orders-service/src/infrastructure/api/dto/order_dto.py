@@ -1,4 +1,5 @@
-from datetime import datetime
+from datetime import date, datetime
+from enum import Enum
 from typing import Optional
 
 from pydantic import BaseModel, Field
@@ -86,4 +87,195 @@ class OrderResponse(BaseModel):
                 "created_at": "2023-12-01T10:00:00Z",
                 "delivery_id": "delivery-123"
             }
-        }
\ No newline at end of file
+        }
+
+
+# Orders accepted by a single bulk create request
+MAX_BATCH_ORDERS = 500
+
+
+class BatchCreateOrdersRequest(BaseModel):
+    """Request model for creating many orders at once"""
+    orders: list[CreateOrderRequest] = Field(
+        ..., description="Orders to create", min_length=1, max_length=MAX_BATCH_ORDERS
+    )
+
+
+class BatchOrderResult(BaseModel):
+    """Outcome of one order within a bulk create request"""
+    index: int = Field(..., description="Position of the order in the request")
+    order: OrderResponse = Field(..., description="The order in its final state")
+    error: Optional[str] = Field(
+        None, description="Reason the order was rejected (if rejected)"
+    )
+
+
+class BatchCreateOrdersResponse(BaseModel):
+    """Response model for a bulk create request"""
+    created: int = Field(..., description="Number of orders created")
+    rejected: int = Field(..., description="Number of orders rejected")
+    results: list[BatchOrderResult] = Field(
+        ..., description="Per-order outcomes, in request order"
+    )
+
+
+MAX_LOOKUP_ORDERS = 500
+
+
+class OrderLookupRequest(BaseModel):
+    """Request model for fetching many orders by id"""
+    ids: list[str] = Field(
+        ...,
+        description="Order ids to fetch",
+        min_length=1,
+        max_length=MAX_LOOKUP_ORDERS,
+    )
+
+
+class OrderLookupResult(BaseModel):
+    """One requested id and its order"""
+    id: str = Field(..., description="The requested order id")
+    order: Optional[OrderResponse] = Field(
+        None, description="The order, null when it does not exist"
+    )
+
+
+class OrderLookupResponse(BaseModel):
+    """Response model for a lookup of many orders"""
+    found: int = Field(..., description="Number of requested ids that exist")
+    missing: int = Field(..., description="Number of requested ids that do not exist")
+    results: list[OrderLookupResult] = Field(
+        ..., description="One result per requested id, in request order"
+    )
+
+
+# Orders per cancellation request; their stock is released with one call
+MAX_CANCEL_ORDERS = 100
+
+
+class CancelOrdersRequest(BaseModel):
+    """Request model for cancelling many orders at once"""
+    ids: list[str] = Field(
+        ...,
+        description="Order ids to cancel",
+        min_length=1,
+        max_length=MAX_CANCEL_ORDERS,
+    )
+
+
+class CancelOrderResult(BaseModel):
+    """Outcome of cancelling one order of a batch"""
+    id: str = Field(..., description="The requested order id")
+    order: Optional[OrderResponse] = Field(
+        None, description="The order, null when it does not exist"
+    )
+    error: Optional[str] = Field(
+        None, description="Why the order was not cancelled, null when it was"
+    )
+
+
+class CancelOrdersResponse(BaseModel):
+    """Response model for a batch cancellation"""
+    cancelled: int = Field(..., description="Number of orders now cancelled")
+    failed: int = Field(
+        ..., description="Number of orders not found or not cancellable"
+    )
+    results: list[CancelOrderResult] = Field(
+        ..., description="One result per distinct id, in request order"
+    )
+
+
+class ExportFormat(str, Enum):
+    """Output formats supported by the orders export"""
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class OrderListView(str, Enum):
+    """Shapes of the order list response"""
+    FULL = "full"
+    SUMMARY = "summary"
+
+
+# OrderResponse fields returned by view=summary, as in OrderSummaryResponse
+ORDER_SUMMARY_FIELDS = ["id", "order_number", "status", "total", "created_at"]
+
+
+class OrderSummaryResponse(BaseModel):
+    """Response model for order list views, without line items"""
+    id: str = Field(..., description="Unique identifier for the order", example="550e8400-e29b-41d4-a716-446655440000")
+    order_number: str = Field(..., description="Human-readable order number", example="ORD-A1B2C3D4")
+    status: str = Field(
+        ..., description="Current status of the order", example="created"
+    )
+    total: float = Field(..., description="Total amount for the order", example=75.48)
+    created_at: datetime = Field(..., description="Timestamp when the order was created")
+
+
+class UnitsSoldResponse(BaseModel):
+    """Response model for units sold per product"""
+    units: dict[str, int] = Field(
+        ..., description="Map of product IDs to units sold in created orders"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "units": {
+                    "prod-123": 1250,
+                    "prod-456": 0
+                }
+            }
+        }
+
+
+class SalesAggregateResponse(BaseModel):
+    """Response model for one row of the sales rollups"""
+    day: date = Field(..., description="Day the orders were created (UTC)")
+    key: Optional[str] = Field(
+        None, description="Product or client ID, when grouped by product or client"
+    )
+    status: str = Field(
+        ..., description="Final status of the orders", example="created"
+    )
+    orders: int = Field(..., description="Number of orders", example=42)
+    units: int = Field(..., description="Units across those orders", example=310)
+    revenue: float = Field(
+        ...,
+        description="Sum of the order totals (per product: of its lines)",
+        example=9876.5,
+    )
+
+
+class ReorderPointResponse(BaseModel):
+    """Response model for the demand forecast and reorder point of a product"""
+    product_id: str = Field(..., description="Unique identifier for the product", example="prod-123")
+    average_daily_demand: float = Field(
+        ...,
+        description="Moving average of daily units sold over the window",
+        example=12.5,
+    )
+    forecast_daily_demand: float = Field(
+        ..., description="Exponentially smoothed daily units sold", example=13.1
+    )
+    demand_std: float = Field(
+        ...,
+        description="Standard deviation of daily units sold over the window",
+        example=4.2,
+    )
+    safety_stock: float = Field(
+        ...,
+        description="Units kept to cover demand variability during the lead time",
+        example=18.3,
+    )
+    reorder_point: float = Field(
+        ..., description="Stock level at which to reorder", example=110.0
+    )
+    available: Optional[int] = Field(
+        None,
+        description="Current stock level (if the inventory service reported it)",
+        example=85,
+    )
+    below_reorder_point: bool = Field(
+        ..., description="Whether current stock is at or below the reorder point"
+    )
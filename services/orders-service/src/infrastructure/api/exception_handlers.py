@@ -1,6 +1,9 @@
 """Global exception handlers for the orders service"""
 
 import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 
@@ -9,8 +12,11 @@ from src.domain.exceptions import (
     InsufficientStockException,
     StockReservationException,
     OrderNotFoundException,
+    OrderCancellationException,
     OrderValidationException,
-    ExternalServiceException
+    ExternalServiceException,
+    IdempotencyKeyReusedException,
+    IdempotencyKeyInProgressException
 )
 
 logger = logging.getLogger(__name__)
@@ -76,6 +82,21 @@ async def order_not_found_handler(
     )
 
 
+async def order_cancellation_handler(
+    request: Request, exc: OrderCancellationException
+) -> JSONResponse:
+    """Handle orders that cannot be cancelled in their current status"""
+    logger.info(f"Order cancellation refused: {str(exc)}")
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={
+            "error": "Order Cannot Be Cancelled",
+            "detail": str(exc),
+            "type": "order_cancellation_refused"
+        }
+    )
+
+
 async def external_service_handler(
     request: Request, exc: ExternalServiceException
 ) -> JSONResponse:
@@ -106,6 +127,36 @@ async def validation_exception_handler(
     )
 
 
+async def idempotency_key_reused_handler(
+    request: Request, exc: IdempotencyKeyReusedException
+) -> JSONResponse:
+    """Handle Idempotency-Key reuse with a different request"""
+    logger.warning(f"Idempotency key reused: {str(exc)}")
+    return JSONResponse(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        content={
+            "error": "Idempotency Key Reused",
+            "detail": str(exc),
+            "type": "idempotency_key_reused"
+        }
+    )
+
+
+async def idempotency_key_in_progress_handler(
+    request: Request, exc: IdempotencyKeyInProgressException
+) -> JSONResponse:
+    """Handle duplicates of a request that is still being processed"""
+    logger.warning(f"Idempotency key in progress: {str(exc)}")
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={
+            "error": "Request In Progress",
+            "detail": str(exc),
+            "type": "idempotency_key_in_progress"
+        }
+    )
+
+
 async def general_exception_handler(
     request: Request, exc: Exception
 ) -> JSONResponse:
@@ -122,12 +173,15 @@ async def general_exception_handler(
 
 
 # Dictionary mapping exceptions to handlers
-EXCEPTION_HANDLERS = {
+EXCEPTION_HANDLERS: dict[type, Callable[[Request, Any], Awaitable[JSONResponse]]] = {
     BusinessRuleViolationException: business_rule_violation_handler,
     InsufficientStockException: insufficient_stock_handler,
     StockReservationException: stock_reservation_handler,
     OrderNotFoundException: order_not_found_handler,
+    OrderCancellationException: order_cancellation_handler,
     OrderValidationException: validation_exception_handler,
     ExternalServiceException: external_service_handler,
+    IdempotencyKeyReusedException: idempotency_key_reused_handler,
+    IdempotencyKeyInProgressException: idempotency_key_in_progress_handler,
     Exception: general_exception_handler,
 }
\ No newline at end of file
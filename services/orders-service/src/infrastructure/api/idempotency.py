@@ -0,0 +1,223 @@
+"""Idempotency-Key handling for order creation"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+from prometheus_client import Counter
+from pydantic import BaseModel
+
+from src.application.ports.idempotency_store import IdempotencyRecord, IdempotencyStore
+from src.domain.exceptions import (
+    IdempotencyKeyInProgressException,
+    IdempotencyKeyReusedException,
+    OrderValidationException,
+)
+from src.infrastructure.api.exception_handlers import EXCEPTION_HANDLERS
+from src.infrastructure.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+# Set on responses replayed from a previous request with the same key
+IDEMPOTENT_REPLAYED_HEADER = "Idempotent-Replayed"
+
+MAX_KEY_LENGTH = 255
+
+IDEMPOTENT_REQUESTS = Counter(
+    "orders_idempotency_requests_total",
+    "Requests carrying an Idempotency-Key, by result",
+    ["result"],
+)
+
+# Requests of this instance currently holding a key, so local duplicates
+# are woken as soon as the original finishes instead of polling
+_in_flight: dict[tuple[str, str], asyncio.Event] = {}
+
+
+def request_fingerprint(payload: BaseModel) -> str:
+    """Stable hash of a request body, to detect keys reused for other requests"""
+    canonical = json.dumps(
+        payload.model_dump(mode="json"), sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+async def run_idempotent(
+    request: Request,
+    store: IdempotencyStore,
+    client_id: str,
+    key: str,
+    request_hash: str,
+    order_id: str,
+    execute: Callable[[], Awaitable[JSONResponse]],
+) -> Response:
+    """
+    Run `execute` at most once per (client_id, key).
+
+    A retry gets the stored response of the first request. A duplicate that
+    arrives while the first is still running waits for it. Responses with a
+    5xx status are not stored, so the request can be retried.
+
+    The key is leased: it is renewed while `execute` runs, and a key left
+    unfinished and unrenewed for IDEMPOTENCY_LEASE_SECONDS, e.g. by an
+    instance that crashed, is taken over by the next request with it.
+    """
+    if not key or len(key) > MAX_KEY_LENGTH:
+        raise OrderValidationException(
+            f"{IDEMPOTENCY_KEY_HEADER} must be between 1 and "
+            f"{MAX_KEY_LENGTH} characters"
+        )
+
+    deadline = (
+        asyncio.get_running_loop().time() + settings.IDEMPOTENCY_WAIT_TIMEOUT_SECONDS
+    )
+    while True:
+        existing = await store.claim(client_id, key, request_hash, order_id)
+        if existing is None:
+            break
+        if existing.request_hash != request_hash:
+            IDEMPOTENT_REQUESTS.labels(result="reused_key").inc()
+            raise IdempotencyKeyReusedException(
+                f"{IDEMPOTENCY_KEY_HEADER} '{key}' was already used for a "
+                "different request"
+            )
+
+        completed = await _wait_for_completion(store, existing, deadline)
+        if completed is not None:
+            IDEMPOTENT_REQUESTS.labels(result="replayed").inc()
+            return _replay(completed)
+        # The original released or abandoned the key: run the request ourselves
+
+    scope = (client_id, key)
+    done = asyncio.Event()
+    _in_flight[scope] = done
+    heartbeat = asyncio.get_running_loop().create_task(
+        _keep_claimed(store, client_id, key, order_id)
+    )
+    try:
+        response: Response
+        try:
+            response = await execute()
+        except Exception as exc:
+            response = await _handle_exception(request, exc)
+        except BaseException:
+            # Cancelled, e.g. the client went away: nothing to store, free the key for a
+            # retry
+            heartbeat.cancel()
+            await asyncio.shield(_release(store, client_id, key, order_id))
+            raise
+
+        if response.status_code >= 500:
+            await store.release(client_id, key, order_id)
+        else:
+            await store.complete(
+                client_id, key, order_id, response.status_code, json.loads(
+                    bytes(response.body)
+                )
+            )
+        IDEMPOTENT_REQUESTS.labels(result="executed").inc()
+        return response
+    finally:
+        heartbeat.cancel()
+        if _in_flight.get(scope) is done:
+            del _in_flight[scope]
+        done.set()
+
+
+async def _keep_claimed(
+    store: IdempotencyStore, client_id: str, key: str, order_id: str
+) -> None:
+    """Renew the lease of a key for as long as its request runs"""
+    interval = settings.IDEMPOTENCY_LEASE_SECONDS / 3
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            if not await store.renew(client_id, key, order_id):
+                logger.warning(
+                    f"{IDEMPOTENCY_KEY_HEADER} '{key}' of client {client_id} "
+                    "was taken over"
+                )
+                return
+        except Exception as e:
+            # Retried at the next interval, well before the lease runs out
+            logger.warning(
+                f"Failed to renew {IDEMPOTENCY_KEY_HEADER} '{key}': {str(e)}"
+            )
+
+
+async def _release(
+    store: IdempotencyStore, client_id: str, key: str, order_id: str
+) -> None:
+    try:
+        await store.release(client_id, key, order_id)
+    except Exception as e:
+        # The lease runs out instead and the key is taken over then
+        logger.error(f"Failed to release {IDEMPOTENCY_KEY_HEADER} '{key}': {str(e)}")
+
+
+async def _wait_for_completion(
+    store: IdempotencyStore, record: IdempotencyRecord, deadline: float
+) -> IdempotencyRecord | None:
+    """
+    Wait for the request holding a key to finish; None if it released the
+    key, or abandoned it without renewing its lease
+    """
+    loop = asyncio.get_running_loop()
+    scope = (record.client_id, record.key)
+    lease = timedelta(seconds=settings.IDEMPOTENCY_LEASE_SECONDS)
+
+    current: IdempotencyRecord | None = record
+    while current is not None and not current.completed:
+        if current.claimed_at < datetime.utcnow() - lease:
+            return None
+
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            IDEMPOTENT_REQUESTS.labels(result="in_progress").inc()
+            raise IdempotencyKeyInProgressException(
+                f"A request with {IDEMPOTENCY_KEY_HEADER} '{record.key}' is still "
+                "being processed"
+            )
+
+        timeout = min(remaining, settings.IDEMPOTENCY_POLL_INTERVAL_SECONDS)
+        local = _in_flight.get(scope)
+        if local is not None:
+            try:
+                await asyncio.wait_for(local.wait(), timeout=timeout)
+            except TimeoutError:
+                pass
+        else:
+            await asyncio.sleep(timeout)
+
+        current = await store.get(record.client_id, record.key)
+
+    return current
+
+
+def _replay(record: IdempotencyRecord) -> JSONResponse:
+    status_code = record.response_status
+    if status_code is None:
+        raise ValueError(
+            f"{IDEMPOTENCY_KEY_HEADER} '{record.key}' has no stored response"
+        )
+    headers = {IDEMPOTENT_REPLAYED_HEADER: "true"}
+    if status_code < 300:
+        headers["Location"] = f"/api/v1/orders/{record.order_id}"
+    return JSONResponse(
+        status_code=status_code, content=record.response_body, headers=headers
+    )
+
+
+async def _handle_exception(request: Request, exc: Exception) -> Response:
+    """Render an exception the way the global handlers would, so it can be stored"""
+    for exception_class in type(exc).__mro__:
+        handler = EXCEPTION_HANDLERS.get(exception_class)
+        if handler is not None:
+            return await handler(request, exc)
+    raise exc
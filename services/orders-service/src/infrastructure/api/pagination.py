@@ -0,0 +1,26 @@
+"""Opaque cursor tokens for keyset pagination"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from src.domain.exceptions import OrderValidationException
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(created_at: datetime, order_id: str) -> str:
+    """Encode the (created_at, id) position of the last row of a page"""
+    raw = json.dumps([created_at.isoformat(), order_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a cursor produced by encode_cursor"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, order_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), str(order_id)
+    except (binascii.Error, ValueError, TypeError) as e:
+        raise OrderValidationException(f"Invalid pagination cursor: {cursor}") from e
@@ -16,9 +16,48 @@ class Settings(BaseSettings):
     DATABASE_NAME: str = "medisupply"
     DATABASE_USER: str = "postgres"
     DATABASE_PASSWORD: str = "password"
+    DATABASE_READ_URL: str = ""  # Optional read replica
+    READ_YOUR_WRITES_WINDOW_SECONDS: int = 5
+    REPLICA_MAX_LAG_SECONDS: float = 5.0
+    REPLICA_LAG_CHECK_INTERVAL_SECONDS: float = 5.0
+
+    # Orders table partitioning
+    ORDERS_PARTITION_MAINTENANCE_ENABLED: bool = True
+    ORDERS_PARTITION_MAINTENANCE_INTERVAL_SECONDS: float = 3600.0
+    ORDERS_PARTITION_MONTHS_AHEAD: int = 3
+    ORDERS_PARTITION_RETENTION_MONTHS: int = 0  # detach older partitions; 0 keeps all
+
+    # Order Archive
+    ORDER_ARCHIVE_ENABLED: bool = False  # look up orders missing from the database
+    # Local directory or s3://bucket/prefix
+    ORDER_ARCHIVE_URL: str = "/var/lib/orders-service/archive"
+    ORDER_ARCHIVE_CACHE_DIR: str = "/tmp/orders-archive"  # local copies of S3 segments
+    ORDER_ARCHIVE_RETENTION_DAYS: int = 365  # orders older than this are archived
+    ORDER_ARCHIVE_SEGMENT_ORDERS: int = 100000
+    ORDER_ARCHIVE_BLOCK_ORDERS: int = 128
+    ORDER_ARCHIVE_MAX_OPEN_SEGMENTS: int = 64
+    ORDER_ARCHIVE_MAX_CACHED_BLOCKS: int = 1024
+    ORDER_ARCHIVE_REFRESH_INTERVAL_SECONDS: float = 60.0  # picks up new segments
+    ORDER_ARCHIVE_MAX_PROBES: int = 16  # segments opened per lookup, for all its ids
+
+    # Order History Export (analytics)
+    # Local directory or s3://bucket/prefix
+    ORDER_HISTORY_EXPORT_URL: str = "/var/lib/orders-service/history"
+    ORDER_HISTORY_EXPORT_SETTLE_SECONDS: float = 3600.0  # younger orders wait a run
+    ORDER_HISTORY_EXPORT_BATCH_SIZE: int = 50000  # orders per Parquet row group
+
+    # Demand Forecasting (defaults of the reorder point endpoint and CLI)
+    FORECAST_HISTORY_DAYS: int = 365
+    FORECAST_WINDOW_DAYS: int = 28  # moving average and demand variability
+    FORECAST_SMOOTHING_ALPHA: float = 0.2
+    FORECAST_LEAD_TIME_DAYS: float = 7.0
+    FORECAST_SERVICE_LEVEL: float = 0.95
 
     # External Services
     INVENTORY_SERVICE_URL: str = "http://localhost:8002"
+    INVENTORY_CHECK_BATCHING_ENABLED: bool = True  # share checks between requests
+    INVENTORY_CHECK_BATCH_WINDOW_MS: int = 5  # how long a batch waits for more ids
+    INVENTORY_CHECK_MAX_BATCH_SIZE: int = 100  # product ids per batch, at most 100
 
     # AWS
     AWS_REGION: str = "us-east-1"
@@ -28,6 +67,56 @@ class Settings(BaseSettings):
     SQS_QUEUE_NAME: str = "orders-queue"
     AWS_ENDPOINT_URL: str = ""  # For LocalStack
 
+    # Event Publishing
+    SQS_PUBLISH_QUEUE_SIZE: int = 10000
+    SQS_PUBLISH_OVERFLOW_POLICY: str = "block"  # block, drop_newest, drop_oldest
+    SQS_PUBLISH_ENQUEUE_TIMEOUT_SECONDS: float = 1.0
+    SQS_PUBLISH_WORKERS: int = 4
+    SQS_PUBLISH_MAX_RETRIES: int = 3
+    SQS_PUBLISH_RETRY_BASE_SECONDS: float = 0.1  # first backoff, doubled on each retry
+    SQS_PUBLISH_RETRY_MAX_SECONDS: float = 5.0
+    SQS_PUBLISH_SHUTDOWN_TIMEOUT_SECONDS: float = 10.0
+    SQS_BATCH_SIZE: int = 10
+    SQS_BATCH_MAX_WAIT_MS: int = 50
+
+    # Order IDs
+    ORDER_ID_GENERATOR: str = "uuid7"  # uuid7 (time-ordered), uuid4 (random)
+
+    # Order Cache
+    ORDER_CACHE_ENABLED: bool = True
+    ORDER_CACHE_MAX_ENTRIES: int = 10000
+    ORDER_CACHE_TTL_SECONDS: float = 2.0  # pending / validated orders
+    ORDER_CACHE_TERMINAL_TTL_SECONDS: float = 300.0  # rejected / cancelled orders
+
+    # Asynchronous Order Processing
+    # Honour "Prefer: respond-async" on order creation
+    ASYNC_ORDER_ACCEPTANCE_ENABLED: bool = False
+    ORDER_WORKER_ENABLED: bool = True  # run the processing worker in this instance
+    ORDER_WORKER_CONCURRENCY: int = 8
+    ORDER_WORKER_POLL_INTERVAL_SECONDS: float = 0.5
+    ORDER_WORKER_LEASE_SECONDS: float = 60.0
+    ORDER_WORKER_MAX_ATTEMPTS: int = 20
+    ORDER_WORKER_RETRY_BASE_SECONDS: float = 1.0
+    ORDER_WORKER_RETRY_MAX_SECONDS: float = 60.0
+
+    # Stuck Order Recovery
+    ORDER_RECOVERY_ENABLED: bool = True  # run the recovery worker in this instance
+    ORDER_RECOVERY_INTERVAL_SECONDS: float = 60.0
+    ORDER_RECOVERY_TIMEOUT_SECONDS: float = 600.0  # in flight longer counts as stuck
+    ORDER_RECOVERY_MAX_AGE_SECONDS: float = 86400.0  # older stuck orders are rejected
+    ORDER_RECOVERY_BATCH_SIZE: int = 100
+
+    # Idempotency
+    IDEMPOTENCY_KEY_TTL_SECONDS: float = 86400.0
+    IDEMPOTENCY_WAIT_TIMEOUT_SECONDS: float = 30.0  # a duplicate waits this long
+    IDEMPOTENCY_POLL_INTERVAL_SECONDS: float = 0.2
+    # Unfinished keys not renewed for this long are abandoned
+    IDEMPOTENCY_LEASE_SECONDS: float = 30.0
+
+    # Response Compression
+    GZIP_MINIMUM_SIZE: int = 1024  # bytes; smaller responses are sent as is
+    GZIP_COMPRESS_LEVEL: int = 5
+
     # Health Check
     HEALTH_CHECK_PATH: str = "/api/orders/health"
 
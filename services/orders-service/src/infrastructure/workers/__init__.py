@@ -0,0 +1,3 @@
+from .order_processing_worker import OrderProcessingWorker
+
+__all__ = ["OrderProcessingWorker"]
\ No newline at end of file
@@ -0,0 +1,104 @@
+"""
+Writes demand forecasts and reorder points for every product as CSV:
+
+    python -m src.infrastructure.workers.demand_forecast [--output reorder.csv] [
+        --below-only
+    ]
+
+Model parameters default to the FORECAST_* settings.
+"""
+
+import argparse
+import asyncio
+import csv
+import logging
+import sys
+
+from src.application.use_cases.forecast_demand import ForecastDemandUseCase
+from src.infrastructure.adapters.postgres.order_repository_impl import (
+    PostgresOrderRepository,
+)
+from src.infrastructure.adapters.postgres.session import (
+    ReadSessionLocal, engine, read_engine
+)
+from src.infrastructure.api.dependencies import get_inventory_service
+from src.infrastructure.config.settings import settings
+
+CSV_COLUMNS = [
+    "product_id",
+    "average_daily_demand",
+    "forecast_daily_demand",
+    "demand_std",
+    "safety_stock",
+    "reorder_point",
+    "available",
+    "below_reorder_point",
+]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Forecast demand and reorder points")
+    parser.add_argument(
+        "--history-days", type=int, default=settings.FORECAST_HISTORY_DAYS
+    )
+    parser.add_argument(
+        "--window-days", type=int, default=settings.FORECAST_WINDOW_DAYS
+    )
+    parser.add_argument(
+        "--alpha", type=float, default=settings.FORECAST_SMOOTHING_ALPHA
+    )
+    parser.add_argument(
+        "--lead-time-days", type=float, default=settings.FORECAST_LEAD_TIME_DAYS
+    )
+    parser.add_argument(
+        "--service-level", type=float, default=settings.FORECAST_SERVICE_LEVEL
+    )
+    parser.add_argument(
+        "--below-only",
+        action="store_true",
+        help="Only products at or below their reorder point",
+    )
+    parser.add_argument("--output", help="CSV file to write (default: stdout)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+    try:
+        async with ReadSessionLocal() as session:
+            points = await ForecastDemandUseCase(
+                order_repository=PostgresOrderRepository(session),
+                inventory_service=get_inventory_service()
+            ).execute(
+                history_days=args.history_days,
+                window_days=args.window_days,
+                alpha=args.alpha,
+                lead_time_days=args.lead_time_days,
+                service_level=args.service_level
+            )
+    finally:
+        await read_engine.dispose()
+        await engine.dispose()
+
+    output = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        writer = csv.writer(output)
+        writer.writerow(CSV_COLUMNS)
+        for point in points:
+            if args.below_only and not point.below_reorder_point:
+                continue
+            writer.writerow([
+                point.product_id,
+                f"{point.average_daily_demand:.3f}",
+                f"{point.forecast_daily_demand:.3f}",
+                f"{point.demand_std:.3f}",
+                f"{point.safety_stock:.1f}",
+                f"{point.reorder_point:.1f}",
+                "" if point.available is None else point.available,
+                point.below_reorder_point,
+            ])
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
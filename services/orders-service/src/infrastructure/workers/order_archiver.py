@@ -0,0 +1,49 @@
+"""
+Archival job: moves finished orders older than the retention window out of
+the database and into archive segments. Meant to run on a schedule:
+
+    python -m src.infrastructure.workers.order_archiver [--older-than-days N]
+"""
+
+import argparse
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from functools import partial
+
+from src.application.use_cases.archive_orders import ArchiveOrdersUseCase
+from src.infrastructure.adapters.postgres.session import AsyncSessionLocal, engine
+from src.infrastructure.api.dependencies import (
+    order_repository_scope, get_order_archive
+)
+from src.infrastructure.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Archive old orders")
+    parser.add_argument(
+        "--older-than-days", type=int, default=settings.ORDER_ARCHIVE_RETENTION_DAYS
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    order_archive = get_order_archive()
+    if order_archive is None:
+        # Archived orders would no longer be found by the API
+        raise SystemExit("ORDER_ARCHIVE_ENABLED must be set before archiving orders")
+
+    use_case = ArchiveOrdersUseCase(
+        repository_scope=partial(order_repository_scope, AsyncSessionLocal),
+        order_archive=order_archive,
+        segment_size=settings.ORDER_ARCHIVE_SEGMENT_ORDERS,
+    )
+    try:
+        await use_case.execute(datetime.utcnow() - timedelta(days=args.older_than_days))
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,41 @@
+"""
+Exports settled orders and their lines to day-partitioned Parquet files
+for analytics. Each run picks up where the previous one stopped, so it is
+meant to run on a schedule (one run at a time):
+
+    python -m src.infrastructure.workers.order_history_exporter
+
+Needs the `analytics` extra (pyarrow).
+"""
+
+import asyncio
+import logging
+from functools import partial
+
+from src.application.use_cases.export_order_history import ExportOrderHistoryUseCase
+from src.infrastructure.adapters.analytics import ParquetOrderHistoryStore
+from src.infrastructure.adapters.postgres.session import (
+    ReadSessionLocal, engine, read_engine
+)
+from src.infrastructure.api.dependencies import order_repository_scope
+from src.infrastructure.config.settings import settings
+
+
+async def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    use_case = ExportOrderHistoryUseCase(
+        # Long sequential scans belong on the replica, when there is one
+        repository_scope=partial(order_repository_scope, ReadSessionLocal),
+        history_store=ParquetOrderHistoryStore(settings.ORDER_HISTORY_EXPORT_URL),
+        settle_seconds=settings.ORDER_HISTORY_EXPORT_SETTLE_SECONDS,
+        batch_size=settings.ORDER_HISTORY_EXPORT_BATCH_SIZE,
+    )
+    try:
+        await use_case.execute()
+    finally:
+        await read_engine.dispose()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
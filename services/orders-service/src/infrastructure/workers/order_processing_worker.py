@@ -0,0 +1,172 @@
+import asyncio
+import logging
+from collections.abc import Callable
+
+from prometheus_client import Counter, Gauge
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.ports.order_queue import QueuedOrder
+from src.application.use_cases.process_order import ProcessOrderUseCase
+from src.domain.models.order import OrderStatus
+from src.infrastructure.adapters.postgres.order_queue_impl import PostgresOrderQueue
+
+logger = logging.getLogger(__name__)
+
+JOBS_TOTAL = Counter(
+    "orders_processing_jobs_total",
+    "Queued orders handled by the processing worker, by outcome",
+    ["outcome"],
+)
+JOBS_IN_FLIGHT = Gauge(
+    "orders_processing_jobs_in_flight",
+    "Queued orders currently being processed by this instance",
+)
+QUEUE_DEPTH = Gauge(
+    "orders_processing_queue_depth",
+    "Orders waiting in or claimed from the processing queue",
+)
+
+
+class OrderProcessingWorker:
+    """
+    Drains the durable order queue with bounded concurrency.
+
+    Each claimed order is processed in its own session. Inventory failures
+    put the order back on the queue with exponential backoff, so orders pile
+    up while inventory is down instead of being rejected; an order is only
+    given up on after max_attempts.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        use_case_factory: Callable[[AsyncSession], ProcessOrderUseCase],
+        concurrency: int,
+        poll_interval_seconds: float,
+        lease_seconds: float,
+        max_attempts: int,
+        retry_base_seconds: float,
+        retry_max_seconds: float,
+    ):
+        self.session_factory = session_factory
+        self.use_case_factory = use_case_factory
+        self.concurrency = max(1, concurrency)
+        self.poll_interval_seconds = poll_interval_seconds
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self._task: asyncio.Task | None = None
+        self._jobs: set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        # Unfinished orders stay claimed and are picked up again once the lease expires
+        for job in self._jobs:
+            job.cancel()
+        await asyncio.gather(*self._jobs, return_exceptions=True)
+
+    async def _run(self) -> None:
+        while True:
+            free_slots = self.concurrency - len(self._jobs)
+            if free_slots == 0:
+                await asyncio.wait(self._jobs, return_when=asyncio.FIRST_COMPLETED)
+                continue
+
+            try:
+                claimed = await self._claim(free_slots)
+            except Exception as e:
+                logger.error(f"Failed to claim queued orders: {str(e)}")
+                claimed = []
+
+            for queued in claimed:
+                job = asyncio.get_running_loop().create_task(self._process(queued))
+                self._jobs.add(job)
+                job.add_done_callback(self._job_done)
+            JOBS_IN_FLIGHT.set(len(self._jobs))
+
+            # A full claim means more are probably due; otherwise wait for new work
+            if len(claimed) < free_slots:
+                await asyncio.sleep(self.poll_interval_seconds)
+
+    def _job_done(self, job: asyncio.Task) -> None:
+        self._jobs.discard(job)
+        JOBS_IN_FLIGHT.set(len(self._jobs))
+
+    async def _claim(self, limit: int) -> list[QueuedOrder]:
+        async with self.session_factory() as session:
+            queue = PostgresOrderQueue(session)
+            claimed = await queue.claim(limit, self.lease_seconds)
+            QUEUE_DEPTH.set(await queue.depth())
+            return claimed
+
+    async def _process(self, queued: QueuedOrder) -> None:
+        try:
+            await self._process_claimed(queued)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # The claim lease expires and the order is retried
+            logger.error(f"Failed to update queued order {queued.order_id}: {str(e)}")
+
+    async def _process_claimed(self, queued: QueuedOrder) -> None:
+        async with self.session_factory() as session:
+            queue = PostgresOrderQueue(session)
+            use_case = self.use_case_factory(session)
+
+            try:
+                order = await use_case.execute(queued.order_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                await session.rollback()
+                await self._retry_or_give_up(queue, use_case, queued, e)
+                return
+
+            await queue.complete(queued.order_id)
+            if order is None:
+                JOBS_TOTAL.labels(outcome="missing").inc()
+            elif order.status == OrderStatus.CREATED:
+                JOBS_TOTAL.labels(outcome="created").inc()
+            else:
+                JOBS_TOTAL.labels(outcome="rejected").inc()
+
+    async def _retry_or_give_up(
+        self,
+        queue: PostgresOrderQueue,
+        use_case: ProcessOrderUseCase,
+        queued: QueuedOrder,
+        error: Exception,
+    ) -> None:
+        if queued.attempts >= self.max_attempts:
+            logger.error(
+                f"Giving up on order {queued.order_id} after {queued.attempts} "
+                f"attempts: {str(error)}"
+            )
+            await use_case.give_up(queued.order_id)
+            await queue.complete(queued.order_id)
+            JOBS_TOTAL.labels(outcome="abandoned").inc()
+            return
+
+        delay = min(
+            self.retry_base_seconds * 2 ** (queued.attempts - 1), self.retry_max_seconds
+        )
+        logger.warning(
+            f"Processing order {queued.order_id} failed (attempt "
+            f"{queued.attempts}/{self.max_attempts}), "
+            f"retrying in {delay:.1f}s: {str(error)}"
+        )
+        await queue.retry(queued.order_id, delay, str(error))
+        JOBS_TOTAL.labels(outcome="retried").inc()
@@ -0,0 +1,116 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from prometheus_client import Counter, Gauge
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.use_cases.recover_orders import RecoverOrdersUseCase
+
+logger = logging.getLogger(__name__)
+
+RECOVERED_ORDERS = Counter(
+    "orders_recovery_orders_total",
+    "Stuck orders resolved by the recovery worker, by outcome (created, "
+    "rejected, expired)",
+    ["outcome"],
+)
+RECOVERY_FAILURES = Counter(
+    "orders_recovery_failures_total",
+    "Recovery batches that failed and were left for the next sweep",
+)
+STUCK_ORDERS = Gauge(
+    "orders_recovery_backlog",
+    "Orders still pending or validated past the recovery timeout after the last sweep",
+)
+
+
+class OrderRecoveryWorker:
+    """
+    Periodically resolves orders stuck in pending or validated, e.g. after
+    a replica died in the middle of creating them.
+
+    Each sweep claims batches of orders older than the timeout with
+    SKIP LOCKED, so several instances share the work without waiting on
+    each other, and resolves each batch in its own transaction. A failed
+    batch keeps its orders stuck until the next sweep.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        use_case_factory: Callable[[AsyncSession], RecoverOrdersUseCase],
+        interval_seconds: float,
+        timeout_seconds: float,
+        max_age_seconds: float,
+        batch_size: int,
+    ):
+        self.session_factory = session_factory
+        self.use_case_factory = use_case_factory
+        self.interval_seconds = interval_seconds
+        self.timeout_seconds = timeout_seconds
+        self.max_age_seconds = max_age_seconds
+        self.batch_size = max(1, batch_size)
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        # An interrupted batch rolls back and its orders stay stuck for the next sweep
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sweep()
+            except Exception as e:
+                logger.error(f"Stuck order recovery failed: {str(e)}")
+            await asyncio.sleep(self.interval_seconds)
+
+    async def sweep(self) -> int:
+        """
+        Resolve stuck orders until none is left to claim; returns how many were resolved
+        """
+        now = datetime.utcnow()
+        stuck_before = now - timedelta(seconds=self.timeout_seconds)
+        expire_before = now - timedelta(seconds=self.max_age_seconds)
+
+        resolved = 0
+        try:
+            while True:
+                async with self.session_factory() as session:
+                    try:
+                        recovered = await self.use_case_factory(session).execute(
+                            stuck_before, expire_before, self.batch_size
+                        )
+                    except Exception:
+                        await session.rollback()
+                        RECOVERY_FAILURES.inc()
+                        raise
+
+                for item in recovered:
+                    RECOVERED_ORDERS.labels(outcome=item.outcome).inc()
+                resolved += len(recovered)
+                # A short batch means the rest is locked by other instances, or there is
+                # none
+                if len(recovered) < self.batch_size:
+                    break
+        finally:
+            async with self.session_factory() as session:
+                STUCK_ORDERS.set(
+                    await self.use_case_factory(session).backlog(stuck_before)
+                )
+
+        if resolved:
+            logger.info(f"Resolved {resolved} stuck orders")
+        return resolved
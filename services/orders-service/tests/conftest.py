@@ -0,0 +1,52 @@
+import itertools
+import os
+
+# Settings are read on import; nothing here talks to AWS
+os.environ.setdefault("SQS_QUEUE_URL", "https://sqs.test/orders")
+
+import pytest
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from src.application.ports.event_publisher import EventPublisher
+from src.infrastructure.adapters.postgres import Base, order_numbers, sales_rollups
+
+
+class RecordingEventPublisher(EventPublisher):
+    """Keeps published events in memory"""
+
+    def __init__(self):
+        self.events: list[tuple[str, dict]] = []
+
+    async def publish(self, event_type: str, payload: dict) -> None:
+        self.events.append((event_type, payload))
+
+
+@pytest.fixture
+async def session_factory(monkeypatch):
+    """
+    Sessions on an in-memory SQLite database, standing in for PostgreSQL.
+    Order numbers come from a counter instead of a sequence, and upserts
+    use SQLite's ON CONFLICT.
+    """
+    numbers = itertools.count(1)
+
+    async def allocate_many(self, session, count):
+        return [order_numbers.format_order_number(next(numbers)) for _ in range(count)]
+
+    monkeypatch.setattr(
+        order_numbers.OrderNumberAllocator, "allocate_many", allocate_many
+    )
+    monkeypatch.setattr(sales_rollups, "pg_insert", sqlite_insert)
+
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+def event_publisher():
+    return RecordingEventPublisher()
@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from src.application.ports.inventory_service import InventoryService
+from src.infrastructure.adapters.http.batching_inventory_service import (
+    BatchingInventoryService,
+)
+
+
+class StubInventoryService(InventoryService):
+    """Answers stock checks after `delay`; records the ids of each check"""
+
+    def __init__(self, delay: float = 0.0, error: Exception | None = None):
+        self.delay = delay
+        self.error = error
+        self.checks: list[list[str]] = []
+
+    async def check_stock(self, product_ids):
+        self.checks.append(product_ids)
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return {product_id: 10 for product_id in product_ids if product_id != "gone"}
+
+    async def reserve_stock(self, items, orders=None):
+        return True
+
+    async def find_reservations(self, order_ids):
+        return {}
+
+    async def release_stock(self, order_ids):
+        return []
+
+
+def batching(inventory, max_batch_size: int = 100) -> BatchingInventoryService:
+    return BatchingInventoryService(
+        inventory, window_seconds=0.01, max_batch_size=max_batch_size
+    )
+
+
+async def test_concurrent_checks_share_one_request():
+    inventory = StubInventoryService()
+    service = batching(inventory)
+
+    stock = await asyncio.gather(
+        service.check_stock(["p-1", "p-2"]),
+        service.check_stock(["p-2", "gone"]),
+    )
+
+    assert stock == [{"p-1": 10, "p-2": 10}, {"p-2": 10}]
+    assert inventory.checks == [["p-1", "p-2", "gone"]]
+
+
+async def test_full_batch_is_sent_without_waiting():
+    inventory = StubInventoryService()
+    service = batching(inventory, max_batch_size=2)
+
+    await asyncio.gather(
+        service.check_stock(["p-1", "p-2"]),
+        service.check_stock(["p-3"]),
+    )
+
+    assert inventory.checks == [["p-1", "p-2"], ["p-3"]]
+
+
+async def test_failed_check_reaches_every_caller():
+    service = batching(StubInventoryService(error=ConnectionError("refused")))
+
+    results = await asyncio.gather(
+        service.check_stock(["p-1"]),
+        service.check_stock(["p-2"]),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ConnectionError) for result in results)
+
+
+async def test_cancelled_caller_leaves_the_batch_running():
+    service = batching(StubInventoryService(delay=0.02))
+    cancelled = asyncio.create_task(service.check_stock(["p-1"]))
+    kept = asyncio.create_task(service.check_stock(["p-2"]))
+    await asyncio.sleep(0.015)
+
+    cancelled.cancel()
+
+    assert await kept == {"p-2": 10}
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
@@ -0,0 +1,122 @@
+import time
+
+import pytest
+
+from src.application.use_cases.cancel_orders import CancelOrdersUseCase
+from src.domain.exceptions import ExternalServiceException, OrderCancellationException
+from src.domain.models.order import Order, OrderItem, OrderStatus
+from src.infrastructure.adapters.cache import OrderCache
+
+
+class InMemoryOrderRepository:
+    """The part of OrderRepository cancellation uses"""
+
+    def __init__(self, orders: list[Order]):
+        self.orders = {order.id: order for order in orders}
+        self.saved: list[Order] = []
+
+    async def lock_by_ids(self, order_ids):
+        return {
+            order_id: self.orders[order_id]
+            for order_id in order_ids
+            if order_id in self.orders
+        }
+
+    async def save_all(self, orders):
+        self.saved.extend(orders)
+        return orders
+
+
+class StubInventoryService:
+    def __init__(self, held: dict[str, dict[str, int]]):
+        self.held = held
+        self.down = False
+        self.released: list[str] = []
+
+    async def find_reservations(self, order_ids):
+        if self.down:
+            raise ConnectionError("Connection refused")
+        return {
+            order_id: self.held[order_id]
+            for order_id in order_ids
+            if order_id in self.held
+        }
+
+    async def release_stock(self, order_ids):
+        self.released.extend(order_ids)
+        return [order_id for order_id in order_ids if self.held.pop(order_id, None)]
+
+
+def created_order() -> Order:
+    order = Order(client_id="client-1", items=[OrderItem("p-1", 3, 5.0)])
+    order.status = OrderStatus.CREATED
+    return order
+
+
+def use_case(orders, inventory, event_publisher) -> CancelOrdersUseCase:
+    return CancelOrdersUseCase(
+        InMemoryOrderRepository(orders), inventory, event_publisher
+    )
+
+
+async def test_cancel_releases_stock_with_one_call(event_publisher):
+    orders = [created_order() for _ in range(3)]
+    inventory = StubInventoryService({order.id: {"p-1": 3} for order in orders})
+
+    outcomes = await use_case(orders, inventory, event_publisher).execute(
+        [order.id for order in orders]
+    )
+
+    assert [outcome.error for outcome in outcomes] == [None] * 3
+    assert all(order.status == OrderStatus.CANCELLED for order in orders)
+    assert inventory.released == [order.id for order in orders]
+    event_types = [event_type for event_type, _ in event_publisher.events]
+    assert event_types == ["OrderCancelled"] * 3
+
+
+async def test_order_without_recorded_reservation_is_not_cancelled(event_publisher):
+    legacy, recorded = created_order(), created_order()
+    inventory = StubInventoryService({recorded.id: {"p-1": 3}})
+
+    outcomes = await use_case([legacy, recorded], inventory, event_publisher).execute(
+        [legacy.id, recorded.id]
+    )
+
+    assert "no recorded stock reservation" in outcomes[0].error
+    assert legacy.status == OrderStatus.CREATED
+    assert outcomes[1].error is None
+    assert inventory.released == [recorded.id]
+
+
+async def test_cancel_refuses_legacy_order(event_publisher):
+    legacy = created_order()
+
+    with pytest.raises(OrderCancellationException):
+        await use_case([legacy], StubInventoryService({}), event_publisher).cancel(
+            legacy.id
+        )
+
+
+async def test_inventory_outage_cancels_nothing(event_publisher):
+    order = created_order()
+    inventory = StubInventoryService({order.id: {"p-1": 3}})
+    inventory.down = True
+
+    with pytest.raises(ExternalServiceException):
+        await use_case([order], inventory, event_publisher).execute([order.id])
+
+    assert order.status == OrderStatus.CREATED
+    assert inventory.released == []
+
+
+def test_created_orders_get_the_short_cache_ttl():
+    cache = OrderCache(max_entries=10, ttl_seconds=2, terminal_ttl_seconds=300)
+    created, cancelled = created_order(), created_order()
+    cancelled.status = OrderStatus.CANCELLED
+
+    cache.put(created)
+    cache.put(cancelled)
+
+    # Another instance may cancel a created order without invalidating this cache
+    assert cache._entries[created.id][0] < time.monotonic() + 2
+    assert cache._entries[cancelled.id][0] > time.monotonic() + 2
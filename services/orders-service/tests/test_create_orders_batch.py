@@ -0,0 +1,82 @@
+import httpx
+
+from src.application.use_cases.create_orders_batch import CreateOrdersBatchUseCase
+from src.domain.models.order import Order, OrderItem, OrderStatus
+from src.infrastructure.adapters.http import HTTPInventoryService
+from src.infrastructure.adapters.postgres import PostgresOrderRepository
+
+
+def new_orders(count: int) -> list[Order]:
+    return [
+        Order(client_id=f"client-{n}", items=[OrderItem("p-1", 3, 5.0)])
+        for n in range(count)
+    ]
+
+
+async def create(session_factory, event_publisher, handler, orders):
+    async with session_factory() as session:
+        use_case = CreateOrdersBatchUseCase(
+            order_repository=PostgresOrderRepository(session),
+            inventory_service=HTTPInventoryService(transport=httpx.MockTransport(handler)),
+            event_publisher=event_publisher,
+        )
+        return await use_case.execute(orders)
+
+
+async def test_check_outage_is_not_reported_as_missing_stock(
+    session_factory, event_publisher
+):
+    def unavailable(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(502)
+
+    outcomes = await create(
+        session_factory, event_publisher, unavailable, new_orders(3)
+    )
+
+    errors = [outcome.error for outcome in outcomes]
+    assert errors == ["Inventory service unavailable"] * 3
+    assert event_publisher.events == []
+
+
+async def test_reservation_outage_rejects_and_releases(
+    session_factory, event_publisher
+):
+    released = []
+
+    def reserve_times_out(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/check"):
+            return httpx.Response(200, json={"stock": {"p-1": 100}})
+        if request.url.path.endswith("/reserve"):
+            raise httpx.ReadTimeout("Timed out", request=request)
+        released.append(request)
+        return httpx.Response(200, json={"released": []})
+
+    orders = new_orders(2)
+    outcomes = await create(session_factory, event_publisher, reserve_times_out, orders)
+
+    assert all(outcome.order.status == OrderStatus.REJECTED for outcome in outcomes)
+    errors = [outcome.error for outcome in outcomes]
+    assert errors == ["Inventory service unavailable"] * 2
+    # The timed out reservation may have been applied
+    assert len(released) == 1
+
+
+async def test_refused_reservation_is_reported_per_order(
+    session_factory, event_publisher
+):
+    reservations = []
+
+    def one_left(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/check"):
+            return httpx.Response(200, json={"stock": {"p-1": 100}})
+        reservations.append(request)
+        # The group and the first order fail, the second order succeeds
+        if len(reservations) < 3:
+            return httpx.Response(409, json={"detail": "Insufficient stock"})
+        return httpx.Response(200, json={"reserved": True})
+
+    outcomes = await create(session_factory, event_publisher, one_left, new_orders(2))
+
+    assert outcomes[0].order.status == OrderStatus.REJECTED
+    assert "sold to another customer" in outcomes[0].error
+    assert outcomes[1].order.status == OrderStatus.CREATED
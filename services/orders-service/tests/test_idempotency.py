@@ -0,0 +1,147 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from sqlalchemy import update
+
+from src.domain.exceptions import ExternalServiceException
+from src.infrastructure.adapters.postgres import (
+    IdempotencyKeyModel, PostgresIdempotencyStore
+)
+from src.infrastructure.api.idempotency import run_idempotent
+from src.infrastructure.config.settings import settings
+
+
+@pytest.fixture
+def store(session_factory):
+    return PostgresIdempotencyStore(session_factory, ttl_seconds=3600, lease_seconds=30)
+
+
+def http_request() -> Request:
+    return Request(
+        {"type": "http", "method": "POST", "path": "/api/v1/orders/", "headers": []}
+    )
+
+
+async def run(store, order_id, execute):
+    return await run_idempotent(
+        http_request(),
+        store,
+        client_id="client-1",
+        key="key-1",
+        request_hash="hash-1",
+        order_id=order_id,
+        execute=execute,
+    )
+
+
+async def created(order_id: str) -> JSONResponse:
+    return JSONResponse(status_code=201, content={"id": order_id})
+
+
+async def age_claim(session_factory, seconds: float) -> None:
+    async with session_factory() as session:
+        await session.execute(
+            update(IdempotencyKeyModel).values(
+                claimed_at=datetime.utcnow() - timedelta(seconds=seconds)
+            )
+        )
+        await session.commit()
+
+
+async def test_retry_replays_stored_response(store):
+    first = await run(store, "order-1", lambda: created("order-1"))
+    replayed = await run(store, "order-2", lambda: created("order-2"))
+
+    assert first.status_code == replayed.status_code == 201
+    assert replayed.body == first.body
+    assert replayed.headers["Idempotent-Replayed"] == "true"
+
+
+async def test_abandoned_claim_is_taken_over(store, session_factory):
+    assert await store.claim("client-1", "key-1", "hash-1", "order-1") is None
+
+    # Still renewed: the key belongs to the first request
+    existing = await store.claim("client-1", "key-1", "hash-1", "order-2")
+    assert existing.order_id == "order-1"
+
+    await age_claim(session_factory, 31)
+    assert await store.claim("client-1", "key-1", "hash-1", "order-2") is None
+    assert not await store.renew("client-1", "key-1", "order-1")
+
+
+async def test_waiting_duplicate_takes_over_abandoned_claim(
+    store, session_factory, monkeypatch
+):
+    monkeypatch.setattr(settings, "IDEMPOTENCY_POLL_INTERVAL_SECONDS", 0.01)
+    assert await store.claim("client-1", "key-1", "hash-1", "order-1") is None
+    await age_claim(session_factory, 31)
+
+    response = await run(store, "order-2", lambda: created("order-2"))
+
+    assert response.status_code == 201
+    assert (await store.get("client-1", "key-1")).order_id == "order-2"
+
+
+async def test_lease_is_renewed_while_request_runs(store, session_factory, monkeypatch):
+    monkeypatch.setattr(settings, "IDEMPOTENCY_LEASE_SECONDS", 0.06)
+
+    async def slow() -> JSONResponse:
+        claimed_at = (await store.get("client-1", "key-1")).claimed_at
+        await asyncio.sleep(0.1)
+        assert (await store.get("client-1", "key-1")).claimed_at > claimed_at
+        return await created("order-1")
+
+    assert (await run(store, "order-1", slow)).status_code == 201
+
+
+async def test_cancelled_request_releases_key(store):
+    started = asyncio.Event()
+
+    async def hangs() -> JSONResponse:
+        started.set()
+        await asyncio.Event().wait()
+        raise AssertionError("unreachable")
+
+    task = asyncio.create_task(run(store, "order-1", hangs))
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert await store.get("client-1", "key-1") is None
+
+
+async def test_server_error_releases_key_after_failed_transaction(
+    store, session_factory
+):
+    async with session_factory() as request_session:
+
+        async def fails() -> JSONResponse:
+            # Leaves the request's session needing a rollback
+            request_session.add(IdempotencyKeyModel(client_id="client-1", key="key-1"))
+            with pytest.raises(Exception):
+                await request_session.flush()
+            raise ExternalServiceException("Inventory service unavailable")
+
+        response = await run(store, "order-1", fails)
+
+    assert response.status_code == 503
+    assert await store.get("client-1", "key-1") is None
+
+
+async def test_release_keeps_a_key_taken_over_by_another_request(
+    store, session_factory
+):
+    assert await store.claim("client-1", "key-1", "hash-1", "order-1") is None
+    await age_claim(session_factory, 31)
+    assert await store.claim("client-1", "key-1", "hash-1", "order-2") is None
+
+    await store.release("client-1", "key-1", "order-1")
+    await store.complete("client-1", "key-1", "order-1", 201, {"id": "order-1"})
+
+    record = await store.get("client-1", "key-1")
+    assert record.order_id == "order-2"
+    assert not record.completed
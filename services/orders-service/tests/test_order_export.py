@@ -0,0 +1,145 @@
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from src.application.use_cases.export_orders import ExportOrdersUseCase
+from src.domain.models.order import Order, OrderItem
+from src.infrastructure.api.controllers.order_controller import export_orders
+from src.infrastructure.api.dependencies import (
+    get_export_orders_use_case, get_order_use_case
+)
+from src.infrastructure.api.dto.order_dto import ExportFormat
+
+
+class StubOrderRepository:
+    """Streams `orders`, then raises `error` if set; records the filters asked for"""
+
+    def __init__(self, orders: list[Order], error: Exception | None = None):
+        self.orders = orders
+        self.error = error
+        self.filters: dict = {}
+
+    async def stream_orders(self, **filters):
+        self.filters = filters
+        for order in self.orders:
+            yield order
+        if self.error:
+            raise self.error
+
+
+class StubGetOrderUseCase:
+    def __init__(self):
+        self.filters: dict = {}
+
+    async def find_all(self, **filters):
+        self.filters = filters
+        return []
+
+
+@pytest.fixture
+def client():
+    yield TestClient(main.app, raise_server_exceptions=False)
+    main.app.dependency_overrides.clear()
+
+
+def exporting(repository: StubOrderRepository) -> ExportOrdersUseCase:
+    @asynccontextmanager
+    async def scope():
+        yield repository
+
+    return ExportOrdersUseCase(scope)
+
+
+def export_from(repository: StubOrderRepository):
+    main.app.dependency_overrides[get_export_orders_use_case] = lambda: exporting(
+        repository
+    )
+
+
+def orders(count: int) -> list[Order]:
+    return [
+        Order(
+            client_id="client-1",
+            items=[OrderItem("p-1", 3, 5.0)],
+            order_number=f"ORD-{n}",
+        )
+        for n in range(count)
+    ]
+
+
+def test_export_bounds_are_converted_to_naive_utc(client):
+    repository = StubOrderRepository([])
+    export_from(repository)
+
+    response = client.get(
+        "/api/v1/orders/export",
+        params={
+            "created_from": "2025-01-01T02:00:00+02:00",
+            "created_to": "2025-01-02T00:00:00",
+        },
+    )
+
+    assert response.status_code == 200
+    assert repository.filters["created_from"] == datetime(2025, 1, 1)
+    assert repository.filters["created_to"] == datetime(2025, 1, 2)
+
+
+def test_list_bounds_are_converted_to_naive_utc(client):
+    use_case = StubGetOrderUseCase()
+    main.app.dependency_overrides[get_order_use_case] = lambda: use_case
+
+    response = client.get(
+        "/api/v1/orders/", params={"created_to": "2025-01-01T18:30:00-05:30"}
+    )
+
+    assert response.status_code == 200
+    assert use_case.filters["created_to"] == datetime(2025, 1, 2)
+
+
+def test_export_failing_before_first_order_gets_error_status(client):
+    export_from(StubOrderRepository([], error=ConnectionError("database unreachable")))
+
+    response = client.get("/api/v1/orders/export")
+
+    assert response.status_code == 500
+
+
+@pytest.mark.parametrize("format, marker", [
+    (
+        ExportFormat.NDJSON,
+        '{"error": "Export failed before completion", "type": "export_incomplete"}',
+    ),
+    (ExportFormat.CSV, "#export_incomplete"),
+])
+async def test_export_failing_mid_stream_ends_with_marker(format, marker):
+    repository = StubOrderRepository(
+        orders(3), error=ConnectionError("connection lost")
+    )
+
+    response = await export_orders(
+        format=format,
+        created_from=None,
+        created_to=None,
+        status=None,
+        use_case=exporting(repository),
+    )
+    chunks = []
+    # Raised after the marker, so the server drops the connection
+    with pytest.raises(ConnectionError):
+        async for chunk in response.body_iterator:
+            chunks.append(chunk)
+
+    assert "".join(chunks).splitlines()[-1] == marker
+
+
+def test_complete_export_has_no_marker(client):
+    export_from(StubOrderRepository(orders(3)))
+
+    response = client.get("/api/v1/orders/export")
+
+    lines = response.text.splitlines()
+    assert len(lines) == 3
+    assert "export_incomplete" not in response.text
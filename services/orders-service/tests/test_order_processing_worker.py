@@ -0,0 +1,168 @@
+import json
+from datetime import datetime
+
+import httpx
+import pytest
+from sqlalchemy import select
+
+from src.application.use_cases.process_order import ProcessOrderUseCase
+from src.domain.models.order import Order, OrderItem, OrderStatus
+from src.infrastructure.adapters.http import HTTPInventoryService
+from src.infrastructure.adapters.postgres import (
+    OrderModel,
+    OrderQueueModel,
+    PostgresOrderQueue,
+    PostgresOrderRepository,
+)
+from src.infrastructure.workers.order_processing_worker import OrderProcessingWorker
+
+
+def inventory(handler):
+    """HTTPInventoryService answered by `handler` instead of the network"""
+    return HTTPInventoryService(transport=httpx.MockTransport(handler))
+
+
+def in_stock(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/check"):
+        return httpx.Response(200, json={"stock": {"p-1": 10}})
+    return httpx.Response(200, json={"reserved": True})
+
+
+def unreachable(request: httpx.Request) -> httpx.Response:
+    raise httpx.ConnectError("Connection refused", request=request)
+
+
+def unavailable(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(503, json={"detail": "Service unavailable"})
+
+
+def sold_out(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/check"):
+        return httpx.Response(200, json={"stock": {"p-1": 10}})
+    return httpx.Response(409, json={"detail": "Insufficient stock"})
+
+
+async def queue_order(session_factory) -> str:
+    order = Order(client_id="client-1", items=[OrderItem("p-1", 3, 5.0)])
+    async with session_factory() as session:
+        await PostgresOrderRepository(session).save(order)
+        await PostgresOrderQueue(session).enqueue(order.id)
+    return order.id
+
+
+async def run_worker_once(
+    session_factory, event_publisher, inventory_service, max_attempts: int = 5
+):
+    worker = OrderProcessingWorker(
+        session_factory=session_factory,
+        use_case_factory=lambda session: ProcessOrderUseCase(
+            order_repository=PostgresOrderRepository(session),
+            inventory_service=inventory_service,
+            event_publisher=event_publisher,
+        ),
+        concurrency=1,
+        poll_interval_seconds=0.01,
+        lease_seconds=60,
+        max_attempts=max_attempts,
+        retry_base_seconds=30,
+        retry_max_seconds=300,
+    )
+    claimed = await worker._claim(1)
+    assert len(claimed) == 1
+    await worker._process(claimed[0])
+
+
+async def load(session_factory, order_id: str):
+    async with session_factory() as session:
+        status = await session.scalar(
+            select(OrderModel.status).where(OrderModel.id == order_id)
+        )
+        queued = await session.get(OrderQueueModel, order_id)
+    return status, queued
+
+
+@pytest.mark.parametrize("handler", [unreachable, unavailable])
+async def test_inventory_outage_requeues_order(
+    session_factory, event_publisher, handler
+):
+    order_id = await queue_order(session_factory)
+
+    await run_worker_once(session_factory, event_publisher, inventory(handler))
+
+    status, queued = await load(session_factory, order_id)
+    assert status == OrderStatus.PENDING.value
+    assert queued is not None
+    assert queued.attempts == 1
+    assert queued.available_at > datetime.utcnow()
+    assert "unavailable" in queued.last_error
+    assert event_publisher.events == []
+
+
+async def test_outage_during_reservation_keeps_order_validated(
+    session_factory, event_publisher
+):
+    order_id = await queue_order(session_factory)
+
+    def reserve_times_out(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/check"):
+            return in_stock(request)
+        raise httpx.ReadTimeout("Timed out", request=request)
+
+    await run_worker_once(
+        session_factory, event_publisher, inventory(reserve_times_out)
+    )
+
+    status, queued = await load(session_factory, order_id)
+    assert status == OrderStatus.VALIDATED.value
+    assert queued is not None and queued.attempts == 1
+
+
+async def test_order_is_created_once_inventory_recovers(
+    session_factory, event_publisher
+):
+    order_id = await queue_order(session_factory)
+    await run_worker_once(session_factory, event_publisher, inventory(unreachable))
+
+    async with session_factory() as session:
+        await PostgresOrderQueue(session).retry(order_id, 0, "")
+    await run_worker_once(session_factory, event_publisher, inventory(in_stock))
+
+    status, queued = await load(session_factory, order_id)
+    assert status == OrderStatus.CREATED.value
+    assert queued is None
+    assert [event_type for event_type, _ in event_publisher.events] == ["OrderCreated"]
+
+
+async def test_refused_reservation_rejects_order(session_factory, event_publisher):
+    order_id = await queue_order(session_factory)
+
+    await run_worker_once(session_factory, event_publisher, inventory(sold_out))
+
+    status, queued = await load(session_factory, order_id)
+    assert status == OrderStatus.REJECTED.value
+    assert queued is None
+
+
+async def test_last_failed_attempt_releases_stock_and_rejects_order(
+    session_factory, event_publisher
+):
+    order_id = await queue_order(session_factory)
+    released = []
+
+    def reserve_times_out(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/release"):
+            released.extend(json.loads(request.content)["order_ids"])
+            return httpx.Response(200, json={"released": [order_id]})
+        if request.url.path.endswith("/check"):
+            return in_stock(request)
+        raise httpx.ReadTimeout("Timed out", request=request)
+
+    await run_worker_once(
+        session_factory, event_publisher, inventory(reserve_times_out), max_attempts=1
+    )
+
+    status, queued = await load(session_factory, order_id)
+    assert status == OrderStatus.REJECTED.value
+    assert queued is None
+    # The timed out reservation may have been applied
+    assert released == [order_id]
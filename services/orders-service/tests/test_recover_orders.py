@@ -0,0 +1,148 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from src.application.ports.inventory_service import InventoryService
+from src.application.use_cases.recover_orders import RecoverOrdersUseCase
+from src.domain.exceptions import ExternalServiceException
+from src.domain.models.order import Order, OrderItem, OrderStatus
+from src.infrastructure.adapters.postgres import OrderModel, PostgresOrderRepository
+from src.infrastructure.workers.order_recovery_worker import OrderRecoveryWorker
+
+
+class StubInventoryService(InventoryService):
+    """
+    Holds reservations per order; products listed in `sold_out` cannot be
+    reserved. Orders listed in `racing` are reserved by another caller just
+    before their reservation is refused.
+    """
+
+    def __init__(
+        self,
+        held: dict[str, dict[str, int]],
+        sold_out: set[str] | None = None,
+        racing: set[str] | None = None,
+    ):
+        self.held = dict(held)
+        self.sold_out = sold_out or set()
+        self.racing = racing or set()
+        self.down = False
+        self.released: list[str] = []
+
+    async def check_stock(self, product_ids):
+        return {product_id: 100 for product_id in product_ids}
+
+    async def reserve_stock(self, items, orders=None):
+        if self.down:
+            raise ExternalServiceException("Inventory service unavailable")
+        if self.racing & (orders or {}).keys():
+            self.held.update(orders or {})
+            return False
+        if self.sold_out & items.keys():
+            return False
+        self.held.update(orders or {})
+        return True
+
+    async def find_reservations(self, order_ids):
+        return {
+            order_id: self.held[order_id]
+            for order_id in order_ids
+            if order_id in self.held
+        }
+
+    async def release_stock(self, order_ids):
+        self.released.extend(order_ids)
+        return [order_id for order_id in order_ids if self.held.pop(order_id, None)]
+
+
+def stuck_order(status: OrderStatus, age: timedelta, product_id: str = "p-1") -> Order:
+    order = Order(
+        client_id="client-1",
+        items=[OrderItem(product_id, 3, 5.0)],
+        created_at=datetime.utcnow() - age,
+    )
+    order.status = status
+    return order
+
+
+async def save(session_factory, orders: list[Order]) -> None:
+    async with session_factory() as session:
+        await PostgresOrderRepository(session).save_all(orders)
+
+
+async def statuses(session_factory, orders: list[Order]) -> list[str]:
+    async with session_factory() as session:
+        found = dict((await session.execute(
+            select(OrderModel.id, OrderModel.status)
+            .where(OrderModel.id.in_([order.id for order in orders]))
+        )).all())
+    return [found[order.id] for order in orders]
+
+
+def worker(session_factory, event_publisher, inventory) -> OrderRecoveryWorker:
+    return OrderRecoveryWorker(
+        session_factory,
+        lambda session: RecoverOrdersUseCase(
+            PostgresOrderRepository(session), inventory, event_publisher
+        ),
+        interval_seconds=60,
+        timeout_seconds=600,
+        max_age_seconds=86400,
+        batch_size=10,
+    )
+
+
+async def test_stuck_orders_are_finished_or_rejected(session_factory, event_publisher):
+    held = stuck_order(OrderStatus.VALIDATED, timedelta(hours=1))
+    pending = stuck_order(OrderStatus.PENDING, timedelta(hours=1))
+    sold_out = stuck_order(OrderStatus.PENDING, timedelta(hours=1), "p-2")
+    expired = stuck_order(OrderStatus.VALIDATED, timedelta(days=2))
+    orders = [held, pending, sold_out, expired]
+    await save(session_factory, orders)
+    inventory = StubInventoryService(
+        {held.id: {"p-1": 3}, expired.id: {"p-1": 3}}, sold_out={"p-2"}
+    )
+
+    assert await worker(session_factory, event_publisher, inventory).sweep() == 4
+
+    assert await statuses(session_factory, orders) == [
+        "created", "created", "rejected", "rejected"
+    ]
+    # Every rejected order is released, not only the expired ones
+    assert sorted(inventory.released) == sorted([sold_out.id, expired.id])
+    assert expired.id not in inventory.held
+    assert len(event_publisher.events) == 2
+
+
+async def test_reservation_outage_rolls_back_the_batch(
+    session_factory, event_publisher
+):
+    orders = [stuck_order(OrderStatus.PENDING, timedelta(hours=1)) for _ in range(2)]
+    await save(session_factory, orders)
+    inventory = StubInventoryService({})
+    inventory.down = True
+
+    with pytest.raises(ExternalServiceException):
+        await worker(session_factory, event_publisher, inventory).sweep()
+
+    # Left for the next sweep instead of rejected
+    assert await statuses(session_factory, orders) == ["pending", "pending"]
+    assert inventory.released == []
+
+    inventory.down = False
+    assert await worker(session_factory, event_publisher, inventory).sweep() == 2
+    assert await statuses(session_factory, orders) == ["created", "created"]
+
+
+async def test_refused_order_holding_stock_is_created(session_factory, event_publisher):
+    order = stuck_order(OrderStatus.PENDING, timedelta(hours=1))
+    await save(session_factory, [order])
+    inventory = StubInventoryService({}, racing={order.id})
+
+    assert await worker(session_factory, event_publisher, inventory).sweep() == 1
+
+    # The stock its own replica reserved is kept, not released
+    assert await statuses(session_factory, [order]) == ["created"]
+    assert inventory.released == []
+    assert order.id in inventory.held
@@ -0,0 +1,41 @@
+from datetime import date, datetime
+
+import pytest
+
+from src.infrastructure.adapters.postgres.sales_rollups import rebuild, unarchived_range
+
+
+class RecordingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement, *args):
+        self.statements.append(statement)
+
+
+@pytest.mark.parametrize("date_from, date_to, archived_before, expected", [
+    (None, None, None, (None, None)),
+    # A partly archived day is left alone
+    (None, None, datetime(2025, 3, 1, 12), (date(2025, 3, 2), None)),
+    (None, None, datetime(2025, 3, 1), (date(2025, 3, 1), None)),
+    (
+        date(2025, 1, 1),
+        date(2025, 6, 1),
+        datetime(2025, 3, 1, 12),
+        (date(2025, 3, 2), date(2025, 6, 1)),
+    ),
+    (date(2025, 4, 1), None, datetime(2025, 3, 1, 12), (date(2025, 4, 1), None)),
+    (date(2025, 1, 1), date(2025, 3, 2), datetime(2025, 3, 1, 12), None),
+])
+def test_rebuild_range_skips_archived_days(
+    date_from, date_to, archived_before, expected
+):
+    assert unarchived_range(date_from, date_to, archived_before) == expected
+
+
+async def test_rebuild_of_archived_days_changes_nothing():
+    session = RecordingSession()
+
+    await rebuild(session, date(2025, 1, 1), date(2025, 2, 1), datetime(2025, 3, 1))
+
+    assert session.statements == []
@@ -0,0 +1,120 @@
+import random
+import uuid
+
+import pytest
+
+from src.domain.models.order import Order, OrderItem
+from src.infrastructure.adapters.archive import segment_archive
+from src.infrastructure.adapters.archive.segment_archive import (
+    IdFilter,
+    SegmentOrderArchive,
+    encode_segment,
+    filter_name,
+    segment_name,
+)
+from src.infrastructure.adapters.archive.storage import LocalSegmentStorage
+
+
+def random_ids(count: int, seed: int) -> list[str]:
+    # Seeded, so a false positive of the id filters cannot make a test flaky
+    rng = random.Random(seed)
+    return [
+        str(uuid.UUID(int=rng.getrandbits(128), version=4)) for _ in range(count)
+    ]
+
+
+def random_orders(count: int, seed: int) -> list[Order]:
+    # uuid4 ids carry no timestamp, so only the id filters can prune segments
+    return [
+        Order(client_id="client-1", items=[OrderItem("p-1", 1, 5.0)], id=order_id)
+        for order_id in random_ids(count, seed)
+    ]
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return LocalSegmentStorage(str(tmp_path))
+
+
+def archive(storage, max_probes: int = 16) -> SegmentOrderArchive:
+    return SegmentOrderArchive(
+        storage,
+        block_size=4,
+        max_open_segments=64,
+        max_cached_blocks=64,
+        refresh_interval_seconds=60,
+        max_probes=max_probes,
+    )
+
+
+def opened(monkeypatch) -> list:
+    paths = []
+    segment = segment_archive._Segment
+
+    def recording(path):
+        paths.append(path.name)
+        return segment(path)
+
+    monkeypatch.setattr(segment_archive, "_Segment", recording)
+    return paths
+
+
+def test_id_filter_round_trip():
+    ids = random_ids(200, seed=1)
+    id_filter = IdFilter.decode(IdFilter.build(ids).encode())
+
+    assert all(order_id in id_filter for order_id in ids)
+    false_positives = sum(order_id in id_filter for order_id in random_ids(1000, 2))
+    assert false_positives < 50
+
+
+async def test_random_ids_open_only_the_segment_holding_them(storage, monkeypatch):
+    writer = archive(storage)
+    segments = [random_orders(10, seed) for seed in range(8)]
+    names = [await writer.write_segment(orders) for orders in segments]
+    wanted = segments[3][5]
+    paths = opened(monkeypatch)
+
+    found = await archive(storage).find_by_id(wanted.id)
+
+    assert found.id == wanted.id
+    assert paths == [names[3]]
+    assert await archive(storage).find_by_id(random_ids(1, seed=100)[0]) is None
+
+
+async def test_segment_without_filter_is_still_searched(storage):
+    orders = random_orders(10, seed=1)
+    name = segment_name(orders)
+    storage.put(name, encode_segment(orders, block_size=4))
+    assert storage.get(filter_name(name)) is None
+    reader = archive(storage)
+
+    assert (await reader.find_by_id(orders[7].id)).id == orders[7].id
+    # A filter is built once the segment has been opened
+    assert reader._filters[name] is not None
+    assert random_ids(1, seed=100)[0] not in reader._filters[name]
+
+
+async def test_lookup_opens_at_most_max_probes_segments(storage, monkeypatch):
+    writer = archive(storage)
+    segments = [random_orders(10, seed) for seed in range(6)]
+    for orders in segments:
+        await writer.write_segment(orders)
+    paths = opened(monkeypatch)
+
+    found = await archive(storage, max_probes=2).find_by_ids(
+        [orders[0].id for orders in segments]
+    )
+
+    assert len(paths) == 2
+    assert len(found) == 2
+
+
+async def test_archived_before_bounds_every_archived_order(storage):
+    reader = archive(storage)
+    assert await reader.archived_before() is None
+
+    orders = random_orders(3, seed=1)
+    await reader.write_segment(orders)
+
+    assert await reader.archived_before() > max(order.created_at for order in orders)
@@ -0,0 +1,126 @@
+import asyncio
+import json
+
+import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError
+
+from src.infrastructure.adapters.messaging.sqs_event_publisher import SQSEventPublisher
+from src.infrastructure.config.settings import settings
+
+
+class StubSQSClient:
+    """Answers send_message_batch calls from a script, then accepts everything"""
+
+    def __init__(self, *script):
+        self.script = list(script)
+        self.calls: list[list[dict]] = []
+
+    def send_message_batch(self, QueueUrl, Entries):  # noqa: N803
+        self.calls.append(Entries)
+        if self.script:
+            answer = self.script.pop(0)
+            if isinstance(answer, Exception):
+                raise answer
+            return answer(Entries)
+        return {"Successful": [{"Id": entry["Id"]} for entry in Entries], "Failed": []}
+
+    def sent(self) -> list[str]:
+        """Event types of the entries accepted by the last call"""
+        return [
+            json.loads(entry["MessageBody"])["event_type"] for entry in self.calls[-1]
+        ]
+
+
+def client_error(code: str, fault: str) -> ClientError:
+    return ClientError(
+        {"Error": {"Code": code, "Message": code, "Type": fault}}, "SendMessageBatch"
+    )
+
+
+def fail_first_entry(entries):
+    return {
+        "Successful": [{"Id": entry["Id"]} for entry in entries[1:]],
+        "Failed": [
+            {"Id": entries[0]["Id"], "Code": "InternalError", "SenderFault": False}
+        ],
+    }
+
+
+@pytest.fixture
+def publisher(monkeypatch):
+    monkeypatch.setattr(settings, "SQS_QUEUE_URL", "https://sqs.test/orders")
+    monkeypatch.setattr(settings, "SQS_BATCH_MAX_WAIT_MS", 1)
+    monkeypatch.setattr(settings, "SQS_PUBLISH_RETRY_BASE_SECONDS", 0.001)
+    return SQSEventPublisher()
+
+
+async def publish(publisher, client, *event_types):
+    publisher.sqs_client = client
+    for event_type in event_types:
+        await publisher.publish(event_type, {"order_id": "order-1"})
+    await publisher.close()
+
+
+@pytest.mark.parametrize("error", [
+    client_error("RequestThrottled", "Sender"),
+    client_error("InternalError", "Receiver"),
+    EndpointConnectionError(endpoint_url="https://sqs.test"),
+])
+async def test_transient_errors_are_retried(publisher, error):
+    client = StubSQSClient(error, error)
+
+    await publish(publisher, client, "OrderCreated")
+
+    assert len(client.calls) == 3
+    assert client.sent() == ["OrderCreated"]
+
+
+async def test_sender_fault_is_not_retried(publisher):
+    client = StubSQSClient(client_error("InvalidParameterValue", "Sender"))
+
+    await publish(publisher, client, "OrderCreated")
+
+    assert len(client.calls) == 1
+
+
+async def test_only_failed_entries_are_retried(publisher):
+    client = StubSQSClient(fail_first_entry)
+
+    await publish(publisher, client, "OrderCreated", "OrderCancelled")
+
+    assert len(client.calls) == 2
+    assert client.sent() == ["OrderCreated"]
+
+
+async def test_retries_back_off(publisher, monkeypatch):
+    delays = []
+    monkeypatch.setattr(
+        "src.infrastructure.adapters.messaging.sqs_event_publisher.random.uniform",
+        lambda low, high: delays.append(high) or 0,
+    )
+    error = client_error("ServiceUnavailable", "Receiver")
+    client = StubSQSClient(error, error)
+
+    await publish(publisher, client, "OrderCreated")
+
+    assert delays == [0.001, 0.002]
+
+
+async def test_dead_flusher_is_restarted(publisher, monkeypatch):
+    client = StubSQSClient()
+    publisher.sqs_client = client
+    dispatch = publisher._dispatch
+    failures = [RuntimeError("flusher bug")]
+
+    async def failing_dispatch(batch):
+        if failures:
+            raise failures.pop()
+        await dispatch(batch)
+
+    monkeypatch.setattr(publisher, "_dispatch", failing_dispatch)
+
+    await publisher.publish("OrderCreated", {"order_id": "order-1"})
+    await asyncio.sleep(0.05)
+    await publish(publisher, client, "OrderCancelled")
+
+    assert client.sent() == ["OrderCancelled"]